@@ -0,0 +1,197 @@
+# accounts/geo.py
+"""
+PostGIS'siz geo-qidiruv: geohash grid-cell indeksi + vektorlashgan haversine.
+
+Har bir nuqta `geohash` (precision 9, ~5 m) ustunida saqlanadi. Radius so'rovi
+bounding box'ni qoplaydigan kataklar ro'yxatiga aylanadi, har bir katak —
+indeksdagi bitta prefix diapazoni (geohash >= cell AND geohash < keyingi katak).
+Nomzodlar masofasi numpy bilan bir yo'la hisoblanadi. SQLite va PostgreSQL'da bir xil ishlaydi.
+"""
+import math
+
+import numpy as np
+from django.db.models import Q
+
+BASE32 = "0123456789bcdefghjkmnpqrstuvwxyz"
+BASE32_INDEX = {c: i for i, c in enumerate(BASE32)}
+INDEX_PRECISION = 9
+EARTH_RADIUS_KM = 6371.0088
+MAX_DISTANCE_KM = math.pi * EARTH_RADIUS_KM  # yer sharining yarmi
+MAX_COVER_CELLS = 32
+
+
+def encode_int(lat, lon, precision=INDEX_PRECISION):
+    """(lat, lon) -> 5*precision bitli butun son (geohash bitlari)."""
+    bits = 5 * precision
+    lon_bits, lat_bits = (bits + 1) // 2, bits // 2
+    lon_i = min(int((lon + 180.0) / 360.0 * (1 << lon_bits)), (1 << lon_bits) - 1)
+    lat_i = min(int((lat + 90.0) / 180.0 * (1 << lat_bits)), (1 << lat_bits) - 1)
+    value = 0
+    for i in range(bits):
+        # juft bit — longitude, toq bit — latitude (eng katta bitdan boshlab)
+        if i % 2 == 0:
+            bit = (lon_i >> (lon_bits - 1 - i // 2)) & 1
+        else:
+            bit = (lat_i >> (lat_bits - 1 - i // 2)) & 1
+        value = (value << 1) | bit
+    return value
+
+
+def int_to_hash(value, precision=INDEX_PRECISION):
+    chars = []
+    for _ in range(precision):
+        chars.append(BASE32[value & 31])
+        value >>= 5
+    return "".join(reversed(chars))
+
+
+def hash_to_int(geohash):
+    value = 0
+    for c in geohash:
+        value = (value << 5) | BASE32_INDEX[c]
+    return value
+
+
+def encode(lat, lon, precision=INDEX_PRECISION):
+    return int_to_hash(encode_int(float(lat), float(lon), precision), precision)
+
+
+def encode_array(lats, lons, precision=INDEX_PRECISION):
+    """Vektorlashgan encode_int: numpy massivlar -> uint64 geohash bitlari."""
+    bits = 5 * precision
+    lon_bits, lat_bits = (bits + 1) // 2, bits // 2
+    lon_i = np.minimum(((np.asarray(lons) + 180.0) / 360.0 * (1 << lon_bits)).astype(np.uint64),
+                       np.uint64((1 << lon_bits) - 1))
+    lat_i = np.minimum(((np.asarray(lats) + 90.0) / 180.0 * (1 << lat_bits)).astype(np.uint64),
+                       np.uint64((1 << lat_bits) - 1))
+    value = np.zeros(lon_i.shape, dtype=np.uint64)
+    for i in range(bits):
+        if i % 2 == 0:
+            bit = (lon_i >> np.uint64(lon_bits - 1 - i // 2)) & np.uint64(1)
+        else:
+            bit = (lat_i >> np.uint64(lat_bits - 1 - i // 2)) & np.uint64(1)
+        value = (value << np.uint64(1)) | bit
+    return value
+
+
+def cell_size(precision):
+    """(lat_deg, lon_deg) — berilgan precision'dagi katak o'lchami."""
+    bits = 5 * precision
+    return 180.0 / (1 << (bits // 2)), 360.0 / (1 << ((bits + 1) // 2))
+
+
+def bounding_box(lat, lon, radius_km):
+    """[(min_lat, max_lat, min_lon, max_lon), ...] — 180° meridiandan o'tsa ikkiga bo'linadi."""
+    dlat = math.degrees(radius_km / EARTH_RADIUS_KM)
+    min_lat, max_lat = max(lat - dlat, -90.0), min(lat + dlat, 90.0)
+    cos_lat = math.cos(math.radians(max(abs(min_lat), abs(max_lat))))
+    if max_lat >= 90.0 or min_lat <= -90.0 or cos_lat < 1e-6:
+        return [(min_lat, max_lat, -180.0, 180.0)]
+    dlon = math.degrees(radius_km / (EARTH_RADIUS_KM * cos_lat))
+    if dlon >= 180.0:
+        return [(min_lat, max_lat, -180.0, 180.0)]
+    min_lon, max_lon = lon - dlon, lon + dlon
+    if min_lon < -180.0:
+        return [(min_lat, max_lat, min_lon + 360.0, 180.0), (min_lat, max_lat, -180.0, max_lon)]
+    if max_lon > 180.0:
+        return [(min_lat, max_lat, min_lon, 180.0), (min_lat, max_lat, -180.0, max_lon - 360.0)]
+    return [(min_lat, max_lat, min_lon, max_lon)]
+
+
+def _cells_for_box(box, precision):
+    min_lat, max_lat, min_lon, max_lon = box
+    h, w = cell_size(precision)
+    lat_from, lat_to = int((min_lat + 90.0) // h), int(min((max_lat + 90.0) // h, 180.0 / h - 1))
+    lon_from, lon_to = int((min_lon + 180.0) // w), int(min((max_lon + 180.0) // w, 360.0 / w - 1))
+    return [
+        (-90.0 + (i + 0.5) * h, -180.0 + (j + 0.5) * w)
+        for i in range(lat_from, lat_to + 1)
+        for j in range(lon_from, lon_to + 1)
+    ]
+
+
+def _box_cell_count(box, precision):
+    min_lat, max_lat, min_lon, max_lon = box
+    h, w = cell_size(precision)
+    rows = int(min((max_lat + 90.0) // h, 180.0 / h - 1)) - int((min_lat + 90.0) // h) + 1
+    cols = int(min((max_lon + 180.0) // w, 360.0 / w - 1)) - int((min_lon + 180.0) // w) + 1
+    return rows * cols
+
+
+def cover_cells(lat, lon, radius_km, max_cells=MAX_COVER_CELLS):
+    """Radius doirasini to'liq qoplaydigan eng mayda geohash kataklari (prefixlar)."""
+    boxes = bounding_box(lat, lon, radius_km)
+    precision = 1
+    for p in range(INDEX_PRECISION, 0, -1):
+        if sum(_box_cell_count(box, p) for box in boxes) <= max_cells:
+            precision = p
+            break
+    cells = set()
+    for box in boxes:
+        for c_lat, c_lon in _cells_for_box(box, precision):
+            cells.add(encode(c_lat, c_lon, precision))
+    return sorted(cells)
+
+
+def next_cell(cell):
+    """Shu uzunlikdagi keyingi katak (base32 bo'yicha); oxirgisi ('zz...') uchun None."""
+    value = hash_to_int(cell) + 1
+    if value >> (5 * len(cell)):
+        return None
+    return int_to_hash(value, len(cell))
+
+
+def cells_q(cells, field="geohash"):
+    """
+    Har bir katak — indeksdagi prefix diapazoni [cell, next_cell(cell)).
+    Chegara base32 belgilaridan iborat — PostgreSQL collation'larida ham (masalan '~'
+    raqam va harflardan oldin keladi) tartib saqlanadi.
+    """
+    q = Q()
+    for cell in cells:
+        upper = next_cell(cell)
+        bounds = {f"{field}__gte": cell}
+        if upper is not None:
+            bounds[f"{field}__lt"] = upper
+        q |= Q(**bounds)
+    return q
+
+
+def haversine_km(lat, lon, lats, lons):
+    lat1, lon1 = math.radians(lat), math.radians(lon)
+    lat2, lon2 = np.radians(lats), np.radians(lons)
+    a = (np.sin((lat2 - lat1) / 2) ** 2
+         + math.cos(lat1) * np.cos(lat2) * np.sin((lon2 - lon1) / 2) ** 2)
+    return 2 * EARTH_RADIUS_KM * np.arcsin(np.sqrt(np.clip(a, 0.0, 1.0)))
+
+
+def within_radius(queryset, lat, lon, radius_km):
+    """[(pk, distance_km), ...] masofa bo'yicha o'sish tartibida."""
+    cells = cover_cells(lat, lon, radius_km)
+    rows = list(queryset.filter(cells_q(cells)).values_list("pk", "latitude", "longitude"))
+    if not rows:
+        return []
+    pks = np.array([r[0] for r in rows], dtype=object)
+    coords = np.array([(float(r[1]), float(r[2])) for r in rows], dtype=np.float64)
+    distances = haversine_km(lat, lon, coords[:, 0], coords[:, 1])
+    mask = distances <= radius_km
+    order = np.argsort(distances[mask], kind="stable")
+    return list(zip(pks[mask][order].tolist(), distances[mask][order].round(3).tolist()))
+
+
+def k_nearest(queryset, lat, lon, k, start_radius_km=5.0, max_radius_km=MAX_DISTANCE_KM):
+    """Radiusni ikki barobardan oshirib, k ta eng yaqin nuqtani topadi."""
+    radius = start_radius_km
+    while True:
+        found = within_radius(queryset, lat, lon, radius)
+        if len(found) >= k or radius >= max_radius_km:
+            return found[:k]
+        radius = min(radius * 2, max_radius_km)
+
+
+def fill_geohash(instance):
+    """pre_save uchun: latitude/longitude bo'lsa geohash'ni yangilaydi."""
+    if instance.latitude is None or instance.longitude is None:
+        instance.geohash = None
+    else:
+        instance.geohash = encode(instance.latitude, instance.longitude)
@@ -0,0 +1,120 @@
+import statistics
+import time
+
+import numpy as np
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from accounts import geo
+
+# O'zbekiston atrofidagi quti — nuqtalar zich bo'lsin
+BOX = (37.0, 46.0, 56.0, 74.0)
+
+
+class _Rollback(Exception):
+    pass
+
+
+class Command(BaseCommand):
+    help = (
+        "Geohash grid-cell indeksini brute-force haversine bilan solishtiradi. "
+        "Default: 1M nuqta xotirada (saralangan geohash massivi = DB indeksining modeli); "
+        "--db N: N ta JobPost'ni bazaga yozib, haqiqiy so'rov yo'lini o'lchaydi (rollback)."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--points", type=int, default=1_000_000)
+        parser.add_argument("--queries", type=int, default=200)
+        parser.add_argument("--radius-km", type=float, default=25.0)
+        parser.add_argument("--k", type=int, default=10)
+        parser.add_argument("--db", type=int, default=0, help="bazaga yoziladigan nuqtalar soni")
+        parser.add_argument("--seed", type=int, default=7)
+
+    def handle(self, *args, **options):
+        rng = np.random.default_rng(options["seed"])
+        centers = self._random_points(rng, options["queries"])
+        if options["db"]:
+            self._bench_db(rng, centers, options)
+        else:
+            self._bench_memory(rng, centers, options)
+
+    def _random_points(self, rng, n):
+        min_lat, max_lat, min_lon, max_lon = BOX
+        return rng.uniform(min_lat, max_lat, n), rng.uniform(min_lon, max_lon, n)
+
+    def _bench_memory(self, rng, centers, options):
+        lats, lons = self._random_points(rng, options["points"])
+        started = time.perf_counter()
+        keys = geo.encode_array(lats, lons)
+        order = np.argsort(keys, kind="stable")
+        keys, lats, lons = keys[order], lats[order], lons[order]
+        self.stdout.write(f"{options['points']} nuqta, indeks qurildi: {time.perf_counter() - started:.2f}s")
+
+        radius = options["radius_km"]
+        indexed, brute, checked = [], [], []
+        for lat, lon in zip(*centers):
+            t0 = time.perf_counter()
+            candidates = []
+            for cell in geo.cover_cells(lat, lon, radius):
+                shift = np.uint64(5 * (geo.INDEX_PRECISION - len(cell)))
+                lo = np.uint64(geo.hash_to_int(cell)) << shift
+                hi = np.uint64(geo.hash_to_int(cell) + 1) << shift
+                candidates.append(np.arange(np.searchsorted(keys, lo), np.searchsorted(keys, hi)))
+            idx = np.concatenate(candidates) if candidates else np.array([], dtype=np.int64)
+            dist = geo.haversine_km(lat, lon, lats[idx], lons[idx])
+            hits = idx[dist <= radius]
+            indexed.append((time.perf_counter() - t0) * 1000)
+            checked.append(len(idx))
+
+            t0 = time.perf_counter()
+            all_hits = np.nonzero(geo.haversine_km(lat, lon, lats, lons) <= radius)[0]
+            brute.append((time.perf_counter() - t0) * 1000)
+            assert set(hits.tolist()) == set(all_hits.tolist()), "indeks natijasi brute-force bilan mos emas"
+
+        self.stdout.write(f"radius {radius} km, {len(indexed)} so'rov (natijalar brute-force bilan tekshirildi)")
+        self.stdout.write(f"  grid-cell:   median {statistics.median(indexed):8.2f} ms, "
+                          f"o'rtacha {int(statistics.mean(checked))} nomzod tekshirildi")
+        self.stdout.write(f"  brute-force: median {statistics.median(brute):8.2f} ms")
+
+    def _bench_db(self, rng, centers, options):
+        from accounts.models import CustomUser
+        from vacancies.models import JobPost
+
+        n = options["db"]
+        lats, lons = self._random_points(rng, n)
+        try:
+            with transaction.atomic():
+                employer = CustomUser.objects.create_user(username="__bench_geo__", password=None)
+                started = time.perf_counter()
+                keys = geo.encode_array(lats, lons)
+                for start in range(0, n, 5000):
+                    JobPost.objects.bulk_create([
+                        JobPost(employer=employer, title="geo", budget_min=1, budget_max=2,
+                                latitude=round(float(lats[i]), 6), longitude=round(float(lons[i]), 6),
+                                geohash=geo.int_to_hash(int(keys[i])))
+                        for i in range(start, min(start + 5000, n))
+                    ])
+                self.stdout.write(f"{n} ta JobPost yozildi: {time.perf_counter() - started:.1f}s")
+
+                qs = JobPost.objects.filter(geohash__isnull=False)
+                radius_t, knn_t, brute_t = [], [], []
+                for lat, lon in list(zip(*centers))[:50]:
+                    t0 = time.perf_counter()
+                    geo.within_radius(qs, lat, lon, options["radius_km"])
+                    radius_t.append((time.perf_counter() - t0) * 1000)
+
+                    t0 = time.perf_counter()
+                    geo.k_nearest(qs, lat, lon, options["k"])
+                    knn_t.append((time.perf_counter() - t0) * 1000)
+
+                    t0 = time.perf_counter()
+                    rows = np.array(list(qs.values_list("latitude", "longitude")), dtype=np.float64)
+                    geo.haversine_km(lat, lon, rows[:, 0], rows[:, 1])
+                    brute_t.append((time.perf_counter() - t0) * 1000)
+
+                self.stdout.write(f"  within {options['radius_km']} km: median {statistics.median(radius_t):8.2f} ms")
+                self.stdout.write(f"  k={options['k']} nearest:   median {statistics.median(knn_t):8.2f} ms")
+                self.stdout.write(f"  full scan:        median {statistics.median(brute_t):8.2f} ms")
+                raise _Rollback
+        except _Rollback:
+            pass
@@ -0,0 +1,28 @@
+# Generated by Django 5.2.4 on 2026-10-18 07:42
+
+from django.db import migrations, models
+
+
+def forwards(apps, schema_editor):
+    from accounts.geo import encode
+
+    CustomUser = apps.get_model('accounts', 'CustomUser')
+    users = CustomUser.objects.filter(latitude__isnull=False, longitude__isnull=False)
+    for user in users.only('id', 'latitude', 'longitude').iterator():
+        CustomUser.objects.filter(pk=user.pk).update(geohash=encode(user.latitude, user.longitude))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0015_skillanswer'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='customuser',
+            name='geohash',
+            field=models.CharField(blank=True, db_index=True, editable=False, max_length=12, null=True),
+        ),
+        migrations.RunPython(forwards, migrations.RunPython.noop),
+    ]
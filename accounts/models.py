@@ -39,6 +39,8 @@ class CustomUser(AbstractBaseUser, PermissionsMixin):
     # ✅ YANGI QO‘SHILDI:
     latitude = models.DecimalField(max_digits=9, decimal_places=6, null=True, blank=True)
     longitude = models.DecimalField(max_digits=9, decimal_places=6, null=True, blank=True)
+    # accounts.geo grid-cell indeksi (pre_save signalda to'ldiriladi)
+    geohash = models.CharField(max_length=12, blank=True, null=True, db_index=True, editable=False)
 
     work_hours_per_week = models.CharField(
         max_length=50,
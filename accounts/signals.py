@@ -0,0 +1,44 @@
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
+
+from .geo import fill_geohash
+from .models import (
+    Certificate, CustomUser, Education, LanguageSkill, PortfolioMedia, PortfolioProject, Skill, WorkExperience,
+)
+from .snapshots import IGNORED_UPDATE_FIELDS, invalidate_snapshots
+
+
+@receiver(pre_save, sender=CustomUser)
+def set_user_geohash(sender, instance, **kwargs):
+    fill_geohash(instance)
+
+
+# ---------- profil snapshot'i ----------
+
+@receiver([post_save, post_delete], sender=CustomUser)
+def invalidate_user_snapshot(sender, instance, update_fields=None, raw=False, **kwargs):
+    if raw or (update_fields and set(update_fields) <= IGNORED_UPDATE_FIELDS):
+        return
+    invalidate_snapshots([instance.pk])
+
+
+@receiver([post_save, post_delete], sender=Skill)
+@receiver([post_save, post_delete], sender=LanguageSkill)
+@receiver([post_save, post_delete], sender=Education)
+@receiver([post_save, post_delete], sender=PortfolioProject)
+@receiver([post_save, post_delete], sender=Certificate)
+@receiver([post_save, post_delete], sender=WorkExperience)
+def invalidate_profile_snapshot(sender, instance, raw=False, **kwargs):
+    if not raw:
+        invalidate_snapshots([instance.user_id])
+
+
+@receiver([post_save, post_delete], sender=PortfolioMedia)
+def invalidate_portfolio_media_snapshot(sender, instance, raw=False, **kwargs):
+    if raw:
+        return
+    user_id = (PortfolioProject.objects
+               .filter(pk=instance.project_id)
+               .values_list("user_id", flat=True)
+               .first())
+    invalidate_snapshots([user_id])
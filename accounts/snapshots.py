@@ -0,0 +1,88 @@
+# accounts/snapshots.py
+"""
+Nomzod profilining tayyor JSON hujjati.
+
+Employer arizadagi nomzodni ochganda (/api/applications/<id>/applicant/) va
+/api/auth/<uuid>/ da profil har safar noldan serializatsiya qilinmaydi: foydalanuvchi
+bo'yicha keshda ikkala ko'rinish (ApplicantFullSerializer va UserProfileSerializer natijasi)
+nisbiy URL'lar bilan saqlanadi, so'rovda faqat URL'larga host qo'shiladi.
+
+Profilga tegishli yozuv (signals.py) kalitni commit'dan keyin o'chiradi — keyingi
+o'qish hujjatni qayta quradi.
+"""
+import json
+
+from django.core.cache import cache
+from django.db import transaction
+from rest_framework.renderers import JSONRenderer
+
+from .models import CustomUser
+from .serializers import UserProfileSerializer, abs_url
+
+CACHE_KEY = "profile-snapshot:v1:{}"
+CACHE_TIMEOUT = 24 * 3600
+APPLICANT = "applicant"
+PROFILE = "profile"
+PREFETCH = (
+    "languages",
+    "educations",
+    "portfolio_projects__media_files",
+    "certificates",
+    "experiences",
+)
+# user.last_login kabi profilda ko'rinmaydigan maydonlar
+IGNORED_UPDATE_FIELDS = {"last_login", "password"}
+
+
+def _as_json(data):
+    # Decimal / UUID / sana — JSON ko'rinishida saqlanadi (javob bilan bir xil)
+    return json.loads(JSONRenderer().render(data))
+
+
+def build_snapshot(user_id):
+    from applications.serializers import ApplicantFullSerializer  # applications accounts'ga bog'liq
+
+    user = CustomUser.objects.prefetch_related(*PREFETCH).filter(pk=user_id).first()
+    if user is None:
+        return None
+    return {
+        APPLICANT: _as_json(ApplicantFullSerializer(user).data),
+        PROFILE: _as_json(UserProfileSerializer(user).data),
+    }
+
+
+def _with_absolute_urls(doc, request):
+    if request is None:
+        return doc
+    doc = dict(doc)
+    if doc.get("avatar"):
+        doc["avatar"] = abs_url(request, doc["avatar"])
+    if "certificates" in doc:
+        doc["certificates"] = [{**item, "file_url": abs_url(request, item["file_url"])}
+                               for item in doc["certificates"]]
+    if "portfolio_projects" in doc:
+        doc["portfolio_projects"] = [
+            {**project, "media": [{**media, "file_url": abs_url(request, media["file_url"])}
+                                  for media in project["media"]]}
+            for project in doc["portfolio_projects"]
+        ]
+    return doc
+
+
+def profile_snapshot(user_id, view, request=None):
+    """view: APPLICANT yoki PROFILE; foydalanuvchi yo'q bo'lsa None."""
+    key = CACHE_KEY.format(user_id)
+    snapshot = cache.get(key)
+    if snapshot is None:
+        snapshot = build_snapshot(user_id)
+        if snapshot is None:
+            return None
+        cache.set(key, snapshot, CACHE_TIMEOUT)
+    return _with_absolute_urls(snapshot[view], request)
+
+
+def invalidate_snapshots(user_ids):
+    keys = [CACHE_KEY.format(pk) for pk in user_ids if pk is not None]
+    if keys:
+        # commit'dan keyin — aks holda eski holat qayta keshga tushishi mumkin
+        transaction.on_commit(lambda: cache.delete_many(keys))
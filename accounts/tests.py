@@ -1,3 +1,90 @@
 from django.test import TestCase
+from rest_framework.test import APITestCase
 
-# Create your tests here.
+from applications import matching
+from vacancies.models import RecommendationSet
+from . import geo
+from .models import CustomUser, Skill
+
+TASHKENT = (41.3111, 69.2797)
+
+
+class GeoCellRangeTests(TestCase):
+    def test_next_cell_carries_in_base32(self):
+        self.assertEqual(geo.next_cell("9z"), "b0")
+        self.assertEqual(geo.next_cell("tz7"), "tz8")
+        self.assertEqual(geo.next_cell("bzz"), "c00")
+        self.assertIsNone(geo.next_cell("zz"))
+
+    def test_range_bounds_use_only_base32(self):
+        # '~' kabi belgilar PostgreSQL collation'ida raqam/harflardan oldin turadi
+        cells = geo.cover_cells(*TASHKENT, 10)
+        for child in geo.cells_q(cells).children:
+            for _, value in child.children:
+                self.assertTrue(set(value) <= set(geo.BASE32), value)
+
+    def test_every_hash_with_prefix_is_inside_its_range(self):
+        for lat, lon in [TASHKENT, (-33.86, 151.21), (64.1, -21.9), (0.0, 179.99)]:
+            full = geo.encode(lat, lon)
+            for precision in range(1, geo.INDEX_PRECISION + 1):
+                cell = full[:precision]
+                upper = geo.next_cell(cell)
+                self.assertGreaterEqual(full, cell)
+                if upper is not None:
+                    self.assertLess(full, upper)
+
+
+class GeoRadiusSearchTests(TestCase):
+    def setUp(self):
+        points = {
+            "center": TASHKENT,
+            "near": (41.3200, 69.2900),      # ~1.3 km
+            "edge": (41.3700, 69.3500),      # ~8.8 km
+            "far": (41.5500, 69.6000),       # ~38 km
+            "samarkand": (39.6542, 66.9597),
+        }
+        self.ids = {}
+        for name, (lat, lon) in points.items():
+            user = CustomUser.objects.create_user(username=name, email=f"{name}@example.com", password=None,
+                                                  latitude=lat, longitude=lon)
+            self.ids[user.pk] = name
+
+    def _names(self, rows):
+        return [self.ids[pk] for pk, _ in rows]
+
+    def test_within_radius_returns_points_sorted_by_distance(self):
+        rows = geo.within_radius(CustomUser.objects.all(), *TASHKENT, 10)
+        self.assertEqual(self._names(rows), ["center", "near", "edge"])
+        distances = [d for _, d in rows]
+        self.assertEqual(distances, sorted(distances))
+        self.assertLess(distances[-1], 10)
+
+    def test_small_radius_uses_fine_cells(self):
+        cells = geo.cover_cells(*TASHKENT, 2)
+        self.assertGreater(len(cells[0]), 3)
+        self.assertEqual(self._names(geo.within_radius(CustomUser.objects.all(), *TASHKENT, 2)),
+                         ["center", "near"])
+
+    def test_k_nearest_widens_radius(self):
+        rows = geo.k_nearest(CustomUser.objects.all(), *TASHKENT, 4, start_radius_km=1)
+        self.assertEqual(self._names(rows), ["center", "near", "edge", "far"])
+
+
+class SkillBulkCreateTests(APITestCase):
+    url = "/skills/skills/"
+
+    def setUp(self):
+        self.user = CustomUser.objects.create_user(
+            username="seeker", email="seeker@example.com", password="x", role="JOB_SEEKER"
+        )
+        RecommendationSet.objects.create(user=self.user, items=[])
+        self.client.force_authenticate(self.user)
+
+    def test_new_skills_mark_recommendations_stale(self):
+        version = matching._cache["version"]
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.post(self.url, {"skills": ["Python", "Django"]}, format="json")
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(Skill.objects.filter(user=self.user).count(), 2)
+        self.assertTrue(RecommendationSet.objects.get(user=self.user).is_stale)
+        self.assertGreater(matching._cache["version"], version)
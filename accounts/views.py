@@ -3,9 +3,11 @@ import random
 from django.contrib.auth import get_user_model
 from django.contrib.auth.tokens import PasswordResetTokenGenerator
 from django.core.mail import send_mail
+from django.db import transaction
 from django.db.models import Q
 from django.utils.http import urlsafe_base64_encode, urlsafe_base64_decode
 from jwt.utils import force_bytes
+from rest_framework.exceptions import NotFound
 from rest_framework.permissions import IsAuthenticated, IsAuthenticatedOrReadOnly
 from rest_framework.views import APIView
 from rest_framework.response import Response
@@ -26,6 +28,7 @@ from .serializers import (
 )
 from .models import CustomUser, EmailVerificationCode, LanguageSkill, Education, PortfolioProject, PortfolioMedia, \
     Skill, Certificate, WorkExperience, SkillAnswer
+from .snapshots import PROFILE, invalidate_snapshots, profile_snapshot
 
 User = get_user_model()
 token_generator = PasswordResetTokenGenerator()
@@ -362,6 +365,19 @@ class SkillViewSet(viewsets.ViewSet):
             ]
 
             Skill.objects.bulk_create(new_skills)
+            # bulk_create signal yubormaydi — Skill post_save ishlari shu yerda
+            invalidate_snapshots([request.user.pk])
+            if new_skills:
+                from applications.matching import invalidate_candidate_matrix
+                from vacancies.recommendations import mark_stale
+
+                user_id = request.user.pk
+
+                def refresh_matching():
+                    mark_stale(user_id)
+                    invalidate_candidate_matrix()
+
+                transaction.on_commit(refresh_matching)
 
             return Response({"detail": "Yangi skill(lar) qo‘shildi!"}, status=201)
         return Response(serializer.errors, status=400)
@@ -443,4 +459,11 @@ class UserProfileDetailView(generics.RetrieveAPIView):
     queryset = CustomUser.objects.all()
     serializer_class = UserProfileSerializer
     lookup_field = "id"  # /api/users/<id>/
-    permission_classes = [IsAuthenticatedOrReadOnly]
\ No newline at end of file
+    permission_classes = [IsAuthenticatedOrReadOnly]
+
+    def retrieve(self, request, *args, **kwargs):
+        # tayyor hujjat (snapshots.py) — serializer har safar ishlamaydi
+        data = profile_snapshot(kwargs[self.lookup_field], PROFILE, request)
+        if data is None:
+            raise NotFound
+        return Response(data)
@@ -1,8 +1,15 @@
 from django.contrib import admin
-from .models import JobApplication
+from .models import ApplicationStatusChange, JobApplication
 
 @admin.register(JobApplication)
 class JobApplicationAdmin(admin.ModelAdmin):
     list_display = ("id", "job_post", "applicant", "status", "created_at")
     list_filter = ("status", "created_at")
     search_fields = ("applicant__first_name", "applicant__last_name", "job_post__title")
+
+
+@admin.register(ApplicationStatusChange)
+class ApplicationStatusChangeAdmin(admin.ModelAdmin):
+    list_display = ("id", "application", "from_status", "to_status", "changed_by", "created_at")
+    list_filter = ("to_status", "created_at")
+    raw_id_fields = ("application", "changed_by")
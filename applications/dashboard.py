@@ -0,0 +1,111 @@
+# applications/dashboard.py
+"""
+Employer hiring funnel dashboard (/api/applications/my/dashboard/).
+
+Hammasi bitta GROUP BY so'rovidan: employer'ning vakansiyalari arizalar bilan LEFT JOIN
+qilinib (vakansiya, holat) bo'yicha guruhlanadi — COUNT, MIN(created_at) va oxirgi
+DAILY_DAYS kunning har biri uchun shartli COUNT (kun chegaralari oldindan hisoblanadi,
+qatorlarda sana funksiyasi chaqirilmaydi). Natija qatorlari soni vakansiyalar x holatlar.
+Shu natijadan Python'da: vakansiya x holat sonlari, birinchi arizagacha vaqt va kunlik sonlar.
+
+Natija employer bo'yicha keshlanadi; ariza yaratilishi / o'chirilishi / holati o'zgarishi
+va vakansiya o'zgarishi (signals.py, status.transition) kalitni commit'dan keyin o'chiradi.
+"""
+import datetime
+
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import Count, Min, Q
+from django.utils import timezone
+
+from vacancies.models import JobPost
+
+from .models import ApplicationStatus
+
+CACHE_KEY = "employer-dashboard:v1:{}"
+CACHE_TIMEOUT = 600
+DAILY_DAYS = 30
+
+
+def _hours(delta):
+    return round(delta.total_seconds() / 3600, 1)
+
+
+def _day_bounds(today):
+    """Oxirgi DAILY_DAYS kunning [boshi, oxiri) oraliqlari (joriy vaqt zonasi bo'yicha)."""
+    days = [today - datetime.timedelta(days=i) for i in range(DAILY_DAYS - 1, -1, -1)]
+    starts = [timezone.make_aware(datetime.datetime.combine(day, datetime.time.min)) for day in days]
+    return [(day, start, start + datetime.timedelta(days=1)) for day, start in zip(days, starts)]
+
+
+def compute_dashboard(employer_id, today=None):
+    bounds = _day_bounds(today or timezone.localdate())
+    daily_counts = {
+        f"day_{i}": Count("applications__id", filter=Q(applications__created_at__gte=start,
+                                                        applications__created_at__lt=end))
+        for i, (_, start, end) in enumerate(bounds)
+    }
+    rows = (JobPost.objects
+            .filter(employer_id=employer_id)
+            .order_by()
+            .values("id", "title", "created_at", "applications__status")
+            .annotate(n=Count("applications__id"), first=Min("applications__created_at"), **daily_counts))
+
+    statuses = ApplicationStatus.values
+    jobs = {}
+    daily = [0] * len(bounds)
+    for row in rows:
+        job = jobs.get(row["id"])
+        if job is None:
+            job = jobs[row["id"]] = {
+                "id": row["id"],
+                "title": row["title"],
+                "created_at": row["created_at"],
+                "counts": dict.fromkeys(statuses, 0),
+                "first_application_at": None,
+            }
+        if not row["n"]:  # arizasiz vakansiya (LEFT JOIN)
+            continue
+        job["counts"][row["applications__status"]] = row["n"]
+        if job["first_application_at"] is None or row["first"] < job["first_application_at"]:
+            job["first_application_at"] = row["first"]
+        for i in range(len(bounds)):
+            daily[i] += row[f"day_{i}"]
+
+    totals = dict.fromkeys(statuses, 0)
+    waits = []
+    for job in jobs.values():
+        job["counts"]["total"] = sum(job["counts"].values())
+        for status in statuses:
+            totals[status] += job["counts"][status]
+        first = job["first_application_at"]
+        job["time_to_first_application_hours"] = _hours(first - job["created_at"]) if first else None
+        if first:
+            waits.append(first - job["created_at"])
+    totals["total"] = sum(totals.values())
+
+    return {
+        "jobs": sorted(jobs.values(), key=lambda job: job["created_at"], reverse=True),
+        "totals": totals,
+        "avg_time_to_first_application_hours": (
+            _hours(sum(waits, datetime.timedelta()) / len(waits)) if waits else None
+        ),
+        "daily": [{"date": day, "count": count} for (day, _, _), count in zip(bounds, daily)],
+        "generated_at": timezone.now(),
+    }
+
+
+def cached_dashboard(employer_id):
+    key = CACHE_KEY.format(employer_id)
+    data = cache.get(key)
+    if data is None:
+        data = compute_dashboard(employer_id)
+        cache.set(key, data, CACHE_TIMEOUT)
+    return data
+
+
+def invalidate_dashboards(employer_ids):
+    keys = [CACHE_KEY.format(pk) for pk in employer_ids if pk is not None]
+    if keys:
+        # commit'dan keyin — aks holda eski holat qayta keshga tushishi mumkin
+        transaction.on_commit(lambda: cache.delete_many(keys))
@@ -0,0 +1,99 @@
+# applications/export.py
+"""
+Employer arizalarini CSV / XLSX ga oqim (stream) bilan eksport qilish.
+
+Qatorlar bitta so'rovdan: JobApplication + vakansiya va nomzod ustunlari (JOIN), nomzod
+skill'lari esa bazada yig'iladi (correlated subquery: PostgreSQL STRING_AGG, SQLite/MySQL
+GROUP_CONCAT) — har qator uchun alohida so'rov yo'q. .iterator() PostgreSQL'da server-side
+cursor — xotira qatorlar soniga bog'liq emas.
+"""
+import csv
+import io
+
+from django.db.models import Aggregate, CharField, OuterRef, Subquery
+
+from accounts.models import Skill
+from headhunter_backend.csv_safe import safe_row
+from headhunter_backend.xlsx_stream import CONTENT_TYPE as XLSX_CONTENT_TYPE, xlsx_chunks
+
+from .models import JobApplication
+
+EXPORT_CHUNK_SIZE = 2000
+STREAM_BUFFER_SIZE = 64 * 1024
+FORMATS = ("csv", "xlsx")
+CONTENT_TYPES = {"csv": "text/csv", "xlsx": XLSX_CONTENT_TYPE}
+
+# (ustun sarlavhasi, values_list maydoni)
+COLUMNS = [
+    ("application_id", "pk"),
+    ("job_id", "job_post_id"),
+    ("job_title", "job_post__title"),
+    ("applicant_id", "applicant_id"),
+    ("first_name", "applicant__first_name"),
+    ("last_name", "applicant__last_name"),
+    ("email", "applicant__email"),
+    ("position", "applicant__title"),
+    ("salary_usd", "applicant__salary_usd"),
+    ("skills", "skill_names"),
+    ("status", "status"),
+    ("applied_at", "created_at"),
+    ("cover_letter", "cover_letter"),
+]
+HEADER = [name for name, _ in COLUMNS]
+# CSV'da formula bo'lib bajarilmasin (headhunter_backend.csv_safe) — barcha matn ustunlari
+TEXT_COLUMNS = {"job_title", "first_name", "last_name", "email", "position", "skills", "status", "cover_letter"}
+
+
+class SkillNames(Aggregate):
+    """Skill nomlari ", " bilan bitta satrga."""
+    function = "STRING_AGG"
+    template = "%(function)s(%(expressions)s, ', ')"
+    output_field = CharField()
+
+    def as_sqlite(self, compiler, connection, **extra_context):
+        return self.as_sql(compiler, connection, function="GROUP_CONCAT", **extra_context)
+
+    def as_mysql(self, compiler, connection, **extra_context):
+        return self.as_sql(compiler, connection, function="GROUP_CONCAT",
+                           template="%(function)s(%(expressions)s SEPARATOR ', ')", **extra_context)
+
+
+def skill_names():
+    rows = (Skill.objects
+            .filter(user_id=OuterRef("applicant_id"))
+            .order_by()
+            .values("user_id")
+            .annotate(names=SkillNames("name"))
+            .values("names"))
+    return Subquery(rows, output_field=CharField())
+
+
+def export_rows(queryset, chunk_size=EXPORT_CHUNK_SIZE):
+    """Eksport qatorlari (tuple) — server-side cursor bilan."""
+    return (queryset
+            .annotate(skill_names=skill_names())
+            .order_by("pk")
+            .values_list(*(field for _, field in COLUMNS))
+            .iterator(chunk_size=chunk_size))
+
+
+def _csv_chunks(rows, buffer_size=STREAM_BUFFER_SIZE):
+    out = io.StringIO()
+    writer = csv.writer(out)
+    writer.writerow(HEADER)
+    for row in rows:
+        writer.writerow(safe_row(HEADER, row, TEXT_COLUMNS))
+        if out.tell() >= buffer_size:
+            yield out.getvalue()
+            out.seek(0)
+            out.truncate()
+    if out.tell():
+        yield out.getvalue()
+
+
+def export_applications(queryset, fmt):
+    """CSV (matn) yoki XLSX (bytes) bo'laklari generatori (StreamingHttpResponse uchun)."""
+    rows = export_rows(queryset)
+    if fmt == "xlsx":
+        return xlsx_chunks(HEADER, rows, sheet_name="Applications")
+    return _csv_chunks(rows)
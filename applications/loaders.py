@@ -0,0 +1,117 @@
+# applications/loaders.py
+from django.utils.functional import cached_property
+
+from accounts.models import Skill
+
+
+def _first(*values):
+    for value in values:
+        if value:
+            return value
+    return None
+
+
+def _profile(user):
+    return getattr(user, "profile", None)
+
+
+def display_name(user):
+    fn = getattr(user, "full_name", None)
+    if callable(fn):
+        try:
+            value = fn()
+            if value:
+                return value
+        except Exception:
+            pass
+    if isinstance(fn, str) and fn:
+        return fn
+    return f"{getattr(user, 'first_name', '')} {getattr(user, 'last_name', '')}".strip() or "—"
+
+
+def avatar_path(user):
+    prof = _profile(user)
+    for c in (
+            getattr(user, "avatar", None),
+            getattr(user, "photo", None),
+            getattr(user, "image", None),
+            getattr(user, "profile_image", None),
+            getattr(prof, "avatar", None) if prof else None,
+            getattr(prof, "photo", None) if prof else None,
+            getattr(prof, "image", None) if prof else None,
+            getattr(prof, "profile_image", None) if prof else None,
+    ):
+        if c:
+            return str(getattr(c, "url", c))
+    return ""
+
+
+def bio_text(user):
+    prof = _profile(user)
+    return _first(
+        getattr(user, "about_me", None),
+        getattr(user, "bio", None),
+        getattr(user, "about", None),
+        getattr(user, "summary", None),
+        getattr(prof, "about_me", None) if prof else None,
+        getattr(prof, "bio", None) if prof else None,
+        getattr(prof, "about", None) if prof else None,
+        getattr(prof, "description", None) if prof else None,
+        getattr(prof, "headline", None) if prof else None,
+        getattr(prof, "summary", None) if prof else None,
+    )
+
+
+def position_text(user):
+    prof = _profile(user)
+    return (
+        getattr(prof, "position", None)
+        or getattr(prof, "title", None)
+        or getattr(user, "title", None)
+        or "—"
+    )
+
+
+class ApplicantSummaryLoader:
+    """
+    Sahifadagi nomzodlar uchun ism, avatar, bio, lavozim va skill'lar.
+    User qatorlari ariza bilan birga (select_related) keladi, skill'lar esa butun sahifa
+    uchun bitta so'rov — flat maydonlar ham, ichma-ich `applicant` ham shu ma'lumotni ishlatadi.
+    """
+
+    def __init__(self, users):
+        self.users = {}
+        for user in users:
+            if user is not None:
+                self.users.setdefault(user.pk, user)
+        self._summaries = {}
+
+    def __contains__(self, user):
+        return user is not None and user.pk in self.users
+
+    @cached_property
+    def skills(self):
+        """{user_id: [nom, ...]} — bitta so'rov."""
+        if not self.users:
+            return {}
+        result = {}
+        rows = (Skill.objects
+                .filter(user_id__in=self.users.keys())
+                .order_by("user_id", "id")
+                .values_list("user_id", "name"))
+        for user_id, name in rows:
+            result.setdefault(user_id, []).append(name)
+        return result
+
+    def get(self, user):
+        summary = self._summaries.get(user.pk)
+        if summary is None:
+            summary = {
+                "full_name": display_name(user),
+                "avatar": avatar_path(user),
+                "bio": bio_text(user),
+                "position": position_text(user),
+                "skills": self.skills.get(user.pk, []),
+            }
+            self._summaries[user.pk] = summary
+        return summary
@@ -0,0 +1,66 @@
+import time
+import tracemalloc
+
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+from django.test.utils import CaptureQueriesContext
+
+from accounts.models import CustomUser, Skill
+from applications.export import FORMATS, export_applications
+from applications.management.commands.bench_employer_dashboard import Command as DashboardBench
+from applications.models import JobApplication
+from applications.serializers import JobApplicationSerializer
+
+
+class _Rollback(Exception):
+    pass
+
+
+class Command(BaseCommand):
+    help = ("Arizalar eksporti: CSV / XLSX oqimi (vaqt, hajm, eng yuqori xotira) va "
+            "JobApplicationSerializer bilan hammasini xotirada yig'ish. ~--applications ta ariza (rollback).")
+
+    def add_arguments(self, parser):
+        parser.add_argument("--jobs", type=int, default=300)
+        parser.add_argument("--applications", type=int, default=100_000)
+        parser.add_argument("--skills-per-user", type=int, default=8)
+        parser.add_argument("--seed", type=int, default=11)
+
+    def handle(self, *args, **options):
+        try:
+            with transaction.atomic():
+                employer = self._seed(options)
+                queryset = JobApplication.objects.filter(job_post__employer=employer)
+                self.stdout.write(f"{'variant':<34}{'s':>8}{'MB out':>9}{'peak MB':>9}{'queries':>9}")
+                for fmt in FORMATS:
+                    self._report(f"oqim: {fmt}", lambda: export_applications(queryset, fmt))
+                self._report("serializer (hammasi xotirada)", lambda: [
+                    str(JobApplicationSerializer(
+                        queryset.select_related("applicant", "job_post"), many=True).data).encode()
+                ])
+                raise _Rollback
+        except _Rollback:
+            pass
+
+    def _seed(self, options):
+        employer = DashboardBench(stdout=self.stdout)._seed({**options, "days": 30})
+        applicants = CustomUser.objects.filter(username__startswith="__bench_dashboard_").values_list("pk", flat=True)
+        per_user = options["skills_per_user"]
+        Skill.objects.bulk_create([
+            Skill(user_id=pk, name=f"skill{(i * 7 + k) % 500}")
+            for i, pk in enumerate(applicants) for k in range(per_user)
+        ], batch_size=5000)
+        return employer
+
+    def _report(self, label, make_chunks):
+        tracemalloc.start()
+        with CaptureQueriesContext(connection) as ctx:
+            started = time.perf_counter()
+            size = 0
+            for chunk in make_chunks():
+                size += len(chunk)
+            seconds = time.perf_counter() - started
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        self.stdout.write(f"{label:<34}{seconds:>8.2f}{size / 2**20:>9.1f}{peak / 2**20:>9.1f}"
+                          f"{len(ctx.captured_queries):>9}")
@@ -0,0 +1,103 @@
+import datetime
+import statistics
+import time
+from collections import Counter
+
+import numpy as np
+from django.core.cache import cache
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from accounts.models import CustomUser
+from applications.dashboard import CACHE_KEY, cached_dashboard, compute_dashboard
+from applications.models import ApplicationStatus, JobApplication
+from vacancies.models import JobPost
+
+
+class _Rollback(Exception):
+    pass
+
+
+class Command(BaseCommand):
+    help = ("Employer dashboard: barcha arizalarni o'qib Python'da sanash, bitta GROUP BY va kesh. "
+            "--jobs ta vakansiya, ~--applications ta ariza (rollback).")
+
+    def add_arguments(self, parser):
+        parser.add_argument("--jobs", type=int, default=300)
+        parser.add_argument("--applications", type=int, default=100_000)
+        parser.add_argument("--days", type=int, default=90)
+        parser.add_argument("--repeat", type=int, default=5)
+        parser.add_argument("--seed", type=int, default=11)
+
+    def handle(self, *args, **options):
+        try:
+            with transaction.atomic():
+                employer = self._seed(options)
+                cache.delete(CACHE_KEY.format(employer.pk))
+                variants = [
+                    ("arizalarni o'qib sanash", lambda: self._legacy(employer)),
+                    ("compute_dashboard (GROUP BY)", lambda: compute_dashboard(employer.pk)),
+                    ("cached_dashboard (kesh)", lambda: cached_dashboard(employer.pk)),
+                ]
+                self.stdout.write(f"{'variant':<32}{'ms (median)':>12}{'queries':>9}")
+                for label, run in variants:
+                    ms, queries = self._measure(run, options["repeat"])
+                    self.stdout.write(f"{label:<32}{ms:>12.2f}{queries:>9}")
+                cache.delete(CACHE_KEY.format(employer.pk))
+                raise _Rollback
+        except _Rollback:
+            pass
+
+    def _seed(self, options):
+        started = time.perf_counter()
+        rng = np.random.default_rng(options["seed"])
+        n_jobs, n_apps = options["jobs"], options["applications"]
+        employer = CustomUser.objects.create_user(username="__bench_dashboard__", password=None, role="EMPLOYER")
+        jobs = JobPost.objects.bulk_create([
+            JobPost(employer=employer, title=f"Bench {i}", description="lorem", skills=["Python"])
+            for i in range(n_jobs)
+        ], batch_size=1000)
+        # (job, applicant) noyob — har bir vakansiyaga nomzodlarning bir qismi
+        per_job = max(1, n_apps // n_jobs)
+        applicants = CustomUser.objects.bulk_create([
+            CustomUser(username=f"__bench_dashboard_{i}__", role="JOB_SEEKER") for i in range(per_job * 2)
+        ], batch_size=5000)
+        statuses = rng.choice(ApplicationStatus.values, size=per_job * n_jobs, p=[0.6, 0.2, 0.15, 0.05])
+        applications = []
+        for j, job in enumerate(jobs):
+            for k, pick in enumerate(rng.choice(len(applicants), size=per_job, replace=False)):
+                applications.append(JobApplication(job_post=job, applicant=applicants[pick],
+                                                   status=statuses[j * per_job + k]))
+        JobApplication.objects.bulk_create(applications, batch_size=5000)
+        # auto_now_add bulk_create'da ham hozirgi vaqt — arizalarni oxirgi --days kunga yoyamiz
+        ids = list(JobApplication.objects.filter(job_post__employer=employer).order_by("pk")
+                   .values_list("pk", flat=True))
+        now = timezone.now()
+        for day in range(options["days"]):
+            (JobApplication.objects.filter(pk__in=ids[day::options["days"]])
+             .update(created_at=now - datetime.timedelta(days=day)))
+        self.stdout.write(f"seed: {n_jobs} vakansiya, {len(ids)} ariza, {time.perf_counter() - started:.1f}s")
+        return employer
+
+    def _legacy(self, employer):
+        # EmployerAllApplicationsView sahifalarini aylanib chiqish bilan teng: har bir qator o'qiladi
+        counts, first = Counter(), {}
+        for job_id, status, created_at in (JobApplication.objects
+                                           .filter(job_post__employer=employer)
+                                           .values_list("job_post_id", "status", "created_at")
+                                           .iterator(chunk_size=5000)):
+            counts[job_id, status] += 1
+            if job_id not in first or created_at < first[job_id]:
+                first[job_id] = created_at
+        return counts, first
+
+    def _measure(self, run, repeat):
+        timings = []
+        for _ in range(repeat):
+            with CaptureQueriesContext(connection) as ctx:
+                started = time.perf_counter()
+                run()
+                timings.append((time.perf_counter() - started) * 1000)
+        return statistics.median(timings), len(ctx.captured_queries)
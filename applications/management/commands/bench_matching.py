@@ -0,0 +1,66 @@
+import statistics
+import time
+from types import SimpleNamespace
+
+import numpy as np
+from django.core.management.base import BaseCommand
+
+from applications.matching import LANG_PREFIX, SKILL_PREFIX, SkillMatrix
+
+SKILLS = [f"skill{i}" for i in range(2000)] + ["python", "django", "react", "postgresql", "docker"]
+LANGUAGES = ["english", "russian", "uzbek", "german", "turkish"]
+
+
+class Command(BaseCommand):
+    help = "N ta sintetik profilni bitta vakansiyaga nisbatan baholash tezligi (vektorlashgan vs oddiy Python)."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--profiles", type=int, default=100_000)
+        parser.add_argument("--skills-per-profile", type=int, default=12)
+        parser.add_argument("--repeat", type=int, default=20)
+        parser.add_argument("--top", type=int, default=20)
+        parser.add_argument("--seed", type=int, default=3)
+
+    def handle(self, *args, **options):
+        rng = np.random.default_rng(options["seed"])
+        n, per = options["profiles"], options["skills_per_profile"]
+
+        started = time.perf_counter()
+        # Zipf'ga o'xshash taqsimot: mashhur skill'lar ko'p uchraydi
+        popularity = 1.0 / np.arange(1, len(SKILLS) + 1)
+        popularity /= popularity.sum()
+        skill_picks = rng.choice(len(SKILLS), size=(n, per), p=popularity)
+        lang_picks = rng.integers(0, len(LANGUAGES), size=(n, 2))
+        lang_levels = rng.choice([0.4, 0.6, 0.8, 1.0], size=(n, 2))
+        profiles = []
+        for i in range(n):
+            features = {SKILL_PREFIX + SKILLS[j]: 1.0 for j in skill_picks[i]}
+            for j, level in zip(lang_picks[i], lang_levels[i]):
+                features[LANG_PREFIX + LANGUAGES[j]] = float(level)
+            profiles.append((i, features))
+        matrix = SkillMatrix.from_profiles(profiles)
+        self.stdout.write(f"{n} profil, {len(matrix.vocabulary)} feature, {len(matrix.rows)} nnz, "
+                          f"qurish {time.perf_counter() - started:.1f}s")
+
+        job = SimpleNamespace(
+            title="Senior Python developer", description="Good english is required",
+            skills=["Python", "Django", "PostgreSQL", "Docker", "skill40", "skill900"],
+        )
+
+        vectorized = []
+        for _ in range(options["repeat"]):
+            t0 = time.perf_counter()
+            top = matrix.top(job, options["top"])
+            vectorized.append((time.perf_counter() - t0) * 1000)
+
+        # taqqoslash uchun: har bir profilni lug'at orqali bittalab baholash
+        weights = [(feature, weight) for _, weight, feature in matrix.vacancy_weights(job)]
+        t0 = time.perf_counter()
+        naive = np.array([100.0 * sum(weight * features.get(feature, 0.0) for feature, weight in weights)
+                          for _, features in profiles], dtype=np.float32)
+        naive_ms = (time.perf_counter() - t0) * 1000
+
+        assert np.allclose(matrix.score(job), naive, atol=1e-3), "vektorlashgan ball oddiy hisobdan farq qiladi"
+        self.stdout.write(f"  score + top-{options['top']}: median {statistics.median(vectorized):8.2f} ms")
+        self.stdout.write(f"  oddiy Python:        {naive_ms:8.2f} ms")
+        self.stdout.write(f"  eng yaxshi: {top[0][1]} ball, mos: {', '.join(top[0][2])}")
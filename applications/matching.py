@@ -0,0 +1,270 @@
+# applications/matching.py
+"""
+Nomzod <-> vakansiya moslik (match) dvigateli.
+
+Har bir nomzod profili — siyrak vektor:
+  skill:<nom>  (accounts.Skill, Resume.skills)      qiymati 1.0
+  lang:<nom>   (LanguageSkill, Resume.languages)    qiymati darajaga qarab 0.3..1.0
+
+Vektorlar ustunlar bo'yicha siqilgan (CSC) numpy massivlarda saqlanadi: har bir
+feature uchun shu feature'ga ega qatorlar ro'yxati. Vakansiyani baholash faqat
+vakansiyada bor ustunlarni aylanib chiqadi — 100k profil ham millisekundlarda.
+
+Ball (0..100):
+  skill qismi — mos kelgan skill'lar IDF og'irliklari yig'indisi / vakansiyadagi
+                barcha skill'lar IDF yig'indisi (kam uchraydigan skill qimmatroq);
+  til qismi   — vakansiya matnida tilga olingan tillar bo'yicha o'rtacha daraja.
+"""
+import math
+import threading
+import time
+
+import numpy as np
+
+from vacancies.search import tokenize
+from vacancies.skills import normalize_skill, skill_names
+
+SKILL_PREFIX = "skill:"
+LANG_PREFIX = "lang:"
+SKILL_SHARE = 0.8
+LANG_SHARE = 0.2
+DEFAULT_LANG_LEVEL = 0.7
+LANG_LEVELS = {
+    "a1": 0.3, "a2": 0.4, "b1": 0.6, "b2": 0.8, "c1": 0.9, "c2": 1.0,
+    "beginner": 0.3, "elementary": 0.4, "intermediate": 0.6, "upper intermediate": 0.8,
+    "advanced": 0.9, "fluent": 1.0, "native": 1.0, "родной": 1.0, "родной язык": 1.0, "ona tili": 1.0,
+}
+MATRIX_TTL = 300  # sekund — boshqa worker'lardagi o'zgarishlar shuncha kechikib ko'rinadi
+# profil o'zgarsa ham matritsa ko'pi bilan shuncha sekundda bir marta qayta quriladi
+MATRIX_REBUILD_INTERVAL = 30
+
+
+def language_level(raw):
+    level = normalize_skill(raw or "")
+    if level in LANG_LEVELS:
+        return LANG_LEVELS[level]
+    for token in level.replace("-", " ").split():
+        if token in LANG_LEVELS:
+            return LANG_LEVELS[token]
+    return DEFAULT_LANG_LEVEL
+
+
+class SkillMatrix:
+    """Nomzodlar x feature'lar siyrak matritsasi (CSC)."""
+
+    def __init__(self, user_ids, vocabulary, indptr, rows, values):
+        self.user_ids = user_ids          # qator -> user pk
+        self.vocabulary = vocabulary      # feature -> ustun
+        self.indptr = indptr              # ustun c qatorlari: rows[indptr[c]:indptr[c+1]]
+        self.rows = rows
+        self.values = values
+        self.row_of = {pk: i for i, pk in enumerate(user_ids)}
+        n = len(user_ids)
+        df = np.diff(indptr).astype(np.float64)
+        self.idf = np.log((n + 1) / (df + 1)) + 1.0
+        self.unseen_idf = math.log(n + 1) + 1.0
+
+    def __len__(self):
+        return len(self.user_ids)
+
+    @classmethod
+    def from_profiles(cls, profiles):
+        """profiles: [(user_id, {feature: value}), ...]"""
+        user_ids, vocabulary = [], {}
+        rows, cols, values = [], [], []
+        for row, (user_id, features) in enumerate(profiles):
+            user_ids.append(user_id)
+            for feature, value in features.items():
+                rows.append(row)
+                cols.append(vocabulary.setdefault(feature, len(vocabulary)))
+                values.append(value)
+        return cls.from_coo(user_ids, vocabulary, np.asarray(rows, dtype=np.int32),
+                            np.asarray(cols, dtype=np.int32), np.asarray(values, dtype=np.float32))
+
+    @classmethod
+    def from_coo(cls, user_ids, vocabulary, rows, cols, values):
+        order = np.argsort(cols, kind="stable")
+        counts = np.bincount(cols, minlength=len(vocabulary)) if len(cols) else np.zeros(len(vocabulary), int)
+        indptr = np.zeros(len(vocabulary) + 1, dtype=np.int64)
+        np.cumsum(counts, out=indptr[1:])
+        return cls(user_ids, vocabulary, indptr, rows[order], values[order])
+
+    # ---------- vakansiya ----------
+
+    def vacancy_weights(self, job_post):
+        """[(ustun yoki None, og'irlik, feature)] — og'irliklar yig'indisi 1."""
+        skills = [SKILL_PREFIX + name for name in skill_names(job_post.skills)]
+        text_tokens = set(tokenize(f"{job_post.title} {job_post.description}"))
+        languages = sorted(
+            feature for feature in self.vocabulary
+            if feature.startswith(LANG_PREFIX) and feature[len(LANG_PREFIX):] in text_tokens
+        )
+        skill_share = SKILL_SHARE if languages else 1.0
+        lang_share = 1.0 - skill_share if skills else 1.0
+
+        weights = []
+        if skills:
+            idf = [self.idf[self.vocabulary[f]] if f in self.vocabulary else self.unseen_idf for f in skills]
+            total = sum(idf)
+            weights += [(self.vocabulary.get(f), skill_share * w / total, f) for f, w in zip(skills, idf)]
+        if languages:
+            weights += [(self.vocabulary[f], lang_share / len(languages), f) for f in languages]
+        return weights
+
+    def score(self, job_post):
+        """float32[len(self)] — har bir qator uchun 0..100 ball."""
+        scores = np.zeros(len(self.user_ids), dtype=np.float32)
+        for col, weight, _ in self.vacancy_weights(job_post):
+            if col is None:
+                continue
+            start, end = self.indptr[col], self.indptr[col + 1]
+            # ustun ichida qatorlar takrorlanmaydi — oddiy fancy-index qo'shish yetarli
+            scores[self.rows[start:end]] += self.values[start:end] * (100.0 * weight)
+        return scores
+
+    def top(self, job_post, limit, exclude=()):
+        """[(user_id, score, matched_features)] — ball bo'yicha kamayish tartibida."""
+        scores = self.score(job_post)
+        for pk in exclude:
+            row = self.row_of.get(pk)
+            if row is not None:
+                scores[row] = 0
+        positive = int(np.count_nonzero(scores))
+        limit = min(limit, positive)
+        if limit <= 0:
+            return []
+        best = np.argpartition(-scores, limit - 1)[:limit]
+        best = best[np.argsort(-scores[best], kind="stable")]
+
+        matched = {int(row): [] for row in best}
+        for col, _, feature in self.vacancy_weights(job_post):
+            if col is None:
+                continue
+            col_rows = self.rows[self.indptr[col]:self.indptr[col + 1]]
+            for row in best[np.isin(best, col_rows)]:
+                matched[int(row)].append(feature.split(":", 1)[1])
+        return [(self.user_ids[row], round(float(scores[row]), 1), matched[int(row)]) for row in best]
+
+    def scores_for(self, job_post, user_ids):
+        """{user_id: score} — faqat so'ralgan foydalanuvchilar uchun."""
+        scores = self.score(job_post)
+        return {pk: round(float(scores[self.row_of[pk]]), 1) if pk in self.row_of else 0.0 for pk in user_ids}
+
+
+# ---------- bazadan qurish ----------
+
+def load_profiles(users):
+    """users — CustomUser queryset. [(user_id, {feature: value})] qaytaradi (4 ta so'rov)."""
+    from accounts.models import LanguageSkill, Skill
+    from resume.models import Resume
+
+    user_pks = users.order_by().values("pk")
+    profiles = {pk: {} for pk in users.order_by().values_list("pk", flat=True)}
+
+    def add_skill(user_id, name):
+        name = normalize_skill(name) if name else ""
+        if name and user_id in profiles:
+            profiles[user_id][SKILL_PREFIX + name] = 1.0
+
+    def add_language(user_id, name, level):
+        name = normalize_skill(name) if name else ""
+        if name and user_id in profiles:
+            feature = LANG_PREFIX + name
+            profiles[user_id][feature] = max(profiles[user_id].get(feature, 0.0), language_level(level))
+
+    for user_id, name in Skill.objects.filter(user__in=user_pks).values_list("user_id", "name").iterator():
+        add_skill(user_id, name)
+    for user_id, name, level in (LanguageSkill.objects.filter(user__in=user_pks)
+                                 .values_list("user_id", "language", "level").iterator()):
+        add_language(user_id, name, level)
+    for user_id, skills, languages in (Resume.objects.filter(user__in=user_pks, is_active=True)
+                                       .values_list("user_id", "skills", "languages").iterator()):
+        for name in skill_names(skills):
+            add_skill(user_id, name)
+        for item in languages if isinstance(languages, list) else []:
+            if isinstance(item, dict):
+                add_language(user_id, item.get("name") or item.get("language"), item.get("level"))
+    return list(profiles.items())
+
+
+def build_matrix(users):
+    return SkillMatrix.from_profiles(load_profiles(users))
+
+
+# ---------- process ichidagi kesh (barcha JOB_SEEKER'lar) ----------
+
+_lock = threading.Lock()
+_build_lock = threading.Lock()
+_cache = {"matrix": None, "built_at": 0.0, "version": 0, "built_version": -1}
+
+
+def invalidate_candidate_matrix():
+    """Faqat versiyani oshiradi — qayta qurish keyingi o'qishda (debounce bilan)."""
+    with _lock:
+        _cache["version"] += 1
+
+
+def _fresh_matrix():
+    matrix = _cache["matrix"]
+    if matrix is None:
+        return None
+    age = time.monotonic() - _cache["built_at"]
+    if age >= MATRIX_TTL:
+        return None
+    # ketma-ket profil saqlashlar har safar butun matritsani qayta qurdirmasin
+    if _cache["built_version"] != _cache["version"] and age >= MATRIX_REBUILD_INTERVAL:
+        return None
+    return matrix
+
+
+def get_candidate_matrix():
+    with _lock:
+        matrix = _fresh_matrix()
+    if matrix is not None:
+        return matrix
+
+    # bir vaqtda faqat bitta oqim quradi, qolganlari tayyor natijani oladi
+    with _build_lock:
+        with _lock:
+            matrix = _fresh_matrix()
+            version = _cache["version"]
+        if matrix is not None:
+            return matrix
+
+        from accounts.models import CustomUser, Role
+        matrix = build_matrix(CustomUser.objects.filter(role=Role.JOB_SEEKER, is_active=True))
+        with _lock:
+            _cache.update(matrix=matrix, built_at=time.monotonic(), built_version=version)
+    return matrix
+
+
+def rank_applications(queryset):
+    """
+    [(application_id, score)] — queryset'ning barcha arizalari, ball (keyin yangilik) bo'yicha.
+    ORM obyektlari yuklanmaydi: (id, nomzod, vakansiya, sana) qatorlari, vakansiyalar va faqat
+    shu nomzodlar matritsasi — so'rovlar soni arizalar soniga bog'liq emas.
+    """
+    from accounts.models import CustomUser
+    from vacancies.models import JobPost
+
+    queryset = queryset.order_by()
+    rows = list(queryset.values_list("pk", "applicant_id", "job_post_id", "created_at"))
+    if not rows:
+        return []
+    matrix = build_matrix(CustomUser.objects.filter(pk__in=queryset.values("applicant_id")))
+    jobs = JobPost.objects.only("title", "description", "skills").in_bulk({job_id for _, _, job_id, _ in rows})
+
+    # qator -> matritsa qatori (nomzod profili yo'q bo'lsa -1 — ball 0)
+    matrix_rows = np.fromiter((matrix.row_of.get(applicant_id, -1) for _, applicant_id, _, _ in rows),
+                              dtype=np.int64, count=len(rows))
+    job_of_row = np.fromiter((job_id for _, _, job_id, _ in rows), dtype=np.int64, count=len(rows))
+    scores = np.zeros(len(rows), dtype=np.float32)
+    for job_id, job_post in jobs.items():
+        mask = (job_of_row == job_id) & (matrix_rows >= 0)
+        if mask.any():
+            scores[mask] = matrix.score(job_post)[matrix_rows[mask]]
+    scores = np.round(scores, 1)
+
+    newest = np.fromiter((created_at.timestamp() for _, _, _, created_at in rows), dtype=np.float64, count=len(rows))
+    order = np.lexsort((-newest, -scores))
+    return [(rows[i][0], float(scores[i])) for i in order]
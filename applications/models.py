@@ -30,3 +30,21 @@ class JobApplication(models.Model):
 
     def __str__(self):
         return f"{self.applicant_id} -> {self.job_post_id} ({self.status})"
+
+
+class ApplicationStatusChange(models.Model):
+    """Ariza holati tarixi — faqat qo'shiladi (applications.status.transition)."""
+    application = models.ForeignKey(JobApplication, on_delete=models.CASCADE, related_name="status_changes")
+    from_status = models.CharField(max_length=20, choices=ApplicationStatus.choices)
+    to_status = models.CharField(max_length=20, choices=ApplicationStatus.choices)
+    changed_by = models.ForeignKey(
+        settings.AUTH_USER_MODEL, on_delete=models.SET_NULL, null=True, blank=True, related_name="+",
+    )
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        ordering = ("-created_at",)
+        indexes = [models.Index(fields=["application", "-created_at"], name="appstatus_app_created_idx")]
+
+    def __str__(self):
+        return f"{self.application_id}: {self.from_status} -> {self.to_status}"
@@ -2,6 +2,7 @@ from rest_framework import serializers
 
 from accounts.models import CustomUser, Certificate, WorkExperience, PortfolioProject, PortfolioMedia, Education, \
     LanguageSkill
+from .loaders import ApplicantSummaryLoader
 from .models import JobApplication
 
 def abs_url(request, raw):
@@ -16,6 +17,28 @@ def abs_url(request, raw):
     return f"{base}{raw}"
 
 
+SUMMARIES = "applicant_summaries"  # context kaliti
+
+
+def applicant_summary(context, user):
+    """Loader'dan nomzod ma'lumoti; loader bo'lmasa (detail) — shu nomzod uchun yangisi."""
+    loader = context.get(SUMMARIES)
+    if loader is None or user not in loader:
+        loader = ApplicantSummaryLoader([user])
+        context[SUMMARIES] = loader
+    return loader.get(user)
+
+
+class ApplicantSummaryListSerializer(serializers.ListSerializer):
+    """Sahifadagi barcha nomzodlar uchun ApplicantSummaryLoader'ni bir marta quradi."""
+
+    def to_representation(self, data):
+        items = list(data.all() if hasattr(data, "all") else data)
+        users = [item.applicant if isinstance(item, JobApplication) else item for item in items]
+        self.context[SUMMARIES] = ApplicantSummaryLoader(users)
+        return super().to_representation(items)
+
+
 class ApplicantMiniSerializer(serializers.ModelSerializer):
     full_name = serializers.SerializerMethodField()
     avatar = serializers.SerializerMethodField()
@@ -26,103 +49,29 @@ class ApplicantMiniSerializer(serializers.ModelSerializer):
     class Meta:
         model = CustomUser
         fields = ["id", "full_name", "avatar", "bio", "position", "skills"]
+        list_serializer_class = ApplicantSummaryListSerializer
 
-    # ------- helpers -------
-    def _first(self, *vals):
-        for v in vals:
-            if v:
-                return v
-        return None
-
-    def _pick_avatar(self, user):
-        prof = getattr(user, "profile", None)
-        candidates = [
-            getattr(user, "avatar", None),
-            getattr(user, "photo", None),
-            getattr(user, "image", None),
-            getattr(user, "profile_image", None),
-            getattr(prof, "avatar", None) if prof else None,
-            getattr(prof, "photo", None) if prof else None,
-            getattr(prof, "image", None) if prof else None,
-            getattr(prof, "profile_image", None) if prof else None,
-        ]
-        for c in candidates:
-            if c:
-                return getattr(c, "url", c)
-        return ""
+    def _summary(self, obj):
+        return applicant_summary(self.context, obj)
 
     # ------- getters -------
     def get_full_name(self, obj):
-        fn = getattr(obj, "full_name", None)
-        if callable(fn):
-            try:
-                v = fn()
-                if v:
-                    return v
-            except Exception:
-                pass
-        if isinstance(fn, str) and fn:
-            return fn
-        return f"{getattr(obj,'first_name','')} {getattr(obj,'last_name','')}".strip() or "—"
+        return self._summary(obj)["full_name"]
 
     def get_avatar(self, obj):
-        request = self.context.get("request")
-        raw = self._pick_avatar(obj)
-        return abs_url(request, raw) if raw else ""
+        raw = self._summary(obj)["avatar"]
+        return abs_url(self.context.get("request"), raw) if raw else ""
 
-    # serializers.py ichida ApplicantMiniSerializer
     def get_bio(self, obj):
-        prof = getattr(obj, "profile", None)
-
-        # 🔑 User darajasida
-        u_bio = self._first(
-            getattr(obj, "about_me", None),  # ✅ TO‘G‘RILANDI
-            getattr(obj, "bio", None),
-            getattr(obj, "about", None),
-            getattr(obj, "summary", None),
-        )
-        if u_bio:
-            return u_bio
-
-        # 🔑 Profile darajasida
-        if prof:
-            p_bio = self._first(
-                getattr(prof, "about_me", None),
-                getattr(prof, "bio", None),
-                getattr(prof, "about", None),
-                getattr(prof, "description", None),
-                getattr(prof, "headline", None),
-                getattr(prof, "summary", None),
-            )
-            if p_bio:
-                return p_bio
-
-        return "—"
+        return self._summary(obj)["bio"] or "—"
 
     def get_position(self, obj):
-        prof = getattr(obj, "profile", None)
-        return (
-            getattr(prof, "position", None)
-            or getattr(prof, "title", None)
-            or getattr(obj, "title", None)
-            or "—"
-        )
+        return self._summary(obj)["position"]
 
     def get_skills(self, obj):
-        prof = getattr(obj, "profile", None)
-        sk = getattr(obj, "skills", None)
-        if hasattr(sk, "all"):
-            return list(sk.values_list("name", flat=True))
-        if prof:
-            psk = getattr(prof, "skills", None)
-            if hasattr(psk, "all"):
-                return list(psk.values_list("name", flat=True))
-            psv = getattr(prof, "skills", None)
-            if isinstance(psv, list):
-                return psv
-            if isinstance(psv, str):
-                return [s for s in psv.replace(",", " ").split() if s]
-        return []
+        return self._summary(obj)["skills"]
+
+
 class JobApplicationSerializer(serializers.ModelSerializer):
     # Nested ko‘rinish agar kerak bo‘lsa:
     applicant = ApplicantMiniSerializer(read_only=True)
@@ -136,6 +85,7 @@ class JobApplicationSerializer(serializers.ModelSerializer):
     skills   = serializers.SerializerMethodField()
 
     job = serializers.SerializerMethodField()
+    match_score = serializers.SerializerMethodField()  # faqat ?ordering=match bo'lganda to'ladi
 
     class Meta:
         model = JobApplication
@@ -146,104 +96,46 @@ class JobApplicationSerializer(serializers.ModelSerializer):
             "applicant",
             # FLAT
             "userId", "name", "avatar", "bio", "position", "skills",
-            "cover_letter", "status", "created_at",
+            "cover_letter", "status", "created_at", "match_score",
         ]
         read_only_fields = ["id", "applicant", "status", "created_at"]
+        list_serializer_class = ApplicantSummaryListSerializer
 
-    # ----- FLAT getters -----
+    def _summary(self, obj):
+        return applicant_summary(self.context, obj.applicant)
+
+    # ----- FLAT getters (ichma-ich applicant bilan bir xil ma'lumot) -----
     def get_name(self, obj):
-        user = obj.applicant
-        fn = getattr(user, "full_name", None)
-        if callable(fn):
-            try:
-                v = fn()
-                if v: return v
-            except Exception:
-                pass
-        if isinstance(fn, str) and fn:
-            return fn
-        return f"{getattr(user, 'first_name', '')} {getattr(user, 'last_name', '')}".strip() or "—"
+        return self._summary(obj)["full_name"]
 
     def get_avatar(self, obj):
-        request = self.context.get("request")  # ← MUHIM: request ni oling
-        user = obj.applicant
-        prof = getattr(user, "profile", None)
-        candidates = [
-            getattr(user, "avatar", None),
-            getattr(user, "photo", None),
-            getattr(user, "image", None),
-            getattr(user, "profile_image", None),
-            getattr(prof, "avatar", None) if prof else None,
-            getattr(prof, "photo", None) if prof else None,
-            getattr(prof, "image", None) if prof else None,
-            getattr(prof, "profile_image", None) if prof else None,
-        ]
-        for c in candidates:
-            if not c:
-                continue
-            return abs_url(request, str(getattr(c, "url", c)))  # endi request bor
-        return ""
+        raw = self._summary(obj)["avatar"]
+        return abs_url(self.context.get("request"), raw) if raw else ""
 
-    # serializers.py ichida JobApplicationSerializer
     def get_bio(self, obj):
-        user = obj.applicant
-        prof = getattr(user, "profile", None)
-        for src in (
-                getattr(user, "about_me", None),  # ✅ TO‘G‘RILANDI
-                getattr(user, "bio", None),
-                getattr(user, "about", None),
-                getattr(user, "summary", None),
-                getattr(prof, "about_me", None) if prof else None,
-                getattr(prof, "bio", None) if prof else None,
-                getattr(prof, "about", None) if prof else None,
-                getattr(prof, "description", None) if prof else None,
-                getattr(prof, "headline", None) if prof else None,
-                getattr(prof, "summary", None) if prof else None,
-        ):
-            if src:
-                return src
-
-        return obj.cover_letter or "—"
+        return self._summary(obj)["bio"] or obj.cover_letter or "—"
 
     def get_position(self, obj):
-        user = obj.applicant
-        prof = getattr(user, "profile", None)
-        return (
-            getattr(prof, "position", None)
-            or getattr(prof, "title", None)
-            or getattr(user, "title", None)
-            or "—"
-        )
+        return self._summary(obj)["position"]
 
     def get_skills(self, obj):
-        user = obj.applicant
-        # user.skills M2M
-        sk = getattr(user, "skills", None)
-        if hasattr(sk, "all"):
-            return list(sk.values_list("name", flat=True))
-        # profile.skills
-        prof = getattr(user, "profile", None)
-        if prof:
-            psk = getattr(prof, "skills", None)
-            if hasattr(psk, "all"):
-                return list(psk.values_list("name", flat=True))
-            psv = getattr(prof, "skills", None)
-            if isinstance(psv, list):
-                return psv
-            if isinstance(psv, str):
-                return [s for s in psv.replace(",", " ").split() if s]
-        return []
+        return self._summary(obj)["skills"]
 
     def get_job(self, obj):
         jp = obj.job_post
         return {"id": jp.id, "title": getattr(jp, "title", None)}
 
+    def get_match_score(self, obj):
+        scores = self.context.get("match_scores")
+        return scores.get(obj.pk) if scores is not None else None
+
 class ApplicationSerializer(serializers.ModelSerializer):
     applicant = ApplicantMiniSerializer(read_only=True)
 
     class Meta:
         model = JobApplication
         fields = ["id", "job_post", "cover_letter", "created_at", "applicant"]
+        list_serializer_class = ApplicantSummaryListSerializer
 
 
 
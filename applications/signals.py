@@ -0,0 +1,80 @@
+from django.db import transaction
+from django.db.models import QuerySet
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from accounts.models import CustomUser, LanguageSkill, Skill
+from resume.models import Resume
+from vacancies import trending
+from vacancies.models import JobPost
+from .dashboard import invalidate_dashboards
+from .matching import invalidate_candidate_matrix
+from .models import JobApplication
+
+
+@receiver([post_save, post_delete], sender=Skill)
+@receiver([post_save, post_delete], sender=LanguageSkill)
+@receiver([post_save, post_delete], sender=Resume)
+def invalidate_on_profile_change(sender, **kwargs):
+    invalidate_candidate_matrix()
+
+
+@receiver([post_save, post_delete], sender=CustomUser)
+def invalidate_on_user_change(sender, update_fields=None, **kwargs):
+    # login (last_login) kabi qisman saqlashlar nomzodlar ro'yxatini o'zgartirmaydi
+    if update_fields and not {"role", "is_active"} & set(update_fields):
+        return
+    invalidate_candidate_matrix()
+
+
+@receiver(post_save, sender=JobApplication)
+def bump_job_post_trending(sender, instance, created=False, raw=False, **kwargs):
+    if created and not raw:
+        trending.record_application(instance.job_post_id, instance.created_at)
+
+
+# ---------- employer dashboard ----------
+
+def _employer_id(application):
+    if JobApplication.job_post.field.is_cached(application):
+        return application.job_post.employer_id
+    return JobPost.objects.filter(pk=application.job_post_id).values_list("employer_id", flat=True).first()
+
+
+def _deleted_with_job_post(origin):
+    return isinstance(origin, JobPost) or (isinstance(origin, QuerySet) and origin.model is JobPost)
+
+
+@receiver(post_save, sender=JobApplication)
+def invalidate_dashboard_on_application(sender, instance, raw=False, **kwargs):
+    # yaratish va holat o'zgarishi (admin / serializer orqali)
+    if not raw:
+        invalidate_dashboards([_employer_id(instance)])
+
+
+@receiver(post_delete, sender=JobApplication)
+def invalidate_dashboard_on_application_delete(sender, instance, origin=None, using="default", **kwargs):
+    # vakansiya bilan birga (CASCADE) o'chsa — invalidate_dashboard_on_job_post yetarli
+    if _deleted_with_job_post(origin):
+        return
+    # bitta delete() ning barcha qatorlari uchun employer'lar commit'da bitta so'rov bilan olinadi
+    pending = getattr(origin, "_dashboard_job_ids", None) if origin is not None else None
+    if pending is None:
+        pending = set()
+        if origin is not None:
+            origin._dashboard_job_ids = pending
+
+        def invalidate():
+            if origin is not None:
+                origin.__dict__.pop("_dashboard_job_ids", None)
+            invalidate_dashboards(JobPost.objects.using(using).filter(pk__in=pending)
+                                  .values_list("employer_id", flat=True).distinct())
+
+        transaction.on_commit(invalidate, using=using)
+    pending.add(instance.job_post_id)
+
+
+@receiver([post_save, post_delete], sender=JobPost)
+def invalidate_dashboard_on_job_post(sender, instance, raw=False, **kwargs):
+    if not raw:
+        invalidate_dashboards([instance.employer_id])
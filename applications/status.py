@@ -0,0 +1,71 @@
+# applications/status.py
+"""
+Arizalar holatini ommaviy o'zgartirish (employer nomzodlarni saralaganda).
+
+Tanlov — id'lar ro'yxati yoki filtr (vakansiya + joriy holat) — doim employer'ning o'z
+vakansiyalari bilan cheklanadi. Bitta tranzaksiyada: mos qatorlar (id, vakansiya, eski holat)
+qulflab o'qiladi, o'zgaradiganlari bitta UPDATE bilan yangilanadi va har bir o'zgarish uchun
+tarix qatori (ApplicationStatusChange) bulk_create bilan yoziladi.
+"""
+from django.db import transaction
+from django.db.models import Count
+
+from .dashboard import invalidate_dashboards
+from .models import ApplicationStatus, ApplicationStatusChange, JobApplication
+
+MAX_IDS = 1000
+HISTORY_BATCH_SIZE = 1000
+
+
+class TransitionResult:
+    def __init__(self, rows, to_status):
+        self.rows = rows  # [(pk, job_post_id, eski holat), ...]
+        self.changed = [row for row in rows if row[2] != to_status]
+
+    @property
+    def job_ids(self):
+        return {job_id for _, job_id, _ in self.rows}
+
+    def missing(self, ids):
+        found = {pk for pk, _, _ in self.rows}
+        return [pk for pk in ids if pk not in found]
+
+
+def transition(employer, to_status, ids=None, job_id=None, from_status=None, using="default"):
+    qs = JobApplication.objects.using(using).filter(job_post__employer=employer)
+    if ids is not None:
+        qs = qs.filter(pk__in=ids)
+    if job_id is not None:
+        qs = qs.filter(job_post_id=job_id)
+    if from_status is not None:
+        qs = qs.filter(status=from_status)
+
+    with transaction.atomic(using=using):
+        # of=self: JOIN qilingan job_post qatorlari qulflanmaydi
+        rows = list(qs.select_for_update(of=("self",)).order_by("pk").values_list("pk", "job_post_id", "status"))
+        result = TransitionResult(rows, to_status)
+        if result.changed:
+            (JobApplication.objects.using(using)
+             .filter(pk__in=[pk for pk, _, _ in result.changed])
+             .update(status=to_status))
+            ApplicationStatusChange.objects.using(using).bulk_create([
+                ApplicationStatusChange(application_id=pk, from_status=old, to_status=to_status, changed_by=employer)
+                for pk, _, old in result.changed
+            ], batch_size=HISTORY_BATCH_SIZE)
+            invalidate_dashboards([employer.pk])  # update() signal yubormaydi
+    return result
+
+
+def funnel(job_ids, using="default"):
+    """{job_id: {holat: soni, ..., "total": n}} — bitta GROUP BY."""
+    counts = {job_id: dict.fromkeys(ApplicationStatus.values, 0) for job_id in job_ids}
+    rows = (JobApplication.objects.using(using)
+            .filter(job_post_id__in=counts.keys())
+            .order_by()
+            .values_list("job_post_id", "status")
+            .annotate(n=Count("id")))
+    for job_id, status, n in rows:
+        counts[job_id][status] = n
+    for job_counts in counts.values():
+        job_counts["total"] = sum(job_counts.values())
+    return counts
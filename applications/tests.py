@@ -1,3 +1,269 @@
-from django.test import TestCase
+import csv
+import io
+import zipfile
+from datetime import timedelta
+from xml.etree import ElementTree
+from unittest.mock import patch
+
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APITestCase
+
+from accounts.models import CustomUser, Skill
+from vacancies.models import JobPost
+from . import export, matching
+from .dashboard import CACHE_KEY as DASHBOARD_KEY
+from .models import ApplicationStatus, ApplicationStatusChange, JobApplication
+from .status import transition
+
+
+class ApplicationsTestMixin:
+    def setUp(self):
+        self.employer = CustomUser.objects.create_user(
+            username="employer", email="employer@example.com", password="x", role="EMPLOYER"
+        )
+        self.job = JobPost.objects.create(employer=self.employer, title="Backend developer",
+                                          skills=["python", "django"])
+
+    def _seeker(self, name, skills=()):
+        user = CustomUser.objects.create_user(
+            username=name, email=f"{name}@example.com", password="x", role="JOB_SEEKER"
+        )
+        for skill in skills:
+            Skill.objects.create(user=user, name=skill)
+        return user
+
+    def _apply(self, user, job=None):
+        return JobApplication.objects.create(job_post=job or self.job, applicant=user)
+
+
+class ApplyViewTests(ApplicationsTestMixin, APITestCase):
+    url = "/api/applications/apply/"
+
+    def setUp(self):
+        super().setUp()
+        self.seeker = self._seeker("seeker")
+        self.client.force_authenticate(self.seeker)
+
+    def test_open_job_accepts_application(self):
+        response = self.client.post(self.url, {"job_post": self.job.pk}, format="json")
+        self.assertEqual(response.status_code, 201)
+
+    def test_closed_job_rejects_application(self):
+        self.job.is_filled = True
+        self.job.save()  # pre_save vakansiyani yopadi
+        self.assertFalse(self.job.is_active)
+
+        response = self.client.post(self.url, {"job_post": self.job.pk}, format="json")
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.json()["detail"], "Vakansiya faol emas.")
+        self.assertFalse(JobApplication.objects.exists())
+
+
+class MatchOrderingTests(ApplicationsTestMixin, APITestCase):
+    url = "/api/applications/my/applications/"
+
+    def setUp(self):
+        super().setUp()
+        self.client.force_authenticate(self.employer)
+        self.none = self._apply(self._seeker("none"))
+        self.both = self._apply(self._seeker("both", ["python", "django"]))
+        self.one = self._apply(self._seeker("one", ["python"]))
+        for minutes, app in enumerate([self.none, self.both, self.one]):  # none — eng eski
+            JobApplication.objects.filter(pk=app.pk).update(created_at=app.created_at + timedelta(minutes=minutes))
+
+    def _ids(self):
+        response = self.client.get(self.url, {"ordering": "match"})
+        self.assertEqual(response.status_code, 200)
+        return [row["id"] for row in response.json()["results"]]
+
+    def test_orders_by_match_score(self):
+        self.assertEqual(self._ids(), [self.both.pk, self.one.pk, self.none.pk])
+
+    def test_all_applications_are_ranked_across_pages(self):
+        # eng eski ariza eng mos — ro'yxat boshiga chiqishi kerak (sahifa hajmi 10)
+        newer = [self._apply(self._seeker(f"extra{i}")) for i in range(10)]
+        JobApplication.objects.filter(pk=self.both.pk).update(created_at=self.none.created_at - timedelta(days=1))
+
+        first = self.client.get(self.url, {"ordering": "match"}).json()
+        second = self.client.get(self.url, {"ordering": "match", "page": 2}).json()
+        self.assertEqual(first["count"], 13)
+        ids = [row["id"] for row in first["results"] + second["results"]]
+        self.assertEqual(ids[:2], [self.both.pk, self.one.pk])
+        self.assertEqual(sorted(ids), sorted([self.none.pk, self.both.pk, self.one.pk] + [a.pk for a in newer]))
+        self.assertGreater(first["results"][0]["match_score"], first["results"][1]["match_score"])
+        self.assertEqual(second["results"][-1]["match_score"], 0.0)
+
+
+class CandidateMatrixCacheTests(ApplicationsTestMixin, APITestCase):
+    def setUp(self):
+        super().setUp()
+        matching._cache.update(matrix=None, built_at=0.0, version=0, built_version=-1)
+        self._seeker("first", ["python"])
+
+    def test_profile_change_does_not_rebuild_within_interval(self):
+        matrix = matching.get_candidate_matrix()
+        self._seeker("second", ["django"])  # signal versiyani oshiradi
+        self.assertIs(matching.get_candidate_matrix(), matrix)
+
+        with patch.object(matching, "MATRIX_REBUILD_INTERVAL", 0):
+            rebuilt = matching.get_candidate_matrix()
+        self.assertIsNot(rebuilt, matrix)
+        self.assertEqual(len(rebuilt), 2)
+        self.assertIs(matching.get_candidate_matrix(), rebuilt)
+
+
+class BulkStatusTests(ApplicationsTestMixin, APITestCase):
+    url = "/api/applications/status/bulk/"
+
+    def setUp(self):
+        super().setUp()
+        self.client.force_authenticate(self.employer)
+        self.apps = [self._apply(self._seeker(f"seeker{i}")) for i in range(3)]
+        self.other_employer = CustomUser.objects.create_user(
+            username="other", email="other@example.com", password="x", role="EMPLOYER"
+        )
+        self.other_job = JobPost.objects.create(employer=self.other_employer, title="Other job")
+        self.foreign = self._apply(self._seeker("foreign"), job=self.other_job)
+
+    def _post(self, **body):
+        return self.client.post(self.url, body, format="json")
+
+    def _statuses(self):
+        return dict(JobApplication.objects.values_list("pk", "status"))
+
+    def test_foreign_ids_are_not_found(self):
+        ids = [self.apps[0].pk, self.foreign.pk, 999999]
+        response = self._post(status=ApplicationStatus.SHORTLISTED, ids=ids)
+
+        self.assertEqual(response.status_code, 200)
+        data = response.json()
+        self.assertEqual(data["not_found"], [self.foreign.pk, 999999])
+        self.assertEqual((data["matched"], data["updated"]), (1, 1))
+        self.assertEqual(self._statuses()[self.foreign.pk], ApplicationStatus.APPLIED)
+        self.assertEqual(data["funnel"][str(self.job.pk)]["SHORTLISTED"], 1)
+
+    def test_foreign_job_is_forbidden(self):
+        response = self._post(status=ApplicationStatus.REJECTED, job=self.other_job.pk)
+        self.assertEqual(response.status_code, 403)
+        self.assertEqual(self._statuses()[self.foreign.pk], ApplicationStatus.APPLIED)
+        self.assertFalse(ApplicationStatusChange.objects.exists())
+
+    def test_history_row_per_change(self):
+        response = self._post(status=ApplicationStatus.REJECTED, job=self.job.pk,
+                              from_status=ApplicationStatus.APPLIED)
+        self.assertEqual(response.json()["updated"], 3)
+
+        history = ApplicationStatusChange.objects.order_by("application_id")
+        self.assertEqual(
+            list(history.values_list("application_id", "from_status", "to_status", "changed_by")),
+            [(app.pk, "APPLIED", "REJECTED", self.employer.pk) for app in self.apps],
+        )
+
+    def test_unchanged_rows_are_not_updated(self):
+        JobApplication.objects.filter(pk=self.apps[0].pk).update(status=ApplicationStatus.SHORTLISTED)
+
+        result = transition(self.employer, ApplicationStatus.SHORTLISTED, ids=[app.pk for app in self.apps])
+        self.assertEqual(len(result.rows), 3)
+        self.assertEqual([pk for pk, _, _ in result.changed], [self.apps[1].pk, self.apps[2].pk])
+        self.assertEqual(set(ApplicationStatusChange.objects.values_list("application_id", flat=True)),
+                         {self.apps[1].pk, self.apps[2].pk})
+
+        with CaptureQueriesContext(connection) as ctx:
+            result = transition(self.employer, ApplicationStatus.SHORTLISTED, ids=[app.pk for app in self.apps])
+        self.assertEqual(result.changed, [])
+        self.assertFalse([q for q in ctx.captured_queries if q["sql"].startswith(("UPDATE", "INSERT"))])
+        self.assertEqual(ApplicationStatusChange.objects.count(), 2)
+
+
+class DashboardInvalidationTests(ApplicationsTestMixin, APITestCase):
+    def setUp(self):
+        super().setUp()
+        self.second_job = JobPost.objects.create(employer=self.employer, title="Frontend developer")
+        self.seeker = self._seeker("seeker")
+        self._apply(self.seeker)
+        self._apply(self.seeker, job=self.second_job)
+        self._apply(self._seeker("another"))
+        self.key = DASHBOARD_KEY.format(self.employer.pk)
+        cache.set(self.key, {"cached": True})
+        self.addCleanup(cache.delete, self.key)
+
+    def _employer_lookups(self, ctx):
+        return [q for q in ctx.captured_queries
+                if q["sql"].startswith('SELECT DISTINCT "vacancies_jobpost"."employer_id"')
+                or q["sql"].startswith('SELECT "vacancies_jobpost"."employer_id"')]
+
+    def test_bulk_delete_looks_up_employers_once(self):
+        with CaptureQueriesContext(connection) as ctx, self.captureOnCommitCallbacks(execute=True):
+            deleted = JobApplication.objects.filter(applicant__username__in=["seeker", "another"]).delete()
+        self.assertEqual(deleted[1]["applications.JobApplication"], 3)
+        self.assertEqual(len(self._employer_lookups(ctx)), 1)
+        self.assertIsNone(cache.get(self.key))
+
+    def test_cascade_from_job_post_skips_application_work(self):
+        with CaptureQueriesContext(connection) as ctx, self.captureOnCommitCallbacks(execute=True):
+            self.job.delete()
+        self.assertEqual(self._employer_lookups(ctx), [])
+        self.assertIsNone(cache.get(self.key))
+
+    def test_applicant_delete_invalidates_dashboard(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            self.seeker.delete()
+        self.assertIsNone(cache.get(self.key))
+
+
+class ApplicationsExportTests(ApplicationsTestMixin, APITestCase):
+    url = "/api/applications/my/applications/export/"
+
+    def setUp(self):
+        super().setUp()
+        self.client.force_authenticate(self.employer)
+        seeker = CustomUser.objects.create_user(
+            username="evil", email="=cmd@example.com", password="x", role="JOB_SEEKER",
+            first_name="\t=1+1", last_name="\r@SUM(A1)", title="+Engineer", salary_usd=1500,
+        )
+        Skill.objects.create(user=seeker, name="-python")
+        self.application = JobApplication.objects.create(
+            job_post=self.job, applicant=seeker, cover_letter='=HYPERLINK("http://x","y")'
+        )
+        self._apply(self._seeker("plain", ["django"]))
+
+    def _download(self, fmt):
+        response = self.client.get(self.url, {"file_format": fmt})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response["Content-Type"], export.CONTENT_TYPES[fmt])
+        return b"".join(response.streaming_content)
+
+    def test_csv_neutralizes_formula_prefixes(self):
+        rows = list(csv.DictReader(io.StringIO(self._download("csv").decode())))
+        self.assertEqual(len(rows), 2)
+        row = next(row for row in rows if row["application_id"] == str(self.application.pk))
+        self.assertEqual(row["cover_letter"], '\'=HYPERLINK("http://x","y")')
+        self.assertEqual(row["first_name"], "'\t=1+1")
+        self.assertEqual(row["last_name"], "'\r@SUM(A1)")
+        self.assertEqual(row["email"], "'=cmd@example.com")
+        self.assertEqual(row["position"], "'+Engineer")
+        self.assertEqual(row["skills"], "'-python")
+        self.assertEqual(row["status"], "APPLIED")
+        self.assertEqual(row["salary_usd"], "1500.00")
+
+    def test_xlsx_is_a_valid_package(self):
+        archive = zipfile.ZipFile(io.BytesIO(self._download("xlsx")))
+        self.assertIsNone(archive.testzip())
+        self.assertEqual(set(archive.namelist()), {
+            "[Content_Types].xml", "_rels/.rels", "xl/workbook.xml", "xl/_rels/workbook.xml.rels",
+            "xl/worksheets/sheet1.xml",
+        })
+        for name in archive.namelist():
+            ElementTree.fromstring(archive.read(name))  # har bir qism to'g'ri XML
+
+        ns = {"s": "http://schemas.openxmlformats.org/spreadsheetml/2006/main"}
+        sheet = ElementTree.fromstring(archive.read("xl/worksheets/sheet1.xml"))
+        rows = sheet.findall("s:sheetData/s:row", ns)
+        self.assertEqual([row.get("r") for row in rows], ["1", "2", "3"])
+        self.assertEqual([t.text for t in rows[0].findall(".//s:t", ns)], export.HEADER)
+        self.assertFalse(sheet.findall(".//s:f", ns))  # formula yo'q — matn inline satr
+        texts = [t.text for t in sheet.findall(".//s:t", ns)]
+        self.assertIn('=HYPERLINK("http://x","y")', texts)
 
-# Create your tests here.
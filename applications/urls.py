@@ -4,6 +4,10 @@ from .views import (
     JobApplicationDetailView, CancelMyApplicationView,
     EmployerAllApplicationsView,
     ApplicationApplicantView,   # <-- qo‘shish
+    JobTopCandidatesView,
+    ApplicationBulkStatusView,
+    EmployerDashboardView,
+    EmployerApplicationsExportView,
 )
 
 urlpatterns = [
@@ -13,5 +17,9 @@ urlpatterns = [
     path("<int:pk>/", JobApplicationDetailView.as_view(), name="job-application-detail"),
     path("<int:pk>/applicant/", ApplicationApplicantView.as_view(), name="application-applicant"),  # NEW
     path("jobs/<int:job_id>/mine/", CancelMyApplicationView.as_view(), name="cancel-my-application"),
+    path("jobs/<int:job_id>/top-candidates/", JobTopCandidatesView.as_view(), name="job-top-candidates"),
+    path("status/bulk/", ApplicationBulkStatusView.as_view(), name="application-bulk-status"),
     path("my/applications/", EmployerAllApplicationsView.as_view(), name="employer-all-applications"),
+    path("my/applications/export/", EmployerApplicationsExportView.as_view(), name="employer-applications-export"),
+    path("my/dashboard/", EmployerDashboardView.as_view(), name="employer-dashboard"),
 ]
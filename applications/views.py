@@ -1,14 +1,23 @@
-from django.core.exceptions import PermissionDenied
+from django.http import StreamingHttpResponse
 from django.shortcuts import get_object_or_404
 from rest_framework import generics, status
+from rest_framework.exceptions import PermissionDenied
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
+from accounts.models import CustomUser
+from accounts.snapshots import APPLICANT, profile_snapshot
+from headhunter_backend.view_counters import record_view
+from resume.models import Resume
 from vacancies.models import JobPost
-from .models import JobApplication
-from .serializers import JobApplicationSerializer, ApplicantMiniSerializer, ApplicantFullSerializer
+from . import export
+from .dashboard import cached_dashboard
+from .matching import get_candidate_matrix, rank_applications
+from .models import ApplicationStatus, JobApplication
+from .serializers import JobApplicationSerializer, ApplicantMiniSerializer
 from .permissions import IsJobSeeker, IsEmployerOfJob, CanDeleteApplication, IsEmployer
+from .status import MAX_IDS, funnel, transition
 
 
 class ApplyView(APIView):
@@ -30,8 +39,8 @@ class ApplyView(APIView):
         if getattr(job, "employer_id", None) == request.user.id:
             return Response({"detail": "O‘zingiz yaratgan vakansiyaga apply qilib bo‘lmaydi."}, status=400)
 
-        # Job aktiv tekshir (ixtiyoriy)
-        if hasattr(job, "is_active") and not job.is_active:
+        # Yopiq (muddati o'tgan / to'ldirilgan) vakansiyaga ariza yo'q — JobPost.is_active
+        if not job.is_active:
             return Response({"detail": "Vakansiya faol emas."}, status=400)
 
         obj, created = JobApplication.objects.get_or_create(
@@ -45,7 +54,33 @@ class ApplyView(APIView):
         return Response(JobApplicationSerializer(obj).data, status=status.HTTP_201_CREATED)
 
 
-class JobApplicationsForEmployerView(generics.ListAPIView):
+class MatchOrderingMixin:
+    """
+    ?ordering=match — arizalar nomzodning vakansiyaga mosligi bo'yicha (matching.py).
+    Filtrdagi barcha arizalar (id, nomzod) juftlari bo'yicha vektorli baholanib saralanadi,
+    to'liq obyektlar faqat joriy sahifa uchun yuklanadi — count va sahifalar to'liq.
+    """
+
+    def list(self, request, *args, **kwargs):
+        if request.query_params.get("ordering") != "match":
+            return super().list(request, *args, **kwargs)
+
+        queryset = self.filter_queryset(self.get_queryset())
+        ranked = rank_applications(queryset)
+        page = self.paginate_queryset(ranked)
+        selected = page if page is not None else ranked
+        scores = dict(selected)
+        objects = queryset.in_bulk(list(scores))
+        applications = [objects[pk] for pk, _ in selected if pk in objects]
+
+        context = {**self.get_serializer_context(), "match_scores": scores}
+        data = self.serializer_class(applications, many=True, context=context).data
+        if page is not None:
+            return self.get_paginated_response(data)
+        return Response(data)
+
+
+class JobApplicationsForEmployerView(MatchOrderingMixin, generics.ListAPIView):
     serializer_class = JobApplicationSerializer
     permission_classes = [IsAuthenticated]
 
@@ -54,7 +89,6 @@ class JobApplicationsForEmployerView(generics.ListAPIView):
         job = get_object_or_404(JobPost, pk=job_id)
         checker = IsEmployerOfJob()
         if not checker.has_object_permission(self.request, self, job):
-            from rest_framework.exceptions import PermissionDenied
             raise PermissionDenied(checker.message)
 
         return (
@@ -73,7 +107,7 @@ class JobApplicationDetailView(generics.RetrieveDestroyAPIView):
     serializer_class = JobApplicationSerializer
     permission_classes = [IsAuthenticated, CanDeleteApplication]
 
-class EmployerAllApplicationsView(generics.ListAPIView):
+class EmployerAllApplicationsView(MatchOrderingMixin, generics.ListAPIView):
     serializer_class = JobApplicationSerializer
     permission_classes = [IsAuthenticated, IsEmployer]
 
@@ -98,6 +132,107 @@ class EmployerAllApplicationsView(generics.ListAPIView):
             qs = qs.filter(job_post_id=job_id)
         return qs
 
+class ApplicationBulkStatusView(APIView):
+    """
+    POST /api/applications/status/bulk/
+    body: { "status": "SHORTLISTED", "ids": [1, 2, 3] }
+      yoki { "status": "REJECTED", "job": <id>, "from_status": "APPLIED" }  # job'ning barcha APPLIED arizalari
+    Faqat o'z vakansiyalaridagi arizalar; javobda ta'sirlangan vakansiyalar funnel'i.
+    """
+    permission_classes = [IsAuthenticated, IsEmployer]
+
+    def post(self, request):
+        statuses = ApplicationStatus.values
+        to_status = request.data.get("status")
+        if to_status not in statuses:
+            return Response({"detail": f"status: {', '.join(statuses)}"}, status=400)
+        from_status = request.data.get("from_status") or None
+        if from_status is not None and from_status not in statuses:
+            return Response({"detail": f"from_status: {', '.join(statuses)}"}, status=400)
+
+        ids = request.data.get("ids")
+        job_id = request.data.get("job") or None
+        if ids is None and job_id is None:
+            return Response({"detail": "ids yoki job kiritilmadi."}, status=400)
+        if ids is not None:
+            if not isinstance(ids, list) or not ids:
+                return Response({"detail": "ids bo‘sh bo‘lmagan ro‘yxat bo‘lishi kerak."}, status=400)
+            if len(ids) > MAX_IDS:
+                return Response({"detail": f"Bir so‘rovda ko‘pi bilan {MAX_IDS} ta ariza."}, status=400)
+            try:
+                ids = list(dict.fromkeys(int(pk) for pk in ids))
+            except (TypeError, ValueError):
+                return Response({"detail": "ids butun sonlar bo‘lishi kerak."}, status=400)
+        if job_id is not None:
+            try:
+                job_id = int(job_id)
+            except (TypeError, ValueError):
+                return Response({"detail": "job butun son bo‘lishi kerak."}, status=400)
+            job = get_object_or_404(JobPost, pk=job_id)
+            checker = IsEmployerOfJob()
+            if not checker.has_object_permission(request, self, job):
+                raise PermissionDenied(checker.message)
+
+        result = transition(request.user, to_status, ids=ids, job_id=job_id, from_status=from_status)
+        job_ids = result.job_ids | ({job_id} if job_id is not None else set())
+        data = {
+            "status": to_status,
+            "matched": len(result.rows),
+            "updated": len(result.changed),
+            "funnel": {str(pk): counts for pk, counts in funnel(job_ids).items()},
+        }
+        if ids is not None:
+            data["not_found"] = result.missing(ids)
+        return Response(data, status=200)
+
+
+class EmployerApplicationsExportView(APIView):
+    """
+    GET /api/applications/my/applications/export/?file_format=csv|xlsx&job=<id>&status=APPLIED
+    Employer'ning barcha (yoki bitta vakansiyadagi) arizalari — javob oqim bilan yuboriladi,
+    ro'yxat xotiraga yuklanmaydi (export.py).
+    """
+    permission_classes = [IsAuthenticated, IsEmployer]
+
+    def get(self, request):
+        fmt = request.query_params.get("file_format", "csv")
+        if fmt not in export.FORMATS:
+            return Response({"detail": f"file_format: {', '.join(export.FORMATS)}"}, status=400)
+        queryset = JobApplication.objects.filter(job_post__employer=request.user)
+        filename = "applications"
+
+        job_id = request.query_params.get("job")
+        if job_id:
+            try:
+                job_id = int(job_id)
+            except (TypeError, ValueError):
+                return Response({"detail": "job butun son bo‘lishi kerak."}, status=400)
+            queryset = queryset.filter(job_post_id=job_id)
+            filename = f"applications-job-{job_id}"
+        status_filter = request.query_params.get("status")
+        if status_filter:
+            if status_filter not in ApplicationStatus.values:
+                return Response({"detail": f"status: {', '.join(ApplicationStatus.values)}"}, status=400)
+            queryset = queryset.filter(status=status_filter)
+
+        response = StreamingHttpResponse(export.export_applications(queryset, fmt),
+                                         content_type=export.CONTENT_TYPES[fmt])
+        response["Content-Disposition"] = f'attachment; filename="{filename}.{fmt}"'
+        return response
+
+
+class EmployerDashboardView(APIView):
+    """
+    GET /api/applications/my/dashboard/
+    Barcha vakansiyalar bo'yicha holatlar funnel'i, birinchi arizagacha vaqt va
+    oxirgi 30 kunlik arizalar soni (dashboard.py, keshlangan).
+    """
+    permission_classes = [IsAuthenticated, IsEmployer]
+
+    def get(self, request):
+        return Response(cached_dashboard(request.user.pk), status=200)
+
+
 class CancelMyApplicationView(APIView):
     """
     DELETE /api/applications/jobs/<int:job_id>/mine/
@@ -115,22 +250,57 @@ class ApplicationApplicantView(APIView):
     permission_classes = [IsAuthenticated]
 
     def get(self, request, pk: int):
-        qs = (JobApplication.objects
-              .select_related("job_post", "applicant")
-              .prefetch_related(
-                  "applicant__skills",
-                  "applicant__languages",
-                  "applicant__educations",
-                  "applicant__portfolio_projects__media_files",
-                  "applicant__certificates",
-                  "applicant__experiences",
-              ))
-        app = get_object_or_404(qs, pk=pk)
+        app = get_object_or_404(JobApplication.objects.select_related("job_post"), pk=pk)
 
         checker = IsEmployerOfJob()
         if not checker.has_object_permission(request, self, app.job_post):
-            from rest_framework.exceptions import PermissionDenied
             raise PermissionDenied(getattr(checker, "message", "Ruxsat yo‘q"))
 
-        data = ApplicantFullSerializer(app.applicant, context={"request": request}).data
-        return Response(data, status=200)
\ No newline at end of file
+        # employer nomzod profilini ochdi — uning faol rezyumesi ko'rildi
+        resume_id = (Resume.objects
+                     .filter(user_id=app.applicant_id, is_active=True)
+                     .order_by("-updated_at")
+                     .values_list("pk", flat=True)
+                     .first())
+        record_view("resume.Resume", resume_id)
+
+        data = profile_snapshot(app.applicant_id, APPLICANT, request)
+        return Response(data, status=200)
+
+
+class JobTopCandidatesView(APIView):
+    """
+    GET /api/applications/jobs/<int:job_id>/top-candidates/?limit=20
+    Barcha JOB_SEEKER'lar orasidan vakansiyaga eng mos nomzodlar (faqat job egasi uchun).
+    """
+    permission_classes = [IsAuthenticated]
+    default_limit = 20
+    max_limit = 100
+
+    def get(self, request, job_id: int):
+        job = get_object_or_404(JobPost, pk=job_id)
+        checker = IsEmployerOfJob()
+        if not checker.has_object_permission(request, self, job):
+            raise PermissionDenied(checker.message)
+
+        try:
+            limit = int(request.query_params.get("limit", self.default_limit))
+        except (TypeError, ValueError):
+            return Response({"detail": "limit butun son bo‘lishi kerak."}, status=400)
+        limit = max(1, min(limit, self.max_limit))
+
+        top = get_candidate_matrix().top(job, limit, exclude=[job.employer_id])
+        users = CustomUser.objects.in_bulk([user_id for user_id, _, _ in top])
+        applied = set(
+            JobApplication.objects
+            .filter(job_post=job, applicant_id__in=users.keys())
+            .values_list("applicant_id", flat=True)
+        )
+        top = [item for item in top if item[0] in users]  # matritsa keshi eskirgan bo'lishi mumkin
+        rows = ApplicantMiniSerializer([users[user_id] for user_id, _, _ in top], many=True,
+                                       context={"request": request}).data
+        results = []
+        for row, (user_id, score, matched) in zip(rows, top):
+            row.update(match_score=score, matched=matched, applied=user_id in applied)
+            results.append(row)
+        return Response({"job": {"id": job.id, "title": job.title}, "results": results}, status=200)
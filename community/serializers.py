@@ -1,4 +1,6 @@
 from rest_framework import serializers
+
+from headhunter_backend.viewer_state import ViewerStateListSerializer, register_relation, viewer_state
 from .models import Post, Comment
 
 class CommentSerializer(serializers.ModelSerializer):
@@ -10,6 +12,13 @@ class CommentSerializer(serializers.ModelSerializer):
         read_only_fields = ["author", "created_at"]
 
 
+def _liked_posts(user, ids):
+    return dict.fromkeys(Post.objects.filter(pk__in=ids, likes=user).values_list("pk", flat=True), True)
+
+
+register_relation("post_like", _liked_posts)
+
+
 class PostSerializer(serializers.ModelSerializer):
     # ✅ Front friendly author object
     author = serializers.SerializerMethodField()
@@ -37,6 +46,8 @@ class PostSerializer(serializers.ModelSerializer):
             "shares_count",
         ]
         read_only_fields = ["created_at", "updated_at", "likes_count", "comments_count", "is_liked", "is_owner"]
+        list_serializer_class = ViewerStateListSerializer
+        viewer_relations = ("post_like",)
 
     def get_author(self, obj):
         u = obj.author
@@ -72,11 +83,7 @@ class PostSerializer(serializers.ModelSerializer):
         return {"id": u.id, "full_name": full_name, "avatar": avatar}
 
     def get_is_liked(self, obj):
-        request = self.context.get("request")
-        user = getattr(request, "user", None)
-        if not user or not user.is_authenticated:
-            return False
-        return obj.likes.filter(id=user.id).exists()
+        return viewer_state(self.context.get("request")).get("post_like", obj.pk, False)
 
     def get_is_owner(self, obj):
         request = self.context.get("request")
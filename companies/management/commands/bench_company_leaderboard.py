@@ -0,0 +1,84 @@
+import statistics
+import time
+
+import numpy as np
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+from django.test.utils import CaptureQueriesContext
+
+from accounts.models import CustomUser
+from companies.management.commands.bench_company_stats import legacy_stats
+from companies.models import LEADERBOARDS, Company, CompanyStats
+
+# eski /top/ tartiblari (annotatsiya bo'yicha — butun jadval saralanadi)
+ANNOTATION_ORDERING = {
+    "followers": ("-followers_count", "id"),
+    "rating": ("-avg_rating", "-reviews_count", "id"),
+    "open_vacancies": ("-open_vacancies_count", "id"),
+}
+
+
+class _Rollback(Exception):
+    pass
+
+
+class Command(BaseCommand):
+    help = ("/companies/top/: annotatsiya + ORDER BY (butun jadval) va CompanyStats indeksidan "
+            "O(limit) leaderboard. --companies ta kompaniya (rollback).")
+
+    def add_arguments(self, parser):
+        parser.add_argument("--companies", type=int, default=100_000)
+        parser.add_argument("--limit", type=int, default=10)
+        parser.add_argument("--repeat", type=int, default=5)
+        parser.add_argument("--seed", type=int, default=7)
+
+    def handle(self, *args, **options):
+        limit = options["limit"]
+        try:
+            with transaction.atomic():
+                self._seed(options)
+                self.stdout.write(f"{'ranking':<16}{'variant':<30}{'ms (median)':>12}{'queries':>9}")
+                for by in LEADERBOARDS:
+                    variants = [
+                        ("eski JOIN + COUNT DISTINCT",
+                         lambda: list(legacy_stats(Company.objects.all()).order_by(*ANNOTATION_ORDERING[by])[:limit])),
+                        ("with_stats + ORDER BY",
+                         lambda: list(Company.objects.with_stats().order_by(*ANNOTATION_ORDERING[by])[:limit])),
+                        ("leaderboard (indeks)",
+                         lambda: list(Company.objects.with_stats().in_bulk(CompanyStats.leaderboard(by, limit)))),
+                    ]
+                    for label, run in variants:
+                        ms, queries = self._measure(run, options["repeat"])
+                        self.stdout.write(f"{by:<16}{label:<30}{ms:>12.2f}{queries:>9}")
+                raise _Rollback
+        except _Rollback:
+            pass
+
+    def _seed(self, options):
+        started = time.perf_counter()
+        n = options["companies"]
+        rng = np.random.default_rng(options["seed"])
+        owner = CustomUser.objects.create_user(username="__bench_leaderboard__", password=None)
+        companies = Company.objects.bulk_create([Company(owner=owner, name=f"Bench {i}") for i in range(n)],
+                                                batch_size=5000)
+        # Zipf — bir nechta juda mashhur, ko'pchilik kichik kompaniyalar
+        followers = np.minimum(rng.zipf(1.5, n), 1_000_000)
+        reviews = rng.integers(0, 200, n)
+        ratings = rng.uniform(1, 5, n)
+        open_vacancies = rng.integers(0, 50, n)
+        CompanyStats.objects.bulk_create([
+            CompanyStats(company=company, followers_count=int(followers[i]), reviews_count=int(reviews[i]),
+                         rating_sum=int(reviews[i] * ratings[i]), avg_rating=float(ratings[i]) if reviews[i] else 0,
+                         vacancies_count=int(open_vacancies[i]), open_vacancies_count=int(open_vacancies[i]))
+            for i, company in enumerate(companies)
+        ], batch_size=5000)
+        self.stdout.write(f"seed: {n} ta kompaniya, {time.perf_counter() - started:.1f}s")
+
+    def _measure(self, run, repeat):
+        timings = []
+        for _ in range(repeat):
+            with CaptureQueriesContext(connection) as ctx:
+                started = time.perf_counter()
+                run()
+                timings.append((time.perf_counter() - started) * 1000)
+        return statistics.median(timings), len(ctx.captured_queries)
@@ -0,0 +1,113 @@
+import statistics
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+from django.db.models import Avg, Count, Q, Value
+from django.db.models.functions import Coalesce
+from django.test.utils import CaptureQueriesContext
+from rest_framework.renderers import JSONRenderer
+
+from accounts.models import CustomUser
+from companies.models import Company, CompanyFollow, CompanyReview, CompanyStats
+from companies.serializers import CompanySerializer
+from vacancies.models import JobPost
+
+
+def legacy_stats(qs):
+    """Oldingi with_stats(): reviews × follows × job_posts JOIN + COUNT DISTINCT."""
+    return qs.annotate(
+        reviews_count=Count("reviews", distinct=True),
+        followers_count=Count("follows", distinct=True),
+        vacancies_count=Count("job_posts", distinct=True),
+        open_vacancies_count=Count("job_posts", filter=Q(job_posts__is_closed=False), distinct=True),
+        filled_vacancies_count=Count("job_posts", filter=Q(job_posts__is_filled=True), distinct=True),
+        avg_rating=Coalesce(Avg("reviews__rating"), Value(0.0)),
+    )
+
+
+# eski so'rov katta kompaniyada followers × reviews × jobs qator yig'adi (1000 ta'da ~10s, sqlite)
+LEGACY_LIMIT = 2000
+
+
+class _Rollback(Exception):
+    pass
+
+
+class Command(BaseCommand):
+    help = ("Kompaniyalar ro'yxati va /top/: JOIN + COUNT DISTINCT (eski) va CompanyStats (yangi). "
+            "--big ta kompaniyada --followers ta follower va review (rollback).")
+
+    def add_arguments(self, parser):
+        parser.add_argument("--companies", type=int, default=20)
+        parser.add_argument("--big", type=int, default=2, help="katta kompaniyalar soni")
+        parser.add_argument("--followers", type=int, default=10_000)
+        parser.add_argument("--jobs", type=int, default=5, help="har bir kompaniyadagi vakansiyalar")
+        parser.add_argument("--repeat", type=int, default=5)
+        parser.add_argument("--legacy", action="store_true",
+                            help=f"eski so'rovni majburan o'lchash (default: followers <= {LEGACY_LIMIT} bo'lsa)")
+
+    def handle(self, *args, **options):
+        try:
+            with transaction.atomic():
+                self._seed(options)
+                self.stdout.write(f"{'variant':<40}{'ms (median)':>10}{'queries':>9}")
+                cases = [("with_stats (CompanyStats)", Company.objects.with_stats)]
+                if options["legacy"] or options["followers"] <= LEGACY_LIMIT:
+                    cases.insert(0, ("eski JOIN + COUNT DISTINCT", lambda: legacy_stats(Company.objects.all())))
+                else:
+                    self.stdout.write(f"eski so'rov o'tkazib yuborildi (followers > {LEGACY_LIMIT}; --legacy)")
+                for label, make_qs in cases:
+                    for name, build in (("list", lambda qs: qs.order_by("id")[:options["companies"]]),
+                                        ("top", lambda qs: qs.order_by("-followers_count", "id")[:5])):
+                        ms, queries = self._measure(lambda: build(make_qs()), options["repeat"])
+                        self.stdout.write(f"{label + ' ' + name:<40}{ms:>10.2f}{queries:>9}")
+                self._measure_writes(options)
+                raise _Rollback
+        except _Rollback:
+            pass
+
+    def _seed(self, options):
+        started = time.perf_counter()
+        owner = CustomUser.objects.create_user(username="__bench_company_owner__", password=None)
+        companies = Company.objects.bulk_create([
+            Company(owner=owner, name=f"Bench {i}") for i in range(options["companies"])
+        ])
+        users = CustomUser.objects.bulk_create([
+            CustomUser(username=f"__bench_company_{i}__", password="!") for i in range(options["followers"])
+        ], batch_size=2000)
+        for company in companies[:options["big"]]:
+            CompanyFollow.objects.bulk_create([CompanyFollow(company=company, user=u) for u in users], batch_size=2000)
+            CompanyReview.objects.bulk_create([
+                CompanyReview(company=company, user=u, rating=1 + i % 5) for i, u in enumerate(users)
+            ], batch_size=2000)
+        JobPost.objects.bulk_create([
+            JobPost(employer=owner, company=company, title="Bench", budget_min=1, budget_max=2)
+            for company in companies for _ in range(options["jobs"])
+        ])
+        # bulk_create signal yubormaydi
+        CompanyStats.rebuild([c.pk for c in companies])
+        self.stdout.write(f"seed: {time.perf_counter() - started:.1f}s")
+
+    def _measure(self, make_queryset, repeat):
+        timings = []
+        for _ in range(repeat):
+            with CaptureQueriesContext(connection) as ctx:
+                started = time.perf_counter()
+                data = CompanySerializer(list(make_queryset()), many=True).data
+                JSONRenderer().render(data)
+                timings.append((time.perf_counter() - started) * 1000)
+        return statistics.median(timings), len(ctx.captured_queries)
+
+    def _measure_writes(self, options):
+        # follow/unfollow narxi: signal bitta UPDATE qo'shadi
+        company = Company.objects.order_by("id").first()
+        users = list(CustomUser.objects.filter(username__startswith="__bench_company_")[:200])
+        started = time.perf_counter()
+        for user in users:
+            CompanyFollow.objects.filter(company=company, user=user).delete()
+            CompanyFollow.objects.create(company=company, user=user)
+        ms = (time.perf_counter() - started) * 1000 / max(len(users), 1)
+        fresh = CompanyStats.collect([company.pk])[company.pk].as_tuple()
+        stored = CompanyStats.objects.get(pk=company.pk).as_tuple()
+        self.stdout.write(f"unfollow+follow (signal bilan): {ms:.2f} ms; stats mos: {fresh == stored}")
@@ -0,0 +1,35 @@
+from django.core.management.base import BaseCommand
+
+from companies.models import Company, CompanyStats
+
+
+class Command(BaseCommand):
+    help = ("CompanyStats ni reviews / follows / job_posts dan qayta hisoblaydi (batch bilan). "
+            "--check — faqat farqlarni ko'rsatadi, yozmaydi.")
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=1000)
+        parser.add_argument("--check", action="store_true")
+
+    def handle(self, *args, **options):
+        batch_size = options["batch_size"]
+        last_id = 0
+        total = drifted = 0
+        while True:
+            ids = list(Company.objects.filter(pk__gt=last_id).order_by("pk").values_list("pk", flat=True)[:batch_size])
+            if not ids:
+                break
+            fresh = CompanyStats.collect(ids)
+            stored = {stats.pk: stats.as_tuple() for stats in CompanyStats.objects.filter(pk__in=ids)}
+            stale = [pk for pk, stats in fresh.items() if stored.get(pk) != stats.as_tuple()]
+            for pk in stale[:20] if options["check"] else ():
+                self.stdout.write(f"  company={pk}: saqlangan={stored.get(pk)} haqiqiy={fresh[pk].as_tuple()}")
+            if stale and not options["check"]:
+                CompanyStats.rebuild(stale)
+            total += len(ids)
+            drifted += len(stale)
+            last_id = ids[-1]
+            self.stdout.write(f"... {total} ta kompaniya, {drifted} tasida farq")
+
+        action = "topildi" if options["check"] else "tuzatildi"
+        self.stdout.write(self.style.SUCCESS(f"Tayyor: {total} ta kompaniya, {drifted} ta farq {action}"))
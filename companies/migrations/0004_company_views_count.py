@@ -0,0 +1,18 @@
+# Generated by Django 5.2.4 on 2026-10-18 07:59
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('companies', '0003_alter_companyfollow_unique_together_and_more'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='company',
+            name='views_count',
+            field=models.PositiveIntegerField(default=0),
+        ),
+    ]
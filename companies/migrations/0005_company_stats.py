@@ -0,0 +1,56 @@
+# Generated by Django 5.2.4 on 2026-10-18 08:09
+
+import django.db.models.deletion
+from django.db import migrations, models
+from django.db.models import Count, Q, Sum
+
+
+def populate(apps, schema_editor):
+    Company = apps.get_model('companies', 'Company')
+    CompanyStats = apps.get_model('companies', 'CompanyStats')
+    CompanyReview = apps.get_model('companies', 'CompanyReview')
+    CompanyFollow = apps.get_model('companies', 'CompanyFollow')
+    JobPost = apps.get_model('vacancies', 'JobPost')
+
+    stats = {pk: CompanyStats(company_id=pk) for pk in Company.objects.values_list('pk', flat=True)}
+    for row in CompanyReview.objects.values('company_id').annotate(n=Count('id'), total=Sum('rating')):
+        stats[row['company_id']].reviews_count = row['n']
+        stats[row['company_id']].rating_sum = row['total'] or 0
+    for row in CompanyFollow.objects.values('company_id').annotate(n=Count('id')):
+        stats[row['company_id']].followers_count = row['n']
+    for row in (JobPost.objects.filter(company__isnull=False).order_by().values('company_id')
+                .annotate(n=Count('id'), open=Count('id', filter=Q(is_closed=False)),
+                          filled=Count('id', filter=Q(is_filled=True)))):
+        item = stats[row['company_id']]
+        item.vacancies_count = row['n']
+        item.open_vacancies_count = row['open']
+        item.filled_vacancies_count = row['filled']
+    CompanyStats.objects.bulk_create(stats.values(), batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('companies', '0004_company_views_count'),
+        ('vacancies', '0023_jobpost_trending_score'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='CompanyStats',
+            fields=[
+                ('company', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='stats', serialize=False, to='companies.company')),
+                ('reviews_count', models.PositiveIntegerField(default=0)),
+                ('rating_sum', models.PositiveIntegerField(default=0)),
+                ('followers_count', models.PositiveIntegerField(default=0)),
+                ('vacancies_count', models.PositiveIntegerField(default=0)),
+                ('open_vacancies_count', models.PositiveIntegerField(default=0)),
+                ('filled_vacancies_count', models.PositiveIntegerField(default=0)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'indexes': [models.Index(fields=['-followers_count', 'company'], name='companystats_followers_idx')],
+            },
+        ),
+        migrations.RunPython(populate, migrations.RunPython.noop),
+    ]
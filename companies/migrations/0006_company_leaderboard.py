@@ -0,0 +1,36 @@
+# Generated by Django 5.2.4 on 2026-10-18 08:13
+
+from django.db import migrations, models
+from django.db.models import F, FloatField
+from django.db.models.functions import Cast
+
+
+def fill_avg_rating(apps, schema_editor):
+    CompanyStats = apps.get_model('companies', 'CompanyStats')
+    (CompanyStats.objects
+     .filter(reviews_count__gt=0)
+     .update(avg_rating=Cast(F('rating_sum'), FloatField()) / Cast(F('reviews_count'), FloatField())))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('companies', '0005_company_stats'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='companystats',
+            name='avg_rating',
+            field=models.FloatField(default=0),
+        ),
+        migrations.AddIndex(
+            model_name='companystats',
+            index=models.Index(fields=['-avg_rating', '-reviews_count', 'company'], name='companystats_rating_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='companystats',
+            index=models.Index(fields=['-open_vacancies_count', 'company'], name='companystats_open_vac_idx'),
+        ),
+        migrations.RunPython(fill_avg_rating, migrations.RunPython.noop),
+    ]
@@ -1,5 +1,37 @@
 from django.db import models
 from django.conf import settings
+from django.db.models import Count, Exists, F, FloatField, OuterRef, Q, Sum, Value
+from django.db.models.functions import Cast, Coalesce, Greatest, NullIf
+
+STATS_COUNTERS = ("reviews_count", "rating_sum", "followers_count", "vacancies_count",
+                  "open_vacancies_count", "filled_vacancies_count")
+
+# /companies/top/?by= — har biri CompanyStats'dagi indeks tartibi bilan bir xil
+LEADERBOARDS = {
+    "followers": ("-followers_count", "company"),
+    "rating": ("-avg_rating", "-reviews_count", "company"),
+    "open_vacancies": ("-open_vacancies_count", "company"),
+}
+RATING_MIN_REVIEWS = 3  # bitta 5 yulduzli sharh bilan reyting boshiga chiqmasin
+
+
+class CompanyQuerySet(models.QuerySet):
+    def with_stats(self):
+        """
+        CompanySerializer o'qiydigan statistikalar — CompanyStats jadvalidan bitta LEFT JOIN bilan
+        (reviews × follows × job_posts bo'yicha COUNT DISTINCT emas).
+        """
+        counters = {name: Coalesce(F(f"stats__{name}"), Value(0)) for name in STATS_COUNTERS if name != "rating_sum"}
+        return self.annotate(**counters, avg_rating=Coalesce(F("stats__avg_rating"), Value(0.0)))
+
+    def with_viewer(self, user):
+        """is_following ni EXISTS subquery sifatida shu so'rovning o'zida hisoblaydi."""
+        if not user or not user.is_authenticated:
+            return self
+        return self.annotate(
+            viewer_follows=Exists(CompanyFollow.objects.filter(company=OuterRef('pk'), user=user))
+        )
+
 
 class Company(models.Model):
     owner = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name="companies")
@@ -14,11 +46,106 @@ class Company(models.Model):
     description = models.TextField(blank=True)
 
     created_at = models.DateTimeField(auto_now_add=True)
+    # headhunter_backend.view_counters yozadi (batch UPDATE)
+    views_count = models.PositiveIntegerField(default=0)
+
+    objects = CompanyQuerySet.as_manager()
 
     def __str__(self):
         return self.name
 
 
+class CompanyStats(models.Model):
+    """
+    Kompaniya statistikasi (denormalizatsiya). companies/signals.py F() delta'lar bilan yangilaydi,
+    bulk yo'llar va `rebuild_company_stats` buyrug'i rebuild() bilan qayta hisoblaydi. Qo'lda yozilmaydi.
+    """
+    company = models.OneToOneField(Company, on_delete=models.CASCADE, primary_key=True, related_name="stats")
+    reviews_count = models.PositiveIntegerField(default=0)
+    rating_sum = models.PositiveIntegerField(default=0)
+    followers_count = models.PositiveIntegerField(default=0)
+    vacancies_count = models.PositiveIntegerField(default=0)
+    open_vacancies_count = models.PositiveIntegerField(default=0)
+    filled_vacancies_count = models.PositiveIntegerField(default=0)
+    # rating_sum / reviews_count — o'sha UPDATE ichida hisoblanadi (reyting bo'yicha indeks uchun)
+    avg_rating = models.FloatField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        # LEADERBOARDS: /top/ indeksdan birinchi `limit` qatorni o'qiydi (saralash yo'q)
+        indexes = [
+            models.Index(fields=["-followers_count", "company"], name="companystats_followers_idx"),
+            models.Index(fields=["-avg_rating", "-reviews_count", "company"], name="companystats_rating_idx"),
+            models.Index(fields=["-open_vacancies_count", "company"], name="companystats_open_vac_idx"),
+        ]
+
+    @classmethod
+    def apply_delta(cls, company_id, **deltas):
+        """Hisoblagichlarni bitta atomar UPDATE bilan siljitadi (qator yo'q bo'lsa — rebuild tuzatadi)."""
+        deltas = {name: value for name, value in deltas.items() if value}
+        if company_id is None or not deltas:
+            return
+        # Greatest: drift bo'lsa ham manfiyga tushmasin (rebuild tuzatadi)
+        updates = {name: Greatest(F(name) + value, Value(0)) for name, value in deltas.items()}
+        if "rating_sum" in updates or "reviews_count" in updates:
+            new_sum = updates.get("rating_sum", F("rating_sum"))
+            new_count = updates.get("reviews_count", F("reviews_count"))
+            updates["avg_rating"] = Coalesce(
+                Cast(new_sum, FloatField()) / Cast(NullIf(new_count, 0), FloatField()),
+                Value(0.0),
+            )
+        cls.objects.filter(pk=company_id).update(**updates)
+
+    @classmethod
+    def leaderboard(cls, by, limit):
+        """Reytingdagi birinchi `limit` ta company_id — indeks bo'yicha, O(limit)."""
+        qs = cls.objects.all()
+        if by == "rating":
+            qs = qs.filter(reviews_count__gte=RATING_MIN_REVIEWS)
+        return list(qs.order_by(*LEADERBOARDS[by]).values_list("company_id", flat=True)[:limit])
+
+    @classmethod
+    def collect(cls, company_ids, using="default"):
+        """{company_id: CompanyStats} — manbalardan, har bir jadval bo'yicha alohida GROUP BY (fan-out yo'q)."""
+        from vacancies.models import JobPost
+
+        ids = list(Company.objects.using(using).filter(pk__in=company_ids).values_list("pk", flat=True))
+        stats = {pk: cls(company_id=pk) for pk in ids}
+        for row in (CompanyReview.objects.using(using).filter(company_id__in=ids)
+                    .values("company_id").annotate(n=Count("id"), total=Sum("rating"))):
+            stats[row["company_id"]].reviews_count = row["n"]
+            stats[row["company_id"]].rating_sum = row["total"] or 0
+            stats[row["company_id"]].avg_rating = (row["total"] or 0) / row["n"]
+        for row in (CompanyFollow.objects.using(using).filter(company_id__in=ids)
+                    .values("company_id").annotate(n=Count("id"))):
+            stats[row["company_id"]].followers_count = row["n"]
+        for row in (JobPost.objects.using(using).filter(company_id__in=ids).order_by()
+                    .values("company_id")
+                    .annotate(n=Count("id"),
+                              open=Count("id", filter=Q(is_closed=False)),
+                              filled=Count("id", filter=Q(is_filled=True)))):
+            item = stats[row["company_id"]]
+            item.vacancies_count = row["n"]
+            item.open_vacancies_count = row["open"]
+            item.filled_vacancies_count = row["filled"]
+        return stats
+
+    @classmethod
+    def rebuild(cls, company_ids, using="default"):
+        from .stats import invalidate_stats
+
+        stats = cls.collect(company_ids, using=using)
+        cls.objects.using(using).bulk_create(
+            list(stats.values()),
+            update_conflicts=True, unique_fields=["company"], update_fields=[*STATS_COUNTERS, "avg_rating", "updated_at"],
+        )
+        invalidate_stats(stats)
+        return len(stats)
+
+    def as_tuple(self):
+        return tuple(getattr(self, name) for name in STATS_COUNTERS)
+
+
 class CompanyReview(models.Model):
     """Отзывы: 1 user → 1 company ga 1 ta review."""
     company = models.ForeignKey(Company, on_delete=models.CASCADE, related_name="reviews")
@@ -1,9 +1,19 @@
 from rest_framework import serializers
-from .models import Company, CompanyReview, CompanyFollow, CompanyPhoto, InterviewExperience
+from headhunter_backend.view_counters import pending_views
+from headhunter_backend.viewer_state import ViewerStateListSerializer, register_relation, viewer_state
+from .models import Company, CompanyReview, CompanyFollow, CompanyPhoto, CompanyStats, InterviewExperience
 
 # ==== Helper avg rating
 from django.db.models import Avg, Count
 
+def _followed_companies(user, ids):
+    return dict.fromkeys(CompanyFollow.objects.filter(user=user, company_id__in=ids)
+                         .values_list("company_id", flat=True), True)
+
+
+register_relation("company_follow", _followed_companies)
+
+
 class CompanySerializer(serializers.ModelSerializer):
     # Frontend kartalar va “Obzor” uchun statistikalar
     reviews_count = serializers.IntegerField(read_only=True)
@@ -12,6 +22,7 @@ class CompanySerializer(serializers.ModelSerializer):
     avg_rating = serializers.DecimalField(max_digits=3, decimal_places=2, read_only=True)
     logo = serializers.SerializerMethodField()
     is_following    = serializers.SerializerMethodField()
+    views_count = serializers.SerializerMethodField()
 
 
     # Ortiqcha: eski hisob-kitoblar (hire-rate va boshqalar)
@@ -23,41 +34,37 @@ class CompanySerializer(serializers.ModelSerializer):
         model = Company
         fields = '__all__'
         read_only_fields = ['owner', 'created_at']
+        list_serializer_class = ViewerStateListSerializer
+        viewer_relations = ("company_follow",)
+
+    def get_views_count(self, obj):
+        return obj.views_count + pending_views("companies.Company", obj.pk)
+
+    # with_stats() annotatsiyalari bo'lsa — ulardan, aks holda (masalan create javobi) CompanyStats qatoridan.
+    def _stat(self, obj, name):
+        if hasattr(obj, name):
+            return getattr(obj, name)
+        if not hasattr(obj, "_stats_row"):
+            obj._stats_row = CompanyStats.objects.filter(pk=obj.pk).first()
+        return getattr(obj._stats_row, name, 0)
 
-    # Agar senga JobPost modeli company FK bilan ulangan bo‘lsa — shu branch ishlaydi.
     def get_jobpost_count(self, obj):
-        try:
-            from vacancies.models import JobPost
-            return JobPost.objects.filter(company=obj).count()
-        except Exception:
-            # eski kodingda user’ga bog‘langan bo‘lsa — fallback
-            return obj.owner.job_posts.count()
+        return self._stat(obj, "vacancies_count")
 
     def get_open_jobpost_count(self, obj):
-        try:
-            from vacancies.models import JobPost
-            return JobPost.objects.filter(company=obj, is_filled=False).count()
-        except Exception:
-            return obj.owner.job_posts.filter(is_filled=False).count()
+        return self._stat(obj, "open_vacancies_count")
 
     def get_hire_rate(self, obj):
-        try:
-            from vacancies.models import JobPost
-            total = JobPost.objects.filter(company=obj).count()
-            filled = JobPost.objects.filter(company=obj, is_filled=True).count()
-        except Exception:
-            total = obj.owner.job_posts.count()
-            filled = obj.owner.job_posts.filter(is_filled=True).count()
+        total, filled = self._stat(obj, "vacancies_count"), self._stat(obj, "filled_vacancies_count")
         if total == 0:
             return "0%"
         return f"{round((filled / total) * 100)}%"
 
     def get_is_following(self, obj):
-        request = self.context.get("request")
-        user = getattr(request, "user", None)
-        if not user or not user.is_authenticated:
-            return False
-        return CompanyFollow.objects.filter(company=obj, user=user).exists()
+        # with_viewer() annotatsiyasi bo'lsa — undan, aks holda so'rov bo'yicha umumiy ViewerState
+        if hasattr(obj, "viewer_follows"):
+            return obj.viewer_follows
+        return viewer_state(self.context.get("request")).get("company_follow", obj.pk, False)
 
     def get_logo(self, obj):
         if not obj.logo:
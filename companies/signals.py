@@ -0,0 +1,124 @@
+from collections import Counter, defaultdict
+
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
+
+from headhunter_backend.response_cache import COMPANIES, JOBPOSTS, invalidate_on_commit
+from vacancies.models import JobPost
+
+from .models import Company, CompanyFollow, CompanyPhoto, CompanyReview, CompanyStats, InterviewExperience
+from .stats import invalidate_stats
+
+
+@receiver([post_save, post_delete], sender=Company)
+@receiver([post_save, post_delete], sender=CompanyReview)
+@receiver([post_save, post_delete], sender=CompanyFollow)
+def invalidate_company_responses(sender, **kwargs):
+    # vakansiya javoblari kompaniya statistikasini ham o'z ichiga oladi
+    invalidate_on_commit(COMPANIES, JOBPOSTS)
+
+
+@receiver([post_save, post_delete], sender=CompanyPhoto)
+@receiver([post_save, post_delete], sender=InterviewExperience)
+def invalidate_company_gallery_responses(sender, **kwargs):
+    invalidate_on_commit(COMPANIES)
+
+
+@receiver([post_save, post_delete], sender=CompanyReview)
+@receiver([post_save, post_delete], sender=CompanyFollow)
+@receiver([post_save, post_delete], sender=CompanyPhoto)
+@receiver([post_save, post_delete], sender=InterviewExperience)
+def invalidate_company_page_stats(sender, instance, raw=False, **kwargs):
+    if not raw:
+        invalidate_stats([instance.company_id])
+
+
+@receiver(post_delete, sender=Company)
+def invalidate_deleted_company_stats(sender, instance, **kwargs):
+    invalidate_stats([instance.pk])
+
+
+# ---------- CompanyStats ----------
+
+@receiver(post_save, sender=Company)
+def create_company_stats(sender, instance, created=False, raw=False, **kwargs):
+    if created and not raw:
+        CompanyStats.objects.get_or_create(company=instance)
+
+
+@receiver(post_save, sender=CompanyFollow)
+def count_follow(sender, instance, created=False, raw=False, **kwargs):
+    if created and not raw:
+        CompanyStats.apply_delta(instance.company_id, followers_count=1)
+
+
+@receiver(post_delete, sender=CompanyFollow)
+def uncount_follow(sender, instance, **kwargs):
+    CompanyStats.apply_delta(instance.company_id, followers_count=-1)
+
+
+@receiver(pre_save, sender=CompanyReview)
+def remember_review_rating(sender, instance, raw=False, **kwargs):
+    # tahrirda eski bahoni ayirish uchun
+    if instance.pk and not raw:
+        instance._stats_old_rating = (CompanyReview.objects.filter(pk=instance.pk)
+                                      .values_list("rating", flat=True).first())
+
+
+@receiver(post_save, sender=CompanyReview)
+def count_review(sender, instance, created=False, raw=False, **kwargs):
+    if raw:
+        return
+    if created:
+        CompanyStats.apply_delta(instance.company_id, reviews_count=1, rating_sum=instance.rating)
+        return
+    old = getattr(instance, "_stats_old_rating", None)
+    if old is not None:
+        CompanyStats.apply_delta(instance.company_id, rating_sum=instance.rating - old)
+
+
+@receiver(post_delete, sender=CompanyReview)
+def uncount_review(sender, instance, **kwargs):
+    CompanyStats.apply_delta(instance.company_id, reviews_count=-1, rating_sum=-instance.rating)
+
+
+def _job_post_contribution(company_id, is_closed, is_filled):
+    return company_id, {
+        "vacancies_count": 1,
+        "open_vacancies_count": int(not is_closed),
+        "filled_vacancies_count": int(is_filled),
+    }
+
+
+@receiver(pre_save, sender=JobPost)
+def remember_job_post_stats_state(sender, instance, raw=False, **kwargs):
+    if instance.pk and not raw:
+        instance._stats_old = (JobPost.objects.filter(pk=instance.pk)
+                               .values_list("company_id", "is_closed", "is_filled").first())
+
+
+@receiver(post_save, sender=JobPost)
+def count_job_post(sender, instance, created=False, raw=False, **kwargs):
+    if raw:
+        return
+    new = (instance.company_id, instance.is_closed, instance.is_filled)
+    old = None if created else getattr(instance, "_stats_old", None)
+    if old == new:
+        return
+    # kompaniya o'zgarmagan bo'lsa — bitta UPDATE
+    deltas = defaultdict(Counter)
+    if old is not None:
+        company_id, counters = _job_post_contribution(*old)
+        deltas[company_id].subtract(counters)
+    company_id, counters = _job_post_contribution(*new)
+    deltas[company_id].update(counters)
+    for company_id, counter in deltas.items():
+        CompanyStats.apply_delta(company_id, **counter)
+    invalidate_stats(deltas)
+
+
+@receiver(post_delete, sender=JobPost)
+def uncount_job_post(sender, instance, **kwargs):
+    company_id, counters = _job_post_contribution(instance.company_id, instance.is_closed, instance.is_filled)
+    CompanyStats.apply_delta(company_id, **{name: -value for name, value in counters.items()})
+    invalidate_stats([company_id])
@@ -0,0 +1,69 @@
+# companies/stats.py
+"""
+Kompaniya sahifasi statistikasi (/companies/<id>/stats/).
+
+Bitta so'rov: CompanyStats qatori (JOIN), sharhlar bo'yicha shartli COUNT'lar (1–5
+gistogramma — faqat reviews bilan JOIN, boshqa jadvallar bilan ko'paytma yo'q) va
+rasm / intervyu sonlari skalyar subquery sifatida. Natija kompaniya bo'yicha keshlanadi;
+bog'liq modellarga yozuv (signals.py) shu kompaniyaning kalitini o'chiradi.
+Viewer'ga bog'liq is_following keshga kirmaydi.
+"""
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import Count, IntegerField, OuterRef, Q, Subquery, Value
+from django.db.models.functions import Coalesce
+
+from .models import Company, CompanyPhoto, InterviewExperience
+
+CACHE_KEY = "company-stats:v1:{}"
+CACHE_TIMEOUT = 600
+RATINGS = range(1, 6)
+
+
+def _count(model):
+    rows = (model.objects.filter(company=OuterRef("pk")).order_by()
+            .values("company").annotate(n=Count("id")).values("n"))
+    return Coalesce(Subquery(rows, output_field=IntegerField()), Value(0))
+
+
+def compute_stats(company_id):
+    rows = list(Company.objects
+                .filter(pk=company_id)
+                .values("stats__reviews_count", "stats__followers_count", "stats__vacancies_count",
+                        "stats__open_vacancies_count", "stats__avg_rating")
+                .annotate(
+                    interviews_count=_count(InterviewExperience),
+                    photos_count=_count(CompanyPhoto),
+                    **{f"rating_{stars}": Count("reviews", filter=Q(reviews__rating=stars)) for stars in RATINGS},
+                ))
+    if not rows:
+        return None
+    row = rows[0]
+    return {
+        "reviews_count": row["stats__reviews_count"] or 0,
+        "followers_count": row["stats__followers_count"] or 0,
+        "vacancies_count": row["stats__vacancies_count"] or 0,
+        "open_vacancies_count": row["stats__open_vacancies_count"] or 0,
+        "avg_rating": round(row["stats__avg_rating"] or 0, 2),
+        "rating_histogram": {str(stars): row[f"rating_{stars}"] for stars in RATINGS},
+        "interviews_count": row["interviews_count"],
+        "photos_count": row["photos_count"],
+    }
+
+
+def cached_stats(company_id):
+    """Kompaniya yo'q bo'lsa None."""
+    key = CACHE_KEY.format(company_id)
+    data = cache.get(key)
+    if data is None:
+        data = compute_stats(company_id)
+        if data is not None:
+            cache.set(key, data, CACHE_TIMEOUT)
+    return data
+
+
+def invalidate_stats(company_ids):
+    keys = [CACHE_KEY.format(pk) for pk in company_ids if pk is not None]
+    if keys:
+        # commit'dan keyin — aks holda eski holat qayta keshga tushishi mumkin
+        transaction.on_commit(lambda: cache.delete_many(keys))
@@ -1,3 +1,96 @@
+from io import StringIO
+
+from django.core.management import call_command
 from django.test import TestCase
 
-# Create your tests here.
+from accounts.models import CustomUser
+from vacancies.models import JobPost
+from .models import Company, CompanyFollow, CompanyReview, CompanyStats
+
+
+class CompanyStatsSignalTests(TestCase):
+    def setUp(self):
+        self.owner = CustomUser.objects.create_user(
+            username="owner", email="owner@example.com", password="x", role="EMPLOYER"
+        )
+        self.users = [
+            CustomUser.objects.create_user(username=f"user{i}", email=f"user{i}@example.com", password="x")
+            for i in range(3)
+        ]
+        self.company = Company.objects.create(owner=self.owner, name="Acme")
+        self.other = Company.objects.create(owner=self.owner, name="Globex")
+
+    def _stats(self, company=None):
+        return CompanyStats.objects.get(company=company or self.company)
+
+    def _assert_no_drift(self):
+        out = StringIO()
+        call_command("rebuild_company_stats", "--check", stdout=out)
+        self.assertIn("0 ta farq topildi", out.getvalue())
+
+    def test_follow_and_unfollow(self):
+        follows = [CompanyFollow.objects.create(company=self.company, user=user) for user in self.users]
+        self.assertEqual(self._stats().followers_count, 3)
+
+        follows[0].delete()
+        self.assertEqual(self._stats().followers_count, 2)
+        self._assert_no_drift()
+
+    def test_review_create_edit_delete(self):
+        first = CompanyReview.objects.create(company=self.company, user=self.users[0], rating=5)
+        CompanyReview.objects.create(company=self.company, user=self.users[1], rating=3)
+        stats = self._stats()
+        self.assertEqual((stats.reviews_count, stats.rating_sum, stats.avg_rating), (2, 8, 4.0))
+
+        first.rating = 1
+        first.save()
+        stats = self._stats()
+        self.assertEqual((stats.reviews_count, stats.rating_sum, stats.avg_rating), (2, 4, 2.0))
+
+        first.delete()
+        stats = self._stats()
+        self.assertEqual((stats.reviews_count, stats.rating_sum, stats.avg_rating), (1, 3, 3.0))
+        self._assert_no_drift()
+
+    def test_job_post_company_move_and_state_flips(self):
+        post = JobPost.objects.create(employer=self.owner, company=self.company, title="Backend developer")
+        JobPost.objects.create(employer=self.owner, company=self.company, title="Designer")
+        stats = self._stats()
+        self.assertEqual((stats.vacancies_count, stats.open_vacancies_count, stats.filled_vacancies_count),
+                         (2, 2, 0))
+
+        post.is_filled = True  # pre_save yopadi: is_closed ham o'zgaradi
+        post.save()
+        stats = self._stats()
+        self.assertEqual((stats.vacancies_count, stats.open_vacancies_count, stats.filled_vacancies_count),
+                         (2, 1, 1))
+
+        post.company = self.other
+        post.save()
+        stats, other = self._stats(), self._stats(self.other)
+        self.assertEqual((stats.vacancies_count, stats.open_vacancies_count, stats.filled_vacancies_count),
+                         (1, 1, 0))
+        self.assertEqual((other.vacancies_count, other.open_vacancies_count, other.filled_vacancies_count),
+                         (1, 0, 1))
+
+        post.is_filled = False  # qayta ochiladi
+        post.save()
+        other = self._stats(self.other)
+        self.assertEqual((other.open_vacancies_count, other.filled_vacancies_count), (1, 0))
+
+        post.delete()
+        self.assertEqual(self._stats(self.other).vacancies_count, 0)
+        self._assert_no_drift()
+
+    def test_check_reports_drift_without_writing(self):
+        CompanyFollow.objects.create(company=self.company, user=self.users[0])
+        CompanyStats.objects.filter(company=self.company).update(followers_count=7)
+
+        out = StringIO()
+        call_command("rebuild_company_stats", "--check", stdout=out)
+        self.assertIn("1 ta farq topildi", out.getvalue())
+        self.assertEqual(self._stats().followers_count, 7)
+
+        call_command("rebuild_company_stats", stdout=StringIO())
+        self.assertEqual(self._stats().followers_count, 1)
+        self._assert_no_drift()
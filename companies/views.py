@@ -1,11 +1,15 @@
 from rest_framework import viewsets, permissions, status
 from rest_framework.decorators import action
+from rest_framework.exceptions import NotFound
 from rest_framework.response import Response
-from django.db.models import Avg, Count, Value, IntegerField
-from django.db.models.functions import Coalesce
+from django.db.models import Count
 
 
-from .models import Company, CompanyReview, CompanyPhoto, InterviewExperience, CompanyFollow
+from headhunter_backend.response_cache import COMPANIES, JOBPOSTS, ResponseCacheMixin
+from headhunter_backend.view_counters import ViewCountMixin
+from headhunter_backend.viewer_state import viewer_state
+
+from .models import LEADERBOARDS, Company, CompanyReview, CompanyPhoto, CompanyStats, InterviewExperience, CompanyFollow
 from .serializers import (
     CompanySerializer,
     CompanyReviewSerializer,
@@ -13,20 +17,25 @@ from .serializers import (
     InterviewExperienceSerializer
 )
 from .permissions import IsOwnerOrReadOnly
+from .stats import cached_stats
+
+TOP_DEFAULT_LIMIT = 5
+TOP_MAX_LIMIT = 50
+
+
+class CompanyViewSet(ViewCountMixin, ResponseCacheMixin, viewsets.ModelViewSet):
+    view_count_model = "companies.Company"
+    cache_scope = "companies"
+    cache_tags = (COMPANIES, JOBPOSTS)
+    cache_actions = ("list", "retrieve", "top", "stats", "reviews", "photos", "interviews")
 
-class CompanyViewSet(viewsets.ModelViewSet):
     queryset = Company.objects.all()
     serializer_class = CompanySerializer
     # GET – public, Create/Update/Delete – owner-only
     permission_classes = [permissions.IsAuthenticatedOrReadOnly, IsOwnerOrReadOnly]
 
     def get_queryset(self):
-        qs = Company.objects.all().annotate(
-            reviews_count=Count('reviews', distinct=True),
-            followers_count=Count('follows', distinct=True),
-            vacancies_count=Count('job_posts', distinct=True),
-            avg_rating=Coalesce(Avg('reviews__rating'), Value(0.0)),
-        )
+        qs = Company.objects.with_stats()
         if self.request.user.is_authenticated and self.request.query_params.get('mine') == '1':
             qs = qs.filter(owner=self.request.user)
         return qs
@@ -106,7 +115,7 @@ class CompanyViewSet(viewsets.ModelViewSet):
     def follow(self, request, pk=None):
         company = self.get_object()
         _, created = CompanyFollow.objects.get_or_create(company=company, user=request.user)
-        followers_count = CompanyFollow.objects.filter(company=company).count()
+        followers_count = self._followers_count(company)
         return Response({
             "followed": True,
             "followers_count": followers_count,
@@ -117,7 +126,7 @@ class CompanyViewSet(viewsets.ModelViewSet):
     def unfollow(self, request, pk=None):
         company = self.get_object()
         CompanyFollow.objects.filter(company=company, user=request.user).delete()
-        followers_count = CompanyFollow.objects.filter(company=company).count()
+        followers_count = self._followers_count(company)
         return Response({
             "followed": False,
             "followers_count": followers_count,
@@ -126,36 +135,42 @@ class CompanyViewSet(viewsets.ModelViewSet):
     # ---- Stats (sonlar ko‘rinishida) ----
     @action(detail=True, methods=['get'], url_path='stats')
     def stats(self, request, pk=None):
-        company = self.get_object()
-        is_following = False
-        if request.user.is_authenticated:
-            is_following = CompanyFollow.objects.filter(company=company, user=request.user).exists()
-
-        data = {
-            "reviews_count": company.reviews.count(),
-            "followers_count": company.follows.count(),
-            "vacancies_count": company.job_posts.count(),
-            "avg_rating": round(company.reviews.aggregate(a=Avg('rating'))['a'] or 0, 2),
-            "interviews_count": company.interviews.count(),
-            "photos_count": company.photos.count(),
-            "is_following": is_following,  # <— YANGI
-        }
-        return Response(data)
+        """
+        GET /api/companies/<id>/stats/ — bitta so'rov + kompaniya bo'yicha kesh (companies/stats.py).
+        Faqat is_following har so'rovda aniqlanadi.
+        """
+        data = cached_stats(int(pk)) if str(pk).isdigit() else None
+        if data is None:
+            raise NotFound()
+        return Response({
+            **data,
+            "is_following": viewer_state(request).get("company_follow", int(pk), False),
+        })
 
     @action(detail=False, methods=['get'], url_path='top')
     def top(self, request):
-        limit = int(request.query_params.get('limit', 5))
-        qs = (Company.objects
-              .annotate(
-                  reviews_count=Count('reviews', distinct=True),
-                  followers_count=Count('follows', distinct=True),
-                  vacancies_count=Count('job_posts', distinct=True),
-                  avg_rating=Coalesce(Avg('reviews__rating'), Value(0.0)),
-              )
-              .order_by('-followers_count', 'id')[:limit])
-        ser = self.get_serializer(qs, many=True, context={'request': request})
+        """
+        GET /api/companies/top/?by=followers|rating|open_vacancies&limit=5  (limit <= 50)
+        CompanyStats indeksidan birinchi `limit` ta — kompaniyalar soniga bog'liq emas.
+        """
+        by = request.query_params.get('by', 'followers')
+        if by not in LEADERBOARDS:
+            return Response({"detail": f"by: {', '.join(LEADERBOARDS)}"}, status=400)
+        try:
+            limit = min(max(int(request.query_params.get('limit', TOP_DEFAULT_LIMIT)), 1), TOP_MAX_LIMIT)
+        except ValueError:
+            return Response({"detail": "limit butun son bo'lishi kerak"}, status=400)
+
+        ids = CompanyStats.leaderboard(by, limit)
+        companies = Company.objects.with_stats().in_bulk(ids)
+        ser = self.get_serializer([companies[pk] for pk in ids if pk in companies], many=True)
         return Response(ser.data)
 
+    def _followers_count(self, company):
+        # signal CompanyStats'ni shu so'rov ichida yangilagan
+        return (CompanyStats.objects.filter(pk=company.pk)
+                .values_list('followers_count', flat=True).first() or 0)
+
     def _safe_vacancies_count(self, company):
         try:
             from vacancies.models import JobPost
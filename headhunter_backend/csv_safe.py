@@ -0,0 +1,23 @@
+# headhunter_backend/csv_safe.py
+"""
+CSV eksportlarda formula injection'dan himoya.
+
+Excel / LibreOffice CSV'ni ochganda =, +, -, @ (yoki oldidagi tab / CR) bilan boshlangan
+katakni formula sifatida bajaradi. Foydalanuvchi kiritgan matn ustunlari oldiga "'" qo'yiladi —
+katak matn bo'lib ko'rinadi. Raqam va sana ustunlariga tegilmaydi (manfiy son ham son).
+"""
+FORMULA_PREFIXES = ("=", "+", "-", "@", "\t", "\r")
+
+
+def escape_formula(value):
+    if isinstance(value, str) and value.startswith(FORMULA_PREFIXES):
+        return "'" + value
+    return value
+
+
+def safe_row(header, row, text_columns):
+    """Qator qiymatlari: text_columns dagilari himoyalangan, None -> ""."""
+    return [
+        "" if value is None else (escape_formula(value) if name in text_columns else value)
+        for name, value in zip(header, row)
+    ]
@@ -0,0 +1,180 @@
+# headhunter_backend/response_cache.py
+"""
+Ochiq (anonim) GET javoblari uchun kesh.
+
+Kalit = path + normallashtirilgan query params + rol + tag versiyalari.
+Yozuv bo'lganda tag versiyasi oshiriladi (invalidate_tags) — eski kalitlar
+o'z-o'zidan ishlatilmay qoladi va TTL bilan o'chib ketadi.
+
+Faqat Authorization sarlavhasisiz so'rovlar keshlanadi: autentifikatsiyalangan
+foydalanuvchi javobida shaxsiy maydonlar bor (user_rating, is_following ...).
+"""
+import hashlib
+import time
+
+from django.core.cache import cache
+from django.db import transaction
+from django.http import HttpResponse
+from rest_framework.permissions import IsAdminUser
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+KEY_PREFIX = "rc:v1"
+DEFAULT_TIMEOUT = 300
+ANONYMOUS_ROLE = "anon"
+
+# tag'lar
+JOBPOSTS = "jobposts"
+COMPANIES = "companies"
+TAGS = (JOBPOSTS, COMPANIES)
+
+SCOPES = []  # ResponseCacheMixin ishlatgan viewset'lar (metrikalar uchun)
+
+
+# ---------- tag versiyalari ----------
+
+def _tag_key(tag):
+    return f"{KEY_PREFIX}:tag:{tag}"
+
+
+def tag_versions(tags):
+    keys = [_tag_key(tag) for tag in tags]
+    versions = cache.get_many(keys)
+    for key in keys:
+        if key not in versions:
+            # kesh tozalangan bo'lsa ham eski yozuvlar bilan to'qnashmasin
+            cache.add(key, time.time_ns(), None)
+            versions[key] = cache.get(key)
+    return [versions[key] for key in keys]
+
+
+def invalidate_tags(*tags):
+    for tag in tags:
+        try:
+            cache.incr(_tag_key(tag))
+        except ValueError:
+            cache.set(_tag_key(tag), time.time_ns(), None)
+        incr_metric(f"invalidations:{tag}")
+
+
+def invalidate_on_commit(*tags):
+    """Tranzaksiya tugagach invalidatsiya — aks holda commit'dan oldingi holat keshga tushishi mumkin."""
+    transaction.on_commit(lambda: invalidate_tags(*tags))
+
+
+# ---------- metrikalar ----------
+
+def _metric_key(name):
+    return f"{KEY_PREFIX}:metric:{name}"
+
+
+def incr_metric(name):
+    key = _metric_key(name)
+    try:
+        cache.incr(key)
+    except ValueError:
+        if not cache.add(key, 1, None):
+            cache.incr(key)
+
+
+def metrics(scopes):
+    names = [f"{kind}:{scope}" for scope in scopes for kind in ("hit", "miss", "not_modified")]
+    names += [f"invalidations:{tag}" for tag in TAGS]
+    values = cache.get_many([_metric_key(name) for name in names])
+    get = lambda name: values.get(_metric_key(name), 0)  # noqa: E731
+
+    result = {"scopes": {}, "invalidations": {tag: get(f"invalidations:{tag}") for tag in TAGS}}
+    for scope in scopes:
+        hits = get(f"hit:{scope}") + get(f"not_modified:{scope}")
+        misses = get(f"miss:{scope}")
+        result["scopes"][scope] = {
+            "hits": hits,
+            "misses": misses,
+            "not_modified": get(f"not_modified:{scope}"),
+            "hit_ratio": round(hits / (hits + misses), 4) if hits + misses else None,
+        }
+    return result
+
+
+# ---------- viewset mixin ----------
+
+def normalized_params(query_dict):
+    """?b=2&a=1&a=0&empty= -> (('a','0'),('a','1'),('b','2')) — tartib va bo'sh qiymatlar ahamiyatsiz."""
+    return tuple(sorted(
+        (key, value) for key in query_dict for value in query_dict.getlist(key) if value != ""
+    ))
+
+
+class ResponseCacheMixin:
+    """
+    ViewSet'ga qo'shiladi. `cache_actions` dagi GET so'rovlar anonim foydalanuvchi uchun
+    keshdan beriladi; ETag / If-None-Match -> 304 ham shu yerda.
+    """
+    cache_scope = None
+    cache_tags = ()
+    cache_actions = ("list", "retrieve")
+    cache_timeout = DEFAULT_TIMEOUT
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if cls.cache_scope and cls.cache_scope not in SCOPES:
+            SCOPES.append(cls.cache_scope)
+
+    def _cache_role(self, request):
+        if request.META.get("HTTP_AUTHORIZATION"):
+            return None
+        return ANONYMOUS_ROLE
+
+    def _cache_key(self, request, role):
+        raw = repr((request.path, normalized_params(request.GET), role, tag_versions(self.cache_tags)))
+        return f"{KEY_PREFIX}:resp:{self.cache_scope}:{hashlib.sha1(raw.encode()).hexdigest()}"
+
+    def dispatch(self, request, *args, **kwargs):
+        action = getattr(self, "action_map", {}).get(request.method.lower())
+        role = self._cache_role(request) if request.method == "GET" else None
+        if role is None or action not in self.cache_actions:
+            return super().dispatch(request, *args, **kwargs)
+
+        key = self._cache_key(request, role)
+        entry = cache.get(key)
+        if entry is not None:
+            if request.META.get("HTTP_IF_NONE_MATCH") == entry["etag"]:
+                incr_metric(f"not_modified:{self.cache_scope}")
+                response = HttpResponse(status=304)
+            else:
+                incr_metric(f"hit:{self.cache_scope}")
+                response = HttpResponse(entry["content"], content_type=entry["content_type"])
+            response["ETag"] = entry["etag"]
+            response["X-Cache"] = "HIT"
+            response["Vary"] = "Accept, Authorization"
+            return response
+
+        incr_metric(f"miss:{self.cache_scope}")
+        response = super().dispatch(request, *args, **kwargs)
+        if response.status_code != 200 or getattr(response, "streaming", False):
+            return response
+        user = getattr(getattr(self, "request", None), "user", None)
+        if user is not None and user.is_authenticated:
+            # sarlavhasiz autentifikatsiya (masalan session) — shaxsiy javob, keshlanmaydi
+            return response
+        if hasattr(response, "render"):
+            response.render()
+        etag = '"%s"' % hashlib.md5(response.content).hexdigest()
+        cache.set(key, {"content": response.content, "content_type": response["Content-Type"], "etag": etag},
+                  self.cache_timeout)
+        response["ETag"] = etag
+        response["X-Cache"] = "MISS"
+        response["Vary"] = "Accept, Authorization"
+        if request.META.get("HTTP_IF_NONE_MATCH") == etag:
+            not_modified = HttpResponse(status=304)
+            not_modified["ETag"] = etag
+            return not_modified
+        return response
+
+
+class ResponseCacheMetricsView(APIView):
+    """GET /api/cache-metrics/ — hit ratio va invalidatsiyalar soni (faqat admin)."""
+    permission_classes = [IsAdminUser]
+
+    def get(self, request):
+        return Response(metrics(SCOPES))
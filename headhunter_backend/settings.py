@@ -218,9 +218,19 @@ if os.environ.get("REDIS_URL"):
             "CONFIG": {"hosts": [os.environ["REDIS_URL"]]},
         }
     }
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.redis.RedisCache",
+            "LOCATION": os.environ["REDIS_URL"],
+        }
+    }
 else:
     # Dev uchun: Redis shartsiz
     CHANNEL_LAYERS = {"default": {"BACKEND": "channels.layers.InMemoryChannelLayer"}}
+    CACHES = {"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+
+# ko'rishlar hisoblagichi bazaga necha sekundda bir yoziladi (view_counters.py)
+VIEW_COUNTER_FLUSH_INTERVAL = int(os.environ.get("VIEW_COUNTER_FLUSH_INTERVAL", "10"))
 
 ROOT_URLCONF = "headhunter_backend.urls"
 
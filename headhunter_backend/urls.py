@@ -5,6 +5,7 @@ from django.conf import settings
 from django.conf.urls.static import static
 from rest_framework.routers import DefaultRouter
 
+from headhunter_backend.response_cache import ResponseCacheMetricsView
 from accounts.views import LanguageSkillViewSet, EducationViewSet, PortfolioProjectViewSet, PortfolioMediaViewSet, \
     SkillViewSet, CertificateViewSet, WorkExperienceViewSet
 
@@ -35,6 +36,7 @@ urlpatterns = [
     path('certificate/', include(router.urls)),
     path('experience/', include(router.urls)),
     path("healthz/", health),
+    path("api/cache-metrics/", ResponseCacheMetricsView.as_view(), name="cache-metrics"),
 
 ] + static(settings.MEDIA_URL, document_root=settings.MEDIA_ROOT)
 
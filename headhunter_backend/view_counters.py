@@ -0,0 +1,141 @@
+# headhunter_backend/view_counters.py
+"""
+Ko'rishlar soni uchun write-behind hisoblagich.
+
+Har bir detail GET `record_view()` chaqiradi — bu faqat process ichidagi lug'atni
+oshiradi (bazaga yozuv yo'q). Fon oqimi har VIEW_COUNTER_FLUSH_INTERVAL sekundda
+to'plangan qiymatlarni bazaga yozadi: bir xil delta'li qatorlar bitta
+`UPDATE ... SET views_count = views_count + delta WHERE id IN (...)` bilan.
+Shu tariqa issiq qatorlar uchun har so'rovda row-lock bo'lmaydi.
+
+Worker to'xtaganda (atexit) qolgan qiymatlar ham yoziladi; kutilmagan o'limda
+eng ko'pi bilan bitta interval yo'qoladi.
+"""
+import atexit
+import logging
+import os
+import threading
+from collections import Counter, defaultdict
+
+from django.apps import apps
+from django.conf import settings
+from django.db import close_old_connections
+from django.db.models import F
+
+logger = logging.getLogger(__name__)
+
+FIELD = "views_count"
+MAX_PENDING = 10_000  # shuncha turli obyekt yig'ilsa — interval kutmasdan yoziladi
+
+_lock = threading.Lock()
+_pending = Counter()  # {(model_label, pk): delta}
+_flusher = {"thread": None, "pid": None}
+_wakeup = threading.Event()
+_extra_updates = {}  # {model_label: delta -> {maydon: ifoda}}
+
+
+def flush_interval():
+    return getattr(settings, "VIEW_COUNTER_FLUSH_INTERVAL", 10)
+
+
+def record_view(model_label, pk):
+    if pk is None:
+        return
+    with _lock:
+        _pending[(model_label, pk)] += 1
+        size = len(_pending)
+    _ensure_flusher()
+    if size >= MAX_PENDING:
+        _wakeup.set()
+
+
+def register_flush_update(model_label, make_updates):
+    """Flush UPDATE'iga qo'shimcha maydonlar (masalan vacancies.trending) — alohida so'rovsiz."""
+    _extra_updates[model_label] = make_updates
+
+
+def pending_views(model_label, pk):
+    """Hali bazaga yozilmagan ko'rishlar (serializer ko'rsatishi uchun)."""
+    with _lock:
+        return _pending.get((model_label, pk), 0)
+
+
+def flush():
+    """To'plangan qiymatlarni bazaga yozadi; xato bo'lsa qiymatlar keyingi urinishga qaytariladi."""
+    with _lock:
+        if not _pending:
+            return 0
+        batch = dict(_pending)
+        _pending.clear()
+
+    by_model = defaultdict(lambda: defaultdict(list))  # {label: {delta: [pk, ...]}}
+    for (label, pk), delta in batch.items():
+        by_model[label][delta].append(pk)
+
+    written = 0
+    for label, groups in by_model.items():
+        model = apps.get_model(label)
+        extra = _extra_updates.get(label)
+        for delta, pks in groups.items():
+            try:
+                updates = {FIELD: F(FIELD) + delta, **(extra(delta) if extra else {})}
+                model.objects.filter(pk__in=pks).update(**updates)
+                written += len(pks)
+            except Exception:
+                logger.exception("view counter flush failed for %s", label)
+                with _lock:
+                    for pk in pks:
+                        _pending[(label, pk)] += delta
+    return written
+
+
+def _run():
+    while True:
+        _wakeup.wait(flush_interval())
+        _wakeup.clear()
+        close_old_connections()
+        try:
+            flush()
+        finally:
+            close_old_connections()
+
+
+def _ensure_flusher():
+    # fork'dan keyin (gunicorn --preload) oqim yangi process'ga o'tmaydi — qayta ishga tushiramiz
+    if _flusher["pid"] == os.getpid() and _flusher["thread"] is not None:
+        return
+    with _lock:
+        if _flusher["pid"] == os.getpid() and _flusher["thread"] is not None:
+            return
+        thread = threading.Thread(target=_run, name="view-counter-flusher", daemon=True)
+        _flusher.update(thread=thread, pid=os.getpid())
+    thread.start()
+
+
+def _flush_at_exit():
+    try:
+        flush()
+    except Exception:
+        logger.exception("view counter flush at exit failed")
+
+
+atexit.register(_flush_at_exit)
+
+
+class ViewCountMixin:
+    """
+    ViewSet'ning retrieve'ida ko'rishni hisoblaydi — faqat javob muvaffaqiyatli bo'lsa
+    (200, keshdan 304): 401/403/404 hisobga kirmaydi. dispatch darajasida — ResponseCacheMixin
+    keshdan javob qaytarganda ham hisob yo'qolmaydi (MRO'da undan oldin turadi).
+    """
+    view_count_model = None  # "vacancies.JobPost"
+    view_count_statuses = (200, 304)
+
+    def dispatch(self, request, *args, **kwargs):
+        response = super().dispatch(request, *args, **kwargs)
+        action = getattr(self, "action_map", {}).get(request.method.lower())
+        if action == "retrieve" and self.view_count_model and response.status_code in self.view_count_statuses:
+            pk = kwargs.get(self.lookup_url_kwarg or self.lookup_field)
+            if pk is not None and str(pk).isdigit():
+                record_view(self.view_count_model, int(pk))
+        return response
@@ -0,0 +1,71 @@
+# headhunter_backend/viewer_state.py
+"""
+So'rov davomida joriy foydalanuvchining obyektlarga munosabatlari (follow, like, baho ...).
+
+Har bir munosabat turi uchun sahifadagi barcha id'lar bitta so'rov bilan olinadi va
+request'da keshlanadi — ichma-ich serializer'lar (masalan vakansiya ichidagi kompaniya)
+ham o'sha natijani ishlatadi. Ro'yxat sahifa hajmidan qat'i nazar o'zgarmas sonli so'rov
+bilan chiqadi (anonim foydalanuvchi uchun so'rov umuman yo'q).
+
+Munosabat turlari ilovalarda `register_relation()` bilan ro'yxatdan o'tadi.
+"""
+from collections import defaultdict
+
+from rest_framework import serializers
+
+RELATIONS = {}  # {nomi: loader(user, ids) -> {id: qiymat}}
+
+
+def register_relation(name, loader):
+    """loader(user, ids) -> {id: qiymat}; natijada yo'q id'lar get() ning default qiymatini oladi."""
+    RELATIONS[name] = loader
+
+
+class ViewerState:
+    def __init__(self, user):
+        self.user = user if user is not None and user.is_authenticated else None
+        self._values = defaultdict(dict)
+        self._loaded = defaultdict(set)
+
+    def prime(self, relation, ids):
+        """Hali yuklanmagan id'lar uchun bitta so'rov."""
+        if self.user is None:
+            return
+        missing = {pk for pk in ids if pk is not None} - self._loaded[relation]
+        if not missing:
+            return
+        self._values[relation].update(RELATIONS[relation](self.user, missing))
+        self._loaded[relation] |= missing
+
+    def get(self, relation, pk, default=None):
+        if self.user is None:
+            return default
+        self.prime(relation, [pk])
+        return self._values[relation].get(pk, default)
+
+
+def viewer_state(request):
+    """Request'ga bog'langan ViewerState (request bo'lmasa — bo'sh, anonim holat)."""
+    if request is None:
+        return ViewerState(None)
+    state = getattr(request, "_viewer_state", None)
+    if state is None:
+        state = ViewerState(getattr(request, "user", None))
+        request._viewer_state = state
+    return state
+
+
+class ViewerStateListSerializer(serializers.ListSerializer):
+    """
+    child.Meta.viewer_relations dagi munosabatlarni butun sahifa uchun oldindan yuklaydi
+    (kalit — obyekt pk).
+    """
+
+    def to_representation(self, data):
+        items = list(data.all() if hasattr(data, "all") else data)
+        relations = getattr(getattr(self.child, "Meta", None), "viewer_relations", ())
+        if relations and items:
+            state = viewer_state(self.context.get("request"))
+            for relation in relations:
+                state.prime(relation, [item.pk for item in items])
+        return super().to_representation(items)
@@ -0,0 +1,121 @@
+# headhunter_backend/xlsx_stream.py
+"""
+Oqim (stream) bilan XLSX yozish — tashqi kutubxonasiz (faqat zipfile).
+
+XLSX — bir nechta XML fayldan iborat ZIP. Varaq (sheet1.xml) qatorma-qator siqilib
+yoziladi, zipfile esa o'qib bo'lmaydigan (unseekable) oqimga data descriptor'lar bilan
+yozadi — shuning uchun butun fayl xotirada yig'ilmaydi: yozilgan baytlar ~64 KB
+bo'laklarda generatordan chiqadi (StreamingHttpResponse uchun).
+
+Kataklar: son -> raqam, None -> bo'sh, qolgani -> inline satr (formula sifatida
+bajarilmaydi). Uslub (style) yo'q.
+"""
+import re
+import zipfile
+from decimal import Decimal
+from itertools import chain
+from xml.sax.saxutils import escape
+
+CONTENT_TYPE = "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+STREAM_BUFFER_SIZE = 64 * 1024
+ROWS_PER_WRITE = 500
+# XML 1.0 da ruxsat etilmagan boshqaruv belgilar
+_ILLEGAL_XML = re.compile("[\x00-\x08\x0b\x0c\x0e-\x1f\ufffe\uffff]")
+
+_CONTENT_TYPES = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+    '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+    '<Default Extension="xml" ContentType="application/xml"/>'
+    '<Override PartName="/xl/workbook.xml" '
+    'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"/>'
+    '<Override PartName="/xl/worksheets/sheet1.xml" '
+    'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"/>'
+    '</Types>'
+)
+_ROOT_RELS = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+    '<Relationship Id="rId1" '
+    'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" '
+    'Target="xl/workbook.xml"/>'
+    '</Relationships>'
+)
+_WORKBOOK = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<workbook xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main" '
+    'xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships">'
+    '<sheets><sheet name="{name}" sheetId="1" r:id="rId1"/></sheets>'
+    '</workbook>'
+)
+_WORKBOOK_RELS = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+    '<Relationship Id="rId1" '
+    'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/worksheet" '
+    'Target="worksheets/sheet1.xml"/>'
+    '</Relationships>'
+)
+_SHEET_HEAD = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main"><sheetData>'
+)
+_SHEET_TAIL = '</sheetData></worksheet>'
+
+
+class _Sink:
+    """zipfile yozadigan 'fayl': seek/tell yo'q — zipfile data descriptor rejimiga o'tadi."""
+
+    def __init__(self):
+        self.parts = []
+        self.size = 0
+
+    def write(self, data):
+        self.parts.append(bytes(data))
+        self.size += len(data)
+        return len(data)
+
+    def flush(self):
+        pass
+
+    def drain(self):
+        data = b"".join(self.parts)
+        self.parts, self.size = [], 0
+        return data
+
+
+def _cell(value):
+    if value is None:
+        return "<c/>"
+    if isinstance(value, bool):
+        value = str(value)
+    elif isinstance(value, (int, float, Decimal)):
+        return f"<c><v>{value}</v></c>"
+    text = escape(_ILLEGAL_XML.sub("", value if isinstance(value, str) else str(value)))
+    return f'<c t="inlineStr"><is><t xml:space="preserve">{text}</t></is></c>'
+
+
+def _row(number, values):
+    return f'<row r="{number}">{"".join(_cell(value) for value in values)}</row>'
+
+
+def xlsx_chunks(header, rows, sheet_name="Sheet1", buffer_size=STREAM_BUFFER_SIZE):
+    """header: ustun nomlari; rows: qiymatlar ketma-ketligi iteratori. bytes bo'laklarini beradi."""
+    sink = _Sink()
+    with zipfile.ZipFile(sink, "w", compression=zipfile.ZIP_DEFLATED) as archive:
+        archive.writestr("[Content_Types].xml", _CONTENT_TYPES)
+        archive.writestr("_rels/.rels", _ROOT_RELS)
+        archive.writestr("xl/workbook.xml", _WORKBOOK.format(name=escape(sheet_name[:31], {'"': "&quot;"})))
+        archive.writestr("xl/_rels/workbook.xml.rels", _WORKBOOK_RELS)
+        with archive.open("xl/worksheets/sheet1.xml", "w", force_zip64=True) as sheet:
+            sheet.write(_SHEET_HEAD.encode())
+            batch = []
+            for number, values in enumerate(chain([header], rows), start=1):
+                batch.append(_row(number, values))
+                if len(batch) >= ROWS_PER_WRITE:
+                    sheet.write("".join(batch).encode())
+                    batch = []
+                    if sink.size >= buffer_size:
+                        yield sink.drain()
+            sheet.write(("".join(batch) + _SHEET_TAIL).encode())
+    yield sink.drain()
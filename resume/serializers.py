@@ -1,16 +1,22 @@
 from rest_framework import serializers
+
+from headhunter_backend.view_counters import pending_views
 from .models import Resume
 
 class ResumeSerializer(serializers.ModelSerializer):
     # Media fayllar to‘liq URL bo‘lib kelsin
     photo = serializers.ImageField(required=False, allow_null=True)
     cv_file = serializers.FileField(required=False, allow_null=True)
+    views_count = serializers.SerializerMethodField()
 
     class Meta:
         model = Resume
         fields = "__all__"
         read_only_fields = ["id", "user", "created_at", "updated_at", "views_count", "rating", "is_active"]
 
+    def get_views_count(self, obj):
+        return obj.views_count + pending_views("resume.Resume", obj.pk)
+
     def to_representation(self, instance):
         data = super().to_representation(instance)
         request = self.context.get("request")
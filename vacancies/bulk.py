@@ -0,0 +1,251 @@
+# vacancies/bulk.py
+"""
+Vakansiyalarni oqim (stream) bilan import / eksport qilish: NDJSON yoki CSV.
+
+Import: qatorlar birma-bir o'qiladi, JobPostSerializer qoidalari bilan tekshiriladi
+va BATCH_SIZE tadan bulk_create qilinadi. bulk_create signal yubormaydi, shuning
+uchun pre/post_save ishlari (geohash, yopiq holat, dublikat imzosi, kompaniya
+statistikasi, qidiruv indeksi, skill teglari, tavsiyalar navbati, kesh) shu yerda
+partiya uchun bir marta bajariladi. Xato qatorlar o'tkazib yuboriladi va hisobotga
+yoziladi. Dublikatlar (POST create'dagi 409 qoidasi) ham xato — allow_duplicates=True
+bo'lsa saqlanadi va duplicate_of bilan belgilanadi.
+
+Eksport: queryset .iterator() bilan (PostgreSQL'da server-side cursor) o'qiladi,
+xotira qatorlar soniga bog'liq emas.
+"""
+import csv
+import io
+import json
+
+from django.db import transaction
+from rest_framework import serializers
+
+from accounts.geo import fill_geohash
+from companies.models import Company, CompanyStats
+from headhunter_backend.csv_safe import safe_row
+from headhunter_backend.response_cache import COMPANIES, JOBPOSTS, invalidate_on_commit
+
+from . import dedup
+from .lifecycle import sync_closed_state
+from .models import JobPost
+from .recommendations import enqueue_job_posts, invalidate_job_index
+from .search import index_jobposts
+from .serializers import JobPostSerializer
+from .skills import sync_skill_tags
+
+BATCH_SIZE = 500
+MAX_REPORTED_ERRORS = 1000
+EXPORT_CHUNK_SIZE = 2000
+STREAM_BUFFER_SIZE = 64 * 1024
+FORMATS = ("ndjson", "csv")
+CONTENT_TYPES = {"ndjson": "application/x-ndjson", "csv": "text/csv"}
+
+EXPORT_FIELDS = [
+    "id", "title", "skills", "duration", "budget_min", "budget_max", "is_fixed_price",
+    "location", "is_remote", "latitude", "longitude", "description", "deadline",
+    "is_filled", "is_closed", "plan", "company", "employer", "created_at",
+]
+# CSV'da formula bo'lib bajarilmasin (headhunter_backend.csv_safe)
+TEXT_FIELDS = {"title", "skills", "duration", "location", "description"}
+# CSV'da bo'sh satr "qiymat yo'q" degani
+NULLABLE_FIELDS = {"budget_min", "budget_max", "latitude", "longitude", "deadline", "plan", "company"}
+
+
+class JobPostImportSerializer(serializers.ModelSerializer):
+    """
+    JobPostSerializer'ning yoziladigan maydonlari (model qoidalari bir xil), method field'larsiz.
+    company alohida tekshiriladi — import qiluvchining kompaniyasi bo'lishi shart.
+    """
+
+    class Meta:
+        model = JobPostSerializer.Meta.model
+        fields = [f for f in EXPORT_FIELDS if f not in ("id", "company", "employer", "created_at", "is_closed")]
+
+
+# ---------- o'qish ----------
+
+def _decoded_lines(stream):
+    for raw in stream:
+        yield raw.decode("utf-8-sig") if isinstance(raw, bytes) else raw
+
+
+def _csv_row(row):
+    row = {key.strip(): value for key, value in row.items() if key}
+    for key in NULLABLE_FIELDS:
+        if row.get(key) == "":
+            row[key] = None
+    skills = row.get("skills")
+    if isinstance(skills, str):
+        skills = skills.strip()
+        if skills.startswith("["):
+            try:
+                row["skills"] = json.loads(skills)
+            except ValueError:
+                pass
+        else:
+            row["skills"] = [s.strip() for s in skills.split(",") if s.strip()]
+    return row
+
+
+def read_rows(stream, fmt):
+    """(qator_raqami, dict yoki None, xato) — qator raqami 1 dan (CSV'da sarlavhadan keyin)."""
+    lines = _decoded_lines(stream)
+    if fmt == "csv":
+        for number, row in enumerate(csv.DictReader(lines), start=1):
+            yield number, _csv_row(row), None
+        return
+    for number, line in enumerate(lines, start=1):
+        if not line.strip():
+            continue
+        try:
+            row = json.loads(line)
+        except ValueError as exc:
+            yield number, None, f"JSON xato: {exc}"
+            continue
+        if not isinstance(row, dict):
+            yield number, None, "Har bir qator JSON obyekt bo'lishi kerak"
+            continue
+        yield number, row, None
+
+
+# ---------- import ----------
+
+class ImportReport:
+    def __init__(self):
+        self.created = 0
+        self.failed = 0
+        self.errors = []
+
+    def add_error(self, row, errors):
+        self.failed += 1
+        if len(self.errors) < MAX_REPORTED_ERRORS:
+            self.errors.append({"row": row, "errors": errors})
+
+    def as_dict(self):
+        return {
+            "created": self.created,
+            "failed": self.failed,
+            "errors": self.errors,
+            "errors_truncated": self.failed > len(self.errors),
+        }
+
+
+DUPLICATE_ERROR = "Bu vakansiya avvalgi vakansiyangizga juda o'xshash"
+
+
+def _drop_duplicates(batch, report, using):
+    """batch: [(qator_raqami, post)] -> dublikat bo'lmagan postlar; dublikatlar hisobotga."""
+    posts = []
+    for (number, post), match in zip(batch, dedup.find_duplicates([post for _, post in batch], using=using)):
+        if match is None:
+            posts.append(post)
+            continue
+        original_id, index, score = match
+        error = {"non_field_errors": [DUPLICATE_ERROR], "similarity": round(score, 2)}
+        if original_id is not None:
+            error["duplicate_of"] = original_id
+        else:
+            error["duplicate_of_row"] = batch[index][0]
+        report.add_error(number, error)
+    return posts
+
+
+def _insert(batch, report, using, allow_duplicates=False):
+    posts = [post for _, post in batch] if allow_duplicates else _drop_duplicates(batch, report, using)
+    if not posts:
+        return 0
+    with transaction.atomic(using=using):
+        posts = JobPost.objects.using(using).bulk_create(posts)
+        index_jobposts(posts, using=using)
+        sync_skill_tags(posts, using=using)
+        dedup.index_jobposts(posts, using=using)
+        CompanyStats.rebuild({post.company_id for post in posts if post.company_id}, using=using)
+        enqueue_job_posts([post.pk for post in posts], using=using)
+        invalidate_on_commit(JOBPOSTS, COMPANIES)
+    invalidate_job_index()
+    return len(posts)
+
+
+def import_jobposts(stream, fmt, employer, batch_size=BATCH_SIZE, using="default", allow_duplicates=False):
+
+    if fmt not in FORMATS:
+        raise ValueError(f"format: {', '.join(FORMATS)}")
+    own_companies = set(Company.objects.using(using).filter(owner=employer).values_list("pk", flat=True))
+    validator = JobPostImportSerializer()
+    report = ImportReport()
+    batch = []
+
+    for number, row, error in read_rows(stream, fmt):
+        if error:
+            report.add_error(number, {"non_field_errors": [error]})
+            continue
+        company_id = row.pop("company", None)
+        try:
+            company_id = int(company_id) if company_id not in (None, "") else None
+        except (TypeError, ValueError):
+            report.add_error(number, {"company": ["Butun son bo'lishi kerak"]})
+            continue
+        if company_id is not None and company_id not in own_companies:
+            report.add_error(number, {"company": ["Bu kompaniya sizga tegishli emas"]})
+            continue
+        try:
+            data = validator.run_validation(row)
+        except serializers.ValidationError as exc:
+            report.add_error(number, exc.detail)
+            continue
+
+        post = JobPost(employer=employer, company_id=company_id, **data)
+        fill_geohash(post)
+        sync_closed_state(post)
+        batch.append((number, post))
+        if len(batch) >= batch_size:
+            report.created += _insert(batch, report, using, allow_duplicates)
+            batch = []
+
+    if batch:
+        report.created += _insert(batch, report, using, allow_duplicates)
+    return report
+
+
+# ---------- eksport ----------
+
+def _json_default(value):
+    return value.isoformat() if hasattr(value, "isoformat") else str(value)
+
+
+def _buffered(parts, size=STREAM_BUFFER_SIZE):
+    """Mayda satrlarni ~64 KB bo'laklarga yig'adi (har bir qator alohida yozilmasin)."""
+    buffer, length = [], 0
+    for part in parts:
+        buffer.append(part)
+        length += len(part)
+        if length >= size:
+            yield "".join(buffer)
+            buffer, length = [], 0
+    if buffer:
+        yield "".join(buffer)
+
+
+def _csv_lines(records):
+    out = io.StringIO()
+    writer = csv.writer(out)
+    writer.writerow(EXPORT_FIELDS)
+    for record in records:
+        if isinstance(record["skills"], list):
+            record["skills"] = ", ".join(str(s) for s in record["skills"])
+        writer.writerow(safe_row(EXPORT_FIELDS, [record[f] for f in EXPORT_FIELDS], TEXT_FIELDS))
+        yield out.getvalue()
+        out.seek(0)
+        out.truncate()
+    if out.tell():
+        yield out.getvalue()
+
+
+def export_rows(queryset, fmt, chunk_size=EXPORT_CHUNK_SIZE):
+    """Eksport matni bo'laklari generatori (StreamingHttpResponse / fayl uchun)."""
+    columns = [f"{f}_id" if f in ("company", "employer") else f for f in EXPORT_FIELDS]
+    rows = queryset.order_by("pk").values_list(*columns).iterator(chunk_size=chunk_size)
+    records = (dict(zip(EXPORT_FIELDS, row)) for row in rows)
+    if fmt == "csv":
+        return _buffered(_csv_lines(records))
+    return _buffered(json.dumps(record, ensure_ascii=False, default=_json_default) + "\n" for record in records)
@@ -0,0 +1,180 @@
+# vacancies/dedup.py
+"""
+Bir xil employer'ning deyarli bir xil vakansiyalarini aniqlash (MinHash + LSH).
+
+- Shingle'lar: title + description so'zlaridan 3-gram'lar va normallashgan skill'lar.
+- MinHash: NUM_PERM ta universal hash (a*x + b mod p) minimumi — ikki imzoning mos
+  kelgan ulushi Jaccard o'xshashligini baholaydi.
+- LSH: imzo BANDS ta bo'lakka bo'linadi, har bo'lak hash'i JobPostLSHBucket qatori.
+  Nomzodlar faqat (employer, key) indeksidan olinadi — hamma postlar bilan solishtirilmaydi.
+  ROWS=4, BANDS=32: o'xshashlik 0.7 bo'lsa nomzod bo'lish ehtimoli ~0.9998.
+
+Dublikat doim kichikroq id'li (avvalroq yaratilgan) postga ko'rsatadi (`duplicate_of` —
+klaster ildizi), shuning uchun sikl bo'lmaydi.
+"""
+import hashlib
+import zlib
+from collections import defaultdict
+
+import numpy as np
+from django.db import transaction
+
+from .search import tokenize
+from .skills import skill_names
+
+NUM_PERM = 128
+BANDS = 32
+ROWS = NUM_PERM // BANDS
+SHINGLE_SIZE = 3
+THRESHOLD = 0.7  # taxminiy Jaccard; shundan yuqori — dublikat
+
+_MERSENNE_PRIME = np.uint64((1 << 61) - 1)
+_MAX_HASH = np.uint64(0xFFFFFFFF)
+# urug' qat'iy — imzolar process'lar va qayta ishga tushishlar orasida bir xil bo'lsin
+_rng = np.random.default_rng(20240501)
+_A = _rng.integers(1, (1 << 61) - 1, size=NUM_PERM, dtype=np.uint64)
+_B = _rng.integers(0, (1 << 61) - 1, size=NUM_PERM, dtype=np.uint64)
+
+
+def shingles(post):
+    words = tokenize(post.title) + tokenize(post.description)
+    if len(words) < SHINGLE_SIZE:
+        result = set(words)
+    else:
+        result = {" ".join(words[i:i + SHINGLE_SIZE]) for i in range(len(words) - SHINGLE_SIZE + 1)}
+    result.update(f"skill:{name}" for name in skill_names(post.skills))
+    return result
+
+
+def fingerprint(post):
+    """JobPost -> uint32[NUM_PERM] MinHash imzosi."""
+    values = shingles(post)
+    if not values:
+        return np.full(NUM_PERM, _MAX_HASH, dtype=np.uint32)
+    hashes = np.fromiter((zlib.crc32(s.encode()) for s in values), dtype=np.uint64, count=len(values))
+    # uint64 toshib ketishi MinHash uchun zararsiz (datasketch ham shunday qiladi)
+    with np.errstate(over="ignore"):
+        permuted = ((hashes[:, None] * _A + _B) % _MERSENNE_PRIME) & _MAX_HASH
+    return permuted.min(axis=0).astype(np.uint32)
+
+
+def band_keys(signature):
+    keys = []
+    for band in range(BANDS):
+        chunk = signature[band * ROWS:(band + 1) * ROWS].tobytes()
+        digest = hashlib.blake2b(bytes([band]) + chunk, digest_size=8).digest()
+        keys.append(int.from_bytes(digest, "little", signed=True))
+    return keys
+
+
+def similarity(a, b):
+    return float(np.count_nonzero(a == b)) / NUM_PERM
+
+
+def _load_candidates(employer_ids, keys, exclude_ids, using):
+    """
+    ({(employer_id, key): {job_post_id}}, {job_post_id: (imzo, duplicate_of_id)}) — bitta so'rov
+    (imzo bucket qatoriga JOIN qilinadi).
+    """
+    from .models import JobPostLSHBucket
+
+    buckets, signatures = defaultdict(set), {}
+    rows = (JobPostLSHBucket.objects.using(using)
+            .filter(employer_id__in=employer_ids, key__in=keys)
+            .exclude(job_post_id__in=exclude_ids)
+            .values_list("employer_id", "key", "job_post_id",
+                         "job_post__fingerprint__minhash", "job_post__duplicate_of_id"))
+    for employer_id, key, job_post_id, minhash, root in rows:
+        buckets[(employer_id, key)].add(job_post_id)
+        if job_post_id not in signatures and minhash is not None:
+            signatures[job_post_id] = (np.frombuffer(minhash, dtype=np.uint32), root)
+    return buckets, signatures
+
+
+def _best_match(post, signature, keys, buckets, signatures):
+    best, seen = None, set()
+    for key in keys:
+        for pk in buckets.get((post.employer_id, key), ()):
+            if pk in seen or pk not in signatures or (post.pk is not None and pk >= post.pk):
+                continue
+            seen.add(pk)
+            other, root = signatures[pk]
+            score = similarity(signature, other)
+            if score >= THRESHOLD and (best is None or score > best[1]):
+                best = (root or pk, score)
+    return best
+
+
+def find_duplicate(post, using="default"):
+    """Saqlanmagan (yoki saqlangan) post uchun (original_id, o'xshashlik) yoki None."""
+    signature = fingerprint(post)
+    keys = band_keys(signature)
+    buckets, signatures = _load_candidates([post.employer_id], keys, [post.pk] if post.pk else [], using)
+    return _best_match(post, signature, keys, buckets, signatures)
+
+
+def find_duplicates(posts, using="default"):
+    """
+    Saqlanmagan postlar partiyasi (import) uchun — bitta so'rov. Har bir post uchun None yoki
+    (original_id, partiyadagi_indeks, o'xshashlik): original saqlangan post bo'lsa original_id,
+    partiyadagi oldingi (dublikat bo'lmagan) post bo'lsa uning indeksi to'ldiriladi.
+    """
+    signatures_in = [fingerprint(post) for post in posts]
+    keys_in = [band_keys(signature) for signature in signatures_in]
+    buckets, signatures = _load_candidates(
+        {post.employer_id for post in posts}, {key for keys in keys_in for key in keys}, [], using,
+    )
+    result = []
+    for i, (post, signature, keys) in enumerate(zip(posts, signatures_in, keys_in)):
+        match = _best_match(post, signature, keys, buckets, signatures)
+        if match:
+            original, score = match
+            result.append((original, None, score) if original > 0 else (None, -original - 1, score))
+            continue
+        result.append(None)
+        # partiya postlari manfiy vaqtinchalik id bilan nomzodlarga qo'shiladi
+        signatures[-i - 1] = (signature, None)
+        for key in keys:
+            buckets[(post.employer_id, key)].add(-i - 1)
+    return result
+
+
+def index_jobposts(posts, using="default"):
+    """
+    Saqlangan postlar uchun imzo va LSH qatorlarini yangilaydi, duplicate_of ni belgilaydi.
+    Partiya ichidagi postlar ham bir-biri bilan solishtiriladi. Dublikat deb topilganlar sonini qaytaradi.
+    """
+    from .models import JobPost, JobPostFingerprint, JobPostLSHBucket
+
+    posts = sorted(posts, key=lambda p: p.pk)
+    if not posts:
+        return 0
+    ids = [post.pk for post in posts]
+    signatures_in = [fingerprint(post) for post in posts]
+    keys_in = [band_keys(signature) for signature in signatures_in]
+    buckets, signatures = _load_candidates(
+        {post.employer_id for post in posts}, {key for keys in keys_in for key in keys}, ids, using,
+    )
+
+    fingerprints, rows, changed, flagged = [], [], [], 0
+    for post, signature, keys in zip(posts, signatures_in, keys_in):
+        match = _best_match(post, signature, keys, buckets, signatures)
+        root = match[0] if match else None
+        if root != post.duplicate_of_id:
+            post.duplicate_of_id = root
+            changed.append(post)
+        flagged += root is not None
+        signatures[post.pk] = (signature, root)
+        for key in keys:
+            buckets[(post.employer_id, key)].add(post.pk)
+            rows.append(JobPostLSHBucket(job_post_id=post.pk, employer_id=post.employer_id, key=key))
+        fingerprints.append(JobPostFingerprint(job_post_id=post.pk, minhash=signature.tobytes()))
+
+    with transaction.atomic(using=using):
+        JobPostLSHBucket.objects.using(using).filter(job_post_id__in=ids).delete()
+        JobPostFingerprint.objects.using(using).filter(job_post_id__in=ids).delete()
+        JobPostFingerprint.objects.using(using).bulk_create(fingerprints)
+        JobPostLSHBucket.objects.using(using).bulk_create(rows, batch_size=2000)
+        if changed:
+            JobPost.objects.using(using).bulk_update(changed, ["duplicate_of"])
+    return flagged
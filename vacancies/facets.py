@@ -0,0 +1,95 @@
+# vacancies/facets.py
+"""
+Vakansiya qidiruvi uchun facet sonlari (location, plan, is_remote, is_fixed_price, byudjet oralig'i).
+
+Hammasi bitta GROUP BY so'rovidan olinadi: har bir (location, plan, ...) kombinatsiyasi
+soni qaytadi va har bir facet Python'da yig'iladi. Natija filtr imzosi + "jobposts"
+tag versiyasi bo'yicha keshlanadi — yangi vakansiya yoki reyting keshni eskirtiradi.
+"""
+import hashlib
+from collections import Counter
+
+from django.core.cache import cache
+from django.db.models import Case, CharField, Count, Value, When
+
+from headhunter_backend.response_cache import JOBPOSTS, normalized_params, tag_versions
+
+CACHE_TIMEOUT = 300
+MAX_LOCATIONS = 50
+# (nomi, min, max) — budget_max bo'yicha, max kirmaydi
+BUDGET_BUCKETS = [
+    ("0-500", 0, 500),
+    ("500-1000", 500, 1000),
+    ("1000-3000", 1000, 3000),
+    ("3000-5000", 3000, 5000),
+    ("5000+", 5000, None),
+]
+# facet'ga ta'sir qilmaydigan parametrlar (sahifalash / tartib)
+IGNORED_PARAMS = {"page", "page_size", "cursor", "pagination", "facets", "ordering"}
+
+
+def budget_bucket():
+    whens = [When(budget_max__lt=high, then=Value(name)) for name, _, high in BUDGET_BUCKETS if high is not None]
+    return Case(*whens, default=Value(BUDGET_BUCKETS[-1][0]), output_field=CharField())
+
+
+def compute_facets(queryset):
+    rows = (queryset
+            .order_by()
+            .annotate(budget_bucket=budget_bucket())
+            .values("location", "plan", "is_remote", "is_fixed_price", "budget_bucket")
+            .annotate(n=Count("id")))
+
+    total = 0
+    counters = {name: Counter() for name in ("location", "plan", "is_remote", "is_fixed_price", "budget")}
+    for row in rows:
+        n = row["n"]
+        total += n
+        if row["location"]:
+            counters["location"][row["location"]] += n
+        if row["plan"]:
+            counters["plan"][row["plan"]] += n
+        counters["is_remote"][row["is_remote"]] += n
+        counters["is_fixed_price"][row["is_fixed_price"]] += n
+        counters["budget"][row["budget_bucket"]] += n
+
+    as_list = lambda counter, limit=None: [  # noqa: E731
+        {"value": value, "count": count} for value, count in counter.most_common(limit)
+    ]
+    return {
+        "total": total,
+        "location": as_list(counters["location"], MAX_LOCATIONS),
+        "plan": as_list(counters["plan"]),
+        "is_remote": as_list(counters["is_remote"]),
+        "is_fixed_price": as_list(counters["is_fixed_price"]),
+        "budget": [
+            {"value": name, "min": low, "max": high, "count": counters["budget"][name]}
+            for name, low, high in BUDGET_BUCKETS
+        ],
+    }
+
+
+def filter_signature(query_params):
+    params = [(k, v) for k, v in normalized_params(query_params) if k not in IGNORED_PARAMS]
+    raw = repr((params, tag_versions([JOBPOSTS])))
+    return f"facets:v1:{hashlib.sha1(raw.encode()).hexdigest()}"
+
+
+def bucket_range(name):
+    for bucket, low, high in BUDGET_BUCKETS:
+        if bucket == name:
+            return low, high
+    return None
+
+
+def cached_facets(make_queryset, query_params):
+    """
+    Facet'lar foydalanuvchiga bog'liq emas — kesh hamma uchun umumiy.
+    make_queryset faqat kesh bo'sh bo'lganda chaqiriladi (?q= qidiruvi ham bajarilmaydi).
+    """
+    key = filter_signature(query_params)
+    facets = cache.get(key)
+    if facets is None:
+        facets = compute_facets(make_queryset())
+        cache.set(key, facets, CACHE_TIMEOUT)
+    return facets
@@ -1,21 +1,73 @@
 # vacancies/filters.py
 import django_filters
+from .facets import BUDGET_BUCKETS, bucket_range
 from .models import JobPost
+from .search import search_jobposts
+from .skills import normalize_skill, posts_with_all_skills, posts_with_any_skill
+
+
+class CharInFilter(django_filters.BaseInFilter, django_filters.CharFilter):
+    pass
+
 
 class JobPostFilter(django_filters.FilterSet):
     search = django_filters.CharFilter(field_name="title", lookup_expr="icontains")
+    # full-text (title + description + skills), natija score bo'yicha tartiblanadi
+    q = django_filters.CharFilter(method="filter_q")
+    # ?skills_any=react,django  /  ?skills_all=react,django
+    skills_any = CharInFilter(method="filter_skills_any")
+    skills_all = CharInFilter(method="filter_skills_all")
     location = django_filters.CharFilter(field_name="location", lookup_expr="iexact")
     salary_min = django_filters.NumberFilter(field_name="budget_min", lookup_expr="gte")
     salary_max = django_filters.NumberFilter(field_name="budget_max", lookup_expr="lte")
     plan = django_filters.CharFilter(field_name="plan", lookup_expr="iexact")
+    # facet qiymatlari bilan bir xil (facets.py)
+    is_remote = django_filters.BooleanFilter(field_name="is_remote")
+    is_fixed_price = django_filters.BooleanFilter(field_name="is_fixed_price")
+    budget = django_filters.ChoiceFilter(choices=[(name, name) for name, _, _ in BUDGET_BUCKETS],
+                                         method="filter_budget")
+    # ?hide_duplicates=true — dedup.py belgilagan dublikatlarsiz (faqat originallar)
+    hide_duplicates = django_filters.BooleanFilter(method="filter_hide_duplicates")
 
     class Meta:
         model = JobPost
-        fields = ['search', 'location', 'salary_min', 'salary_max', 'plan']
+        fields = ['search', 'q', 'location', 'salary_min', 'salary_max', 'plan', 'skills_any', 'skills_all',
+                  'is_remote', 'is_fixed_price', 'budget', 'hide_duplicates']
+
+    def filter_q(self, queryset, name, value):
+        # qidiruv boshqa filtrlardan keyin, filter_queryset ichida qo'llanadi
+        return queryset
+
+    def _skill_names(self, value):
+        return list({normalize_skill(v) for v in value if v and v.strip()})
+
+    def filter_skills_any(self, queryset, name, value):
+        names = self._skill_names(value)
+        if not names:
+            return queryset
+        return queryset.filter(pk__in=posts_with_any_skill(names, using=queryset.db))
+
+    def filter_skills_all(self, queryset, name, value):
+        names = self._skill_names(value)
+        if not names:
+            return queryset
+        return queryset.filter(pk__in=posts_with_all_skills(names, using=queryset.db))
+
+    def filter_budget(self, queryset, name, value):
+        low, high = bucket_range(value)
+        queryset = queryset.filter(budget_max__gte=low)
+        return queryset.filter(budget_max__lt=high) if high is not None else queryset
+
+    def filter_hide_duplicates(self, queryset, name, value):
+        return queryset.filter(duplicate_of__isnull=True) if value else queryset
 
     def filter_queryset(self, queryset):
         queryset = super().filter_queryset(queryset)
-        return queryset.filter(budget_min__isnull=False, budget_max__isnull=False)
+        queryset = queryset.filter(budget_min__isnull=False, budget_max__isnull=False)
+        q = self.form.cleaned_data.get("q")
+        if q:
+            queryset = search_jobposts(queryset, q)
+        return queryset
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
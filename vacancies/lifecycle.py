@@ -0,0 +1,74 @@
+# vacancies/lifecycle.py
+"""
+Vakansiya holati: ochiq -> yopiq.
+
+Vakansiya yopiladi, agar `is_filled` bo'lsa yoki `deadline` o'tgan bo'lsa (deadline
+kunining o'zi hali ochiq). Saqlashda holat pre_save signalida hisoblanadi; vaqt o'tishi
+bilan yopilishni esa `close_expired_jobposts` buyrug'i batch UPDATE'lar bilan bajaradi
+(signal yuborilmaydi, shuning uchun kesh, tavsiya indeksi va CompanyStats shu yerda yangilanadi).
+"""
+from django.db.models import Q
+from django.utils import timezone
+
+from companies.models import CompanyStats
+from headhunter_backend.response_cache import COMPANIES, JOBPOSTS, invalidate_tags
+
+from .models import JobPost
+
+BATCH_SIZE = 1000
+
+
+def expired_parts(today=None):
+    """
+    `is_filled OR deadline < bugun` tarmoqlari: (shart, tartib) — har biri ochiqlar ichida
+    o'z qisman indeksi bilan o'qiladi (jobpost_open_filled_idx, jobpost_open_deadline_idx).
+    """
+    today = today or timezone.localdate()
+    return [(Q(is_filled=True), ("pk",)), (Q(deadline__lt=today), ("deadline", "pk"))]
+
+
+def expired_q(today=None):
+    q = Q()
+    for condition, _ in expired_parts(today):
+        q |= condition
+    return q
+
+
+def should_be_closed(post, today=None):
+    today = today or timezone.localdate()
+    return bool(post.is_filled or (post.deadline and post.deadline < today))
+
+
+def sync_closed_state(post, today=None):
+    """Obyekt maydonlarini to'g'rilaydi (saqlamaydi). Muddat uzaytirilsa vakansiya qayta ochiladi."""
+    closed = should_be_closed(post, today)
+    if closed and not post.is_closed:
+        post.closed_at = timezone.now()
+    elif not closed:
+        post.closed_at = None
+    post.is_closed = closed
+
+
+def close_expired(batch_size=BATCH_SIZE, today=None, using="default"):
+    """Muddati o'tgan ochiq vakansiyalarni batch_size tadan yopadi; yopilganlar sonini qaytaradi."""
+    from .recommendations import invalidate_job_index
+
+    total = 0
+    # OR bitta so'rovda indeksdan o'qilmaydi (SQLite to'liq skan qiladi) — tarmoqlar alohida
+    for condition, ordering in expired_parts(today):
+        expired = JobPost.objects.using(using).filter(condition, is_closed=False).order_by(*ordering)
+        while True:
+            rows = list(expired.values_list("pk", "company_id")[:batch_size])
+            if not rows:
+                break
+            # parallel saqlash bilan poyga: qayta is_closed=False sharti
+            total += (JobPost.objects.using(using)
+                      .filter(pk__in=[pk for pk, _ in rows], is_closed=False)
+                      .update(is_closed=True, closed_at=timezone.now()))
+            CompanyStats.rebuild({company_id for _, company_id in rows if company_id}, using=using)
+            if len(rows) < batch_size:
+                break
+    if total:
+        invalidate_tags(JOBPOSTS, COMPANIES)
+        invalidate_job_index()
+    return total
@@ -0,0 +1,64 @@
+# vacancies/loaders.py
+from django.db.models import F, Window
+from django.db.models.functions import RowNumber
+from django.utils.functional import cached_property
+
+from companies.models import Company
+from .models import JobPost
+
+
+class JobPostPageLoader:
+    """
+    Bitta sahifadagi JobPost'lar uchun per-row SerializerMethodField'lar
+    kerak qiladigan ma'lumotlarni bulk so'rovlar bilan oldindan yuklaydi.
+    Sahifa hajmidan qat'i nazar so'rovlar soni o'zgarmaydi.
+    """
+    OTHER_VACANCIES_LIMIT = 5
+
+    def __init__(self, posts, user=None):
+        self.posts = list(posts)
+        self.ids = {p.pk for p in self.posts}
+        self.employer_ids = {p.employer_id for p in self.posts}
+        self.user = user if user is not None and user.is_authenticated else None
+
+    def __contains__(self, obj):
+        return obj.pk in self.ids
+
+    @cached_property
+    def companies(self):
+        """{owner_id: Company} — har bir employer'ning birinchi kompaniyasi (statistikasi bilan)."""
+        if not self.employer_ids:
+            return {}
+        result = {}
+        qs = (Company.objects
+              .filter(owner_id__in=self.employer_ids)
+              .with_stats()
+              .with_viewer(self.user)
+              .order_by("id"))
+        for company in qs:
+            result.setdefault(company.owner_id, company)
+        return result
+
+    @cached_property
+    def other_vacancies(self):
+        """{employer_id: [{"id", "title"}, ...]} — har bir employer'ning ochiq vakansiyalari."""
+        if not self.employer_ids:
+            return {}
+        # +1: ro'yxatdan joriy postning o'zi chiqarib tashlanadi
+        ranked = (JobPost.objects
+                  .filter(employer_id__in=self.employer_ids, is_closed=False)
+                  .annotate(rn=Window(RowNumber(), partition_by=[F("employer_id")], order_by=F("id").asc()))
+                  .filter(rn__lte=self.OTHER_VACANCIES_LIMIT + 1)
+                  .order_by("employer_id", "id")
+                  .values_list("employer_id", "id", "title"))
+        result = {}
+        for employer_id, pk, title in ranked:
+            result.setdefault(employer_id, []).append({"id": pk, "title": title})
+        return result
+
+    def get_company(self, obj):
+        return self.companies.get(obj.employer_id)
+
+    def get_other_vacancies(self, obj):
+        items = [v for v in self.other_vacancies.get(obj.employer_id, []) if v["id"] != obj.pk]
+        return items[:self.OTHER_VACANCIES_LIMIT]
@@ -0,0 +1,27 @@
+from django.core.management.base import BaseCommand
+
+from vacancies.models import JobPost
+from vacancies.skills import sync_skill_tags
+
+
+class Command(BaseCommand):
+    help = "JobPost.skills (JSON) ro'yxatlarini SkillTag / JobPostSkill jadvallariga batch bilan ko'chiradi."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=1000)
+
+    def handle(self, *args, **options):
+        batch_size = options["batch_size"]
+        qs = JobPost.objects.only("id", "skills").order_by("pk")
+        last_id = 0
+        total = 0
+        while True:
+            batch = list(qs.filter(pk__gt=last_id)[:batch_size])
+            if not batch:
+                break
+            sync_skill_tags(batch)
+            total += len(batch)
+            last_id = batch[-1].pk
+            self.stdout.write(f"... {total} ta post")
+
+        self.stdout.write(self.style.SUCCESS(f"Tayyor: {total} ta post"))
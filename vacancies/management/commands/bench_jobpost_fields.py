@@ -0,0 +1,76 @@
+import statistics
+import time
+
+from django.contrib.auth.models import AnonymousUser
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+from django.http import QueryDict
+from django.test.utils import CaptureQueriesContext
+from rest_framework.renderers import JSONRenderer
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+
+from accounts.models import CustomUser
+from companies.models import Company
+from vacancies.models import JobPost
+from vacancies.serializers import JobPostSerializer, jobpost_columns, parse_sparse_fields
+
+CASES = [
+    ("to'liq (default)", ""),
+    ("?fields=compact", "fields=compact"),
+    ("?fields=id,title,budget", "fields=id,title,budget"),
+    ("?fields=compact&expand=company", "fields=compact&expand=company"),
+]
+
+
+class _Rollback(Exception):
+    pass
+
+
+class Command(BaseCommand):
+    help = "100 qatorli sahifa: to'liq JobPostSerializer va ?fields= / ?expand= proyeksiyalari (rollback)."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--rows", type=int, default=100)
+        parser.add_argument("--employers", type=int, default=20)
+        parser.add_argument("--repeat", type=int, default=20)
+
+    def handle(self, *args, **options):
+        rows = options["rows"]
+        try:
+            with transaction.atomic():
+                for e in range(options["employers"]):
+                    employer = CustomUser.objects.create_user(username=f"__bench_fields_{e}__", password=None)
+                    Company.objects.create(owner=employer, name=f"Bench {e}", description="lorem " * 50)
+                    JobPost.objects.bulk_create([
+                        JobPost(employer=employer, title=f"Vacancy {e}-{i}", description="Lorem ipsum " * 150,
+                                skills=["Python", "Django", "PostgreSQL"], location="Tashkent",
+                                budget_min=100, budget_max=200)
+                        for i in range(rows // options["employers"] + 1)
+                    ])
+
+                self.stdout.write(f"{'variant':<34}{'bytes':>10}{'ms':>10}{'queries':>9}")
+                for label, params in CASES:
+                    size, ms, queries = self._measure(QueryDict(params), rows, options["repeat"])
+                    self.stdout.write(f"{label:<34}{size:>10}{ms:>10.2f}{queries:>9}")
+                raise _Rollback
+        except _Rollback:
+            pass
+
+    def _measure(self, params, rows, repeat):
+        # viewset bilan bir xil yo'l: parse_sparse_fields -> .only() -> serializer context
+        request = Request(APIRequestFactory().get("/api/vacancies/jobposts/", params))
+        request.user = AnonymousUser()
+        fields, expand = parse_sparse_fields(params)
+        timings = []
+        for _ in range(repeat):
+            with CaptureQueriesContext(connection) as ctx:
+                started = time.perf_counter()
+                qs = JobPost.objects.order_by("-created_at")
+                if fields is not None or expand is not None:
+                    qs = qs.only(*jobpost_columns(fields, expand))
+                data = JobPostSerializer(list(qs[:rows]), many=True,
+                                         context={"request": request, "fields": fields, "expand": expand}).data
+                body = JSONRenderer().render(data)
+                timings.append((time.perf_counter() - started) * 1000)
+        return len(body), statistics.median(timings), len(ctx.captured_queries)
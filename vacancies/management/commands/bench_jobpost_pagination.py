@@ -0,0 +1,76 @@
+import statistics
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.test import override_settings
+from rest_framework.test import APIRequestFactory
+
+from accounts.models import CustomUser
+from vacancies.models import JobPost
+from vacancies.pagination import JobPostPagination
+from vacancies.views import JobPostViewSet
+
+
+class _Rollback(Exception):
+    pass
+
+
+class Command(BaseCommand):
+    help = "/api/vacancies/jobposts/ — page-number va cursor rejimlarini 1- va N-sahifada solishtiradi (rollback)."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--page", type=int, default=5000)
+        parser.add_argument("--count", type=int, default=None, help="default: page * PAGE_SIZE + PAGE_SIZE")
+        parser.add_argument("--repeat", type=int, default=5)
+
+    # anonim javob keshi (response_cache) takroriy so'rovlarni o'lchovdan yashirmasin
+    @override_settings(CACHES={"default": {"BACKEND": "django.core.cache.backends.dummy.DummyCache"}})
+    def handle(self, *args, **options):
+        page_size = settings.REST_FRAMEWORK.get("PAGE_SIZE", 10)
+        deep_page = options["page"]
+        count = options["count"] or deep_page * page_size + page_size
+        view = JobPostViewSet.as_view({"get": "list"})
+        factory = APIRequestFactory()
+
+        def call(params):
+            response = view(factory.get("/api/vacancies/jobposts/", params))
+            response.render()
+            assert response.status_code == 200, response.status_code
+            return response
+
+        try:
+            with transaction.atomic():
+                employer = CustomUser.objects.create_user(username="__bench_pagination__", password=None)
+                for start in range(0, count, 5000):
+                    JobPost.objects.bulk_create([
+                        JobPost(employer=employer, title=f"Vacancy {i}", budget_min=100, budget_max=200)
+                        for i in range(start, min(start + 5000, count))
+                    ])
+
+                # N-sahifa uchun cursor: shu sahifadan oldingi oxirgi qator
+                ordered = (JobPost.objects
+                           .filter(budget_min__isnull=False, budget_max__isnull=False)
+                           .order_by(*JobPostPagination.keyset_ordering))
+                anchor = ordered[(deep_page - 1) * page_size - 1]
+                deep_cursor = JobPostPagination.encode_cursor(anchor)
+
+                cases = [
+                    ("page-number, page 1", {"page": 1}),
+                    (f"page-number, page {deep_page}", {"page": deep_page}),
+                    ("cursor, page 1", {"pagination": "cursor"}),
+                    (f"cursor, page {deep_page}", {"cursor": deep_cursor}),
+                ]
+                self.stdout.write(f"\n{count} ta vakansiya, page_size={page_size}\n")
+                for label, params in cases:
+                    call(params)  # warm-up
+                    timings = []
+                    for _ in range(options["repeat"]):
+                        started = time.perf_counter()
+                        call(params)
+                        timings.append((time.perf_counter() - started) * 1000)
+                    self.stdout.write(f"{label:<28}{statistics.median(timings):>10.1f} ms")
+                raise _Rollback
+        except _Rollback:
+            pass
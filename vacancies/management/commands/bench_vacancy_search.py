@@ -0,0 +1,89 @@
+import random
+import statistics
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.db.models import Q
+
+from accounts.models import CustomUser
+from vacancies.models import JobPost
+from vacancies.search import index_jobposts, search_jobposts, uses_native_search
+
+ROLES = ["Python", "Django", "React", "Frontend", "Backend", "Fullstack", "Data", "DevOps", "QA", "Mobile",
+         "Android", "iOS", "Golang", "Java", "Senior", "Junior", "Middle", "Lead"]
+SKILLS = ["Python", "Django", "React", "Vue", "PostgreSQL", "Docker", "Kubernetes", "Redis", "TypeScript",
+          "Go", "Java", "Spring", "Kotlin", "Swift", "Figma", "Linux", "AWS", "GraphQL", "Celery", "Pandas"]
+DEFAULT_QUERIES = ["python", "django react", '"senior developer"', "kube*", "postgresql docker"]
+
+
+class _Rollback(Exception):
+    pass
+
+
+class Command(BaseCommand):
+    help = "Full-text qidiruv va icontains yo'lini N ta sintetik vakansiyada solishtiradi (hammasi rollback qilinadi)."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--count", type=int, default=100_000)
+        parser.add_argument("--repeat", type=int, default=5)
+        parser.add_argument("--batch-size", type=int, default=2000)
+        parser.add_argument("--query", action="append", dest="queries")
+        parser.add_argument("--seed", type=int, default=42)
+
+    def handle(self, *args, **options):
+        rnd = random.Random(options["seed"])
+        words = [f"w{i}" for i in range(3000)] + ["developer", "senior", "team", "remote", "project"]
+        queries = options["queries"] or DEFAULT_QUERIES
+
+        try:
+            with transaction.atomic():
+                employer = CustomUser.objects.create_user(username="__bench_search__", password=None)
+                self._populate(employer, rnd, words, options["count"], options["batch_size"])
+                base = JobPost.objects.filter(budget_min__isnull=False, budget_max__isnull=False)
+
+                engine = "postgresql tsvector" if uses_native_search() else "inverted index + BM25"
+                self.stdout.write(f"\n{options['count']} ta vakansiya, engine: {engine}\n")
+                self.stdout.write(f"{'query':<24}{'icontains ms':>14}{'hits':>8}{'fulltext ms':>14}{'hits':>8}")
+                for q in queries:
+                    words_q = q.replace('"', "").replace("*", "").split()
+                    cond = Q()
+                    for w in words_q:
+                        cond &= Q(title__icontains=w) | Q(description__icontains=w)
+
+                    plain_ms, plain_hits = self._measure(lambda: base.filter(cond).order_by("-created_at"),
+                                                         options["repeat"])
+                    fts_ms, fts_hits = self._measure(lambda: search_jobposts(base, q), options["repeat"])
+                    self.stdout.write(f"{q:<24}{plain_ms:>14.1f}{plain_hits:>8}{fts_ms:>14.1f}{fts_hits:>8}")
+                raise _Rollback
+        except _Rollback:
+            pass
+
+    def _populate(self, employer, rnd, words, count, batch_size):
+        started = time.perf_counter()
+        created = 0
+        while created < count:
+            size = min(batch_size, count - created)
+            posts = []
+            for _ in range(size):
+                title = " ".join(rnd.sample(ROLES, 2)) + " developer"
+                description = " ".join(rnd.choices(words, k=40))
+                posts.append(JobPost(
+                    employer=employer, title=title, description=description,
+                    skills=rnd.sample(SKILLS, 4), budget_min=500, budget_max=rnd.randint(600, 5000),
+                ))
+            posts = JobPost.objects.bulk_create(posts)
+            index_jobposts(posts)
+            created += size
+        self.stdout.write(f"Populate: {time.perf_counter() - started:.1f}s")
+
+    def _measure(self, make_qs, repeat):
+        timings = []
+        hits = 0
+        for _ in range(repeat):
+            started = time.perf_counter()
+            qs = make_qs()
+            hits = qs.count()
+            list(qs[:10])
+            timings.append((time.perf_counter() - started) * 1000)
+        return statistics.median(timings), hits
@@ -0,0 +1,25 @@
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import close_old_connections
+
+from vacancies.lifecycle import BATCH_SIZE, close_expired
+
+
+class Command(BaseCommand):
+    help = ("Muddati o'tgan yoki to'ldirilgan vakansiyalarni yopadi (batch UPDATE). "
+            "--loop N bilan har N sekundda takrorlanadi (cron o'rniga).")
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=BATCH_SIZE)
+        parser.add_argument("--loop", type=int, default=0, metavar="SECONDS",
+                            help="0 — bir marta ishlab chiqadi")
+
+    def handle(self, *args, **options):
+        while True:
+            close_old_connections()
+            closed = close_expired(batch_size=options["batch_size"])
+            self.stdout.write(f"{closed} ta vakansiya yopildi")
+            if not options["loop"]:
+                break
+            time.sleep(options["loop"])
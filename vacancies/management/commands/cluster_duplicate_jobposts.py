@@ -0,0 +1,33 @@
+from django.core.management.base import BaseCommand
+from django.db.models import Count
+
+from vacancies import dedup
+from vacancies.models import JobPost
+
+FIELDS = ("id", "employer", "title", "description", "skills", "duplicate_of")
+
+
+class Command(BaseCommand):
+    help = ("Mavjud vakansiyalar uchun MinHash imzolari va LSH qatorlarini quradi va "
+            "deyarli bir xil postlarni klasterlaydi (duplicate_of). id tartibida, batch bilan.")
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=500)
+
+    def handle(self, *args, **options):
+        batch_size = options["batch_size"]
+        last_id = 0
+        total = flagged = 0
+        while True:
+            posts = list(JobPost.objects.filter(pk__gt=last_id).order_by("pk").only(*FIELDS)[:batch_size])
+            if not posts:
+                break
+            # oldingi partiyalar allaqachon indekslangan — ular bilan ham solishtiriladi
+            flagged += dedup.index_jobposts(posts)
+            total += len(posts)
+            last_id = posts[-1].pk
+            self.stdout.write(f"... {total} ta post, {flagged} ta dublikat")
+
+        clusters = (JobPost.objects.filter(duplicate_of__isnull=False)
+                    .values("duplicate_of").annotate(n=Count("id")).count())
+        self.stdout.write(self.style.SUCCESS(f"Tayyor: {total} ta post, {flagged} ta dublikat, {clusters} ta klaster"))
@@ -0,0 +1,28 @@
+import sys
+
+from django.core.management.base import BaseCommand
+
+from vacancies.bulk import FORMATS, export_rows
+from vacancies.models import JobPost
+
+
+class Command(BaseCommand):
+    help = "Vakansiyalarni NDJSON yoki CSV ko'rinishida oqim bilan eksport qiladi (xotira sarfi o'zgarmas)."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--output", default="-", help="fayl yo'li yoki '-' (stdout)")
+        parser.add_argument("--format", choices=FORMATS, default="ndjson")
+        parser.add_argument("--employer", help="faqat shu username'ning vakansiyalari")
+
+    def handle(self, *args, **options):
+        queryset = JobPost.objects.all()
+        if options["employer"]:
+            queryset = queryset.filter(employer__username=options["employer"])
+
+        out = sys.stdout if options["output"] == "-" else open(options["output"], "w", encoding="utf-8", newline="")
+        try:
+            for chunk in export_rows(queryset, options["format"]):
+                out.write(chunk)
+        finally:
+            if out is not sys.stdout:
+                out.close()
@@ -0,0 +1,39 @@
+import json
+import sys
+
+from django.core.management.base import BaseCommand, CommandError
+
+from accounts.models import CustomUser
+from vacancies.bulk import BATCH_SIZE, FORMATS, import_jobposts
+
+
+class Command(BaseCommand):
+    help = "NDJSON yoki CSV fayldan vakansiyalarni oqim bilan import qiladi (bulk_create, batch'lar bilan)."
+
+    def add_arguments(self, parser):
+        parser.add_argument("path", help="fayl yo'li yoki '-' (stdin)")
+        parser.add_argument("--employer", required=True, help="username")
+        parser.add_argument("--format", choices=FORMATS, help="default: fayl kengaytmasidan")
+        parser.add_argument("--batch-size", type=int, default=BATCH_SIZE)
+        parser.add_argument("--allow-duplicates", action="store_true",
+                            help="dublikatlarni ham saqlash (duplicate_of bilan belgilanadi)")
+
+    def handle(self, *args, **options):
+        try:
+            employer = CustomUser.objects.get(username=options["employer"])
+        except CustomUser.DoesNotExist:
+            raise CommandError(f"Foydalanuvchi topilmadi: {options['employer']}")
+
+        path = options["path"]
+        fmt = options["format"] or ("csv" if path.endswith(".csv") else "ndjson")
+        stream = sys.stdin if path == "-" else open(path, encoding="utf-8-sig", newline="")
+        try:
+            report = import_jobposts(stream, fmt, employer, batch_size=options["batch_size"],
+                                     allow_duplicates=options["allow_duplicates"])
+        finally:
+            if stream is not sys.stdin:
+                stream.close()
+
+        for error in report.errors:
+            self.stderr.write(f"row {error['row']}: {json.dumps(error['errors'], ensure_ascii=False)}")
+        self.stdout.write(self.style.SUCCESS(f"Tayyor: {report.created} ta yaratildi, {report.failed} ta xato"))
@@ -0,0 +1,25 @@
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import close_old_connections
+
+from vacancies.recommendations import process_updates
+
+
+class Command(BaseCommand):
+    help = ("Profil o'zgargan foydalanuvchilarning tavsiyalarini qayta hisoblaydi va yangi vakansiyalarni "
+            "ro'yxatlarga qo'shadi (signallar qo'ygan navbatdan). --loop N bilan har N sekundda takrorlanadi.")
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=500)
+        parser.add_argument("--loop", type=int, default=0, metavar="SECONDS",
+                            help="0 — bir marta ishlab chiqadi")
+
+    def handle(self, *args, **options):
+        while True:
+            close_old_connections()
+            users, jobs = process_updates(batch_size=options["batch_size"])
+            self.stdout.write(f"{users} ta foydalanuvchi qayta hisoblandi, {jobs} ta vakansiya qo'shildi")
+            if not options["loop"]:
+                break
+            time.sleep(options["loop"])
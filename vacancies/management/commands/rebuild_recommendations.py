@@ -0,0 +1,43 @@
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from django.core.management.base import BaseCommand
+from django.db import connections
+
+from accounts.models import CustomUser, Role
+from vacancies.recommendations import TOP_N, recompute_users
+
+
+class Command(BaseCommand):
+    help = "Barcha JOB_SEEKER'lar uchun tavsiyalarni qayta hisoblaydi (process pool, chunk'lar bilan)."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+        parser.add_argument("--chunk-size", type=int, default=500)
+        parser.add_argument("--top", type=int, default=TOP_N)
+
+    def handle(self, *args, **options):
+        user_ids = list(
+            CustomUser.objects.filter(role=Role.JOB_SEEKER, is_active=True)
+            .order_by("pk").values_list("pk", flat=True)
+        )
+        size = options["chunk_size"]
+        chunks = [user_ids[i:i + size] for i in range(0, len(user_ids), size)]
+        self.stdout.write(f"{len(user_ids)} ta nomzod, {len(chunks)} ta chunk, {options['workers']} worker")
+
+        done = 0
+        if options["workers"] <= 1 or len(chunks) <= 1:
+            for chunk in chunks:
+                done += recompute_users(chunk, options["top"])
+        else:
+            # fork'dan oldin ulanishlarni yopamiz — har bir worker o'z ulanishini ochadi
+            connections.close_all()
+            context = multiprocessing.get_context("fork")
+            with ProcessPoolExecutor(max_workers=options["workers"], mp_context=context) as pool:
+                futures = [pool.submit(recompute_users, chunk, options["top"]) for chunk in chunks]
+                for future in as_completed(futures):
+                    done += future.result()
+                    self.stdout.write(f"... {done}/{len(user_ids)}")
+
+        self.stdout.write(self.style.SUCCESS(f"Tayyor: {done} ta foydalanuvchi"))
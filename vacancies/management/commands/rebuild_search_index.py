@@ -0,0 +1,31 @@
+from django.core.management.base import BaseCommand
+
+from vacancies.models import JobPost
+from vacancies.search import index_jobposts, uses_native_search
+
+
+class Command(BaseCommand):
+    help = "Vakansiyalar full-text indeksini (inverted index) batch bilan qayta quradi."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=500)
+
+    def handle(self, *args, **options):
+        if uses_native_search():
+            self.stdout.write("PostgreSQL: search_document generated ustun — qayta qurish shart emas.")
+            return
+
+        batch_size = options["batch_size"]
+        qs = JobPost.objects.only("id", "title", "skills", "description").order_by("pk")
+        last_id = 0
+        total = 0
+        while True:
+            batch = list(qs.filter(pk__gt=last_id)[:batch_size])
+            if not batch:
+                break
+            index_jobposts(batch)
+            total += len(batch)
+            last_id = batch[-1].pk
+            self.stdout.write(f"... {total} ta post indekslandi")
+
+        self.stdout.write(self.style.SUCCESS(f"Tayyor: {total} ta post"))
@@ -0,0 +1,30 @@
+from django.core.management.base import BaseCommand
+
+from vacancies import trending
+from vacancies.models import JobPost
+
+
+class Command(BaseCommand):
+    help = "JobPost.trending_score ni arizalar, baholar va ko'rishlardan qayta hisoblaydi (backfill, batch bilan)."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=1000)
+
+    def handle(self, *args, **options):
+        batch_size = options["batch_size"]
+        last_id = 0
+        total = 0
+        while True:
+            ids = list(
+                JobPost.objects
+                .filter(pk__gt=last_id)
+                .order_by("pk")
+                .values_list("pk", flat=True)[:batch_size]
+            )
+            if not ids:
+                break
+            total += trending.rebuild(ids)
+            last_id = ids[-1]
+            self.stdout.write(f"... {total} ta post yangilandi")
+
+        self.stdout.write(self.style.SUCCESS(f"Tayyor: {total} ta post"))
@@ -0,0 +1,44 @@
+# Generated by Django 5.2.4 on 2026-10-18 07:33
+
+from django.db import migrations, models
+from django.db.models import Count, Sum
+
+
+def forwards(apps, schema_editor):
+    JobPost = apps.get_model('vacancies', 'JobPost')
+    JobPostRating = apps.get_model('vacancies', 'JobPostRating')
+    totals = (JobPostRating.objects
+              .values('job_post_id')
+              .annotate(s=Sum('stars'), c=Count('id')))
+    for row in totals.iterator():
+        JobPost.objects.filter(pk=row['job_post_id']).update(
+            rating_sum=row['s'],
+            rating_count=row['c'],
+            rating_avg=row['s'] / row['c'],
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('vacancies', '0013_delete_jobapplication'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='jobpost',
+            name='rating_avg',
+            field=models.FloatField(default=0),
+        ),
+        migrations.AddField(
+            model_name='jobpost',
+            name='rating_count',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='jobpost',
+            name='rating_sum',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.RunPython(forwards, migrations.RunPython.noop),
+    ]
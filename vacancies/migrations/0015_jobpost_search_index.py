@@ -0,0 +1,88 @@
+# Generated by Django 5.2.4 on 2026-10-18 07:37
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+PG_CREATE = """
+ALTER TABLE vacancies_jobpost ADD COLUMN search_document tsvector GENERATED ALWAYS AS (
+    setweight(to_tsvector('simple', coalesce(title, '')), 'A') ||
+    setweight(to_tsvector('simple', coalesce(skills::text, '')), 'B') ||
+    setweight(to_tsvector('simple', coalesce(description, '')), 'C')
+) STORED;
+CREATE INDEX vacancies_jobpost_search_gin ON vacancies_jobpost USING gin (search_document);
+"""
+
+BATCH_SIZE = 500
+
+PG_DROP = """
+DROP INDEX IF EXISTS vacancies_jobpost_search_gin;
+ALTER TABLE vacancies_jobpost DROP COLUMN IF EXISTS search_document;
+"""
+
+
+def forwards(apps, schema_editor):
+    # PostgreSQL: native full-text (generated ustun + GIN), boshqa DB: inverted index'ni to'ldiramiz
+    if schema_editor.connection.vendor == 'postgresql':
+        schema_editor.execute(PG_CREATE)
+        return
+
+    from vacancies.search import analyze
+
+    JobPost = apps.get_model('vacancies', 'JobPost')
+    JobPostSearchDoc = apps.get_model('vacancies', 'JobPostSearchDoc')
+    JobPostSearchTerm = apps.get_model('vacancies', 'JobPostSearchTerm')
+    # pk bo'yicha partiyalar — katta jadvalda ham xotira BATCH_SIZE bilan cheklangan
+    last_id = 0
+    while True:
+        posts = list(JobPost.objects.filter(pk__gt=last_id).order_by('pk')
+                     .only('id', 'title', 'skills', 'description')[:BATCH_SIZE])
+        if not posts:
+            break
+        docs, terms = [], []
+        for post in posts:
+            post_terms, length = analyze(post)
+            docs.append(JobPostSearchDoc(job_post_id=post.pk, length=length))
+            terms.extend(
+                JobPostSearchTerm(job_post_id=post.pk, term=term, tf=tf, positions=positions, doc_length=length)
+                for term, (tf, positions) in post_terms.items()
+            )
+        JobPostSearchDoc.objects.bulk_create(docs, batch_size=1000)
+        JobPostSearchTerm.objects.bulk_create(terms, batch_size=1000)
+        last_id = posts[-1].pk
+
+
+def backwards(apps, schema_editor):
+    if schema_editor.connection.vendor == 'postgresql':
+        schema_editor.execute(PG_DROP)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('vacancies', '0014_jobpost_rating_aggregates'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='JobPostSearchDoc',
+            fields=[
+                ('job_post', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='search_doc', serialize=False, to='vacancies.jobpost')),
+                ('length', models.FloatField(default=0)),
+            ],
+        ),
+        migrations.CreateModel(
+            name='JobPostSearchTerm',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('term', models.CharField(max_length=64)),
+                ('tf', models.FloatField()),
+                ('positions', models.JSONField(default=list)),
+                ('doc_length', models.FloatField(default=0)),
+                ('job_post', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='search_terms', to='vacancies.jobpost')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['term', 'job_post'], name='vacancies_j_term_1b30dd_idx')],
+            },
+        ),
+        migrations.RunPython(forwards, backwards),
+    ]
@@ -0,0 +1,32 @@
+# Generated by Django 5.2.4 on 2026-10-18 07:39
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('vacancies', '0015_jobpost_search_index'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SkillTag',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=100, unique=True)),
+            ],
+        ),
+        migrations.CreateModel(
+            name='JobPostSkill',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('job_post', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='skill_links', to='vacancies.jobpost')),
+                ('tag', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='job_post_links', to='vacancies.skilltag')),
+            ],
+            options={
+                'constraints': [models.UniqueConstraint(fields=('tag', 'job_post'), name='uniq_jobpost_skill_tag')],
+            },
+        ),
+    ]
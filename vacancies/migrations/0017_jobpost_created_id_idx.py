@@ -0,0 +1,20 @@
+# Generated by Django 5.2.4 on 2026-10-18 07:40
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('companies', '0003_alter_companyfollow_unique_together_and_more'),
+        ('vacancies', '0016_skill_tags'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='jobpost',
+            index=models.Index(fields=['-created_at', '-id'], name='jobpost_created_id_idx'),
+        ),
+    ]
@@ -0,0 +1,24 @@
+# Generated by Django 5.2.4 on 2026-10-18 07:51
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0016_customuser_geohash'),
+        ('vacancies', '0018_jobpost_coordinates'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='RecommendationSet',
+            fields=[
+                ('user', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='recommendation_set', serialize=False, to=settings.AUTH_USER_MODEL)),
+                ('items', models.JSONField(default=list)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+        ),
+    ]
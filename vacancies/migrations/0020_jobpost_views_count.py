@@ -0,0 +1,18 @@
+# Generated by Django 5.2.4 on 2026-10-18 07:59
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('vacancies', '0019_recommendation_set'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='jobpost',
+            name='views_count',
+            field=models.PositiveIntegerField(default=0),
+        ),
+    ]
@@ -0,0 +1,44 @@
+# Generated by Django 5.2.4 on 2026-10-18 08:01
+
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import Q
+from django.utils import timezone
+
+
+def close_expired(apps, schema_editor):
+    JobPost = apps.get_model('vacancies', 'JobPost')
+    (JobPost.objects
+     .filter(Q(is_filled=True) | Q(deadline__lt=timezone.localdate()))
+     .update(is_closed=True, closed_at=timezone.now()))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('companies', '0004_company_views_count'),
+        ('vacancies', '0020_jobpost_views_count'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='jobpost',
+            name='closed_at',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='jobpost',
+            name='is_closed',
+            field=models.BooleanField(default=False),
+        ),
+        migrations.AddIndex(
+            model_name='jobpost',
+            index=models.Index(condition=models.Q(('is_closed', False)), fields=['-created_at', '-id'], name='jobpost_active_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='jobpost',
+            index=models.Index(condition=models.Q(('deadline__isnull', False), ('is_closed', False)), fields=['deadline'], name='jobpost_open_deadline_idx'),
+        ),
+        migrations.RunPython(close_expired, migrations.RunPython.noop),
+    ]
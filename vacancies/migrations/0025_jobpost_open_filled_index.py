@@ -0,0 +1,20 @@
+# Generated by Django 5.2.4 on 2026-10-18 08:48
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('companies', '0006_company_leaderboard'),
+        ('vacancies', '0024_recommendation_update_queue'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='jobpost',
+            index=models.Index(condition=models.Q(('is_closed', False), ('is_filled', True)), fields=['id'], name='jobpost_open_filled_idx'),
+        ),
+    ]
@@ -2,7 +2,8 @@
 from django.db import models
 from django.conf import settings
 from django.core.validators import MinValueValidator, MaxValueValidator
-from django.db.models import Avg
+from django.db.models import Count, F, FloatField, Q, Sum, Value
+from django.db.models.functions import Cast, Coalesce, NullIf
 from accounts.models import CustomUser
 
 # Agar to'g'ridan-to'g'ri import qilishni xohlasang:
@@ -46,6 +47,10 @@ class JobPost(models.Model):
     # 5. Локация
     location = models.CharField(max_length=255, blank=True)
     is_remote = models.BooleanField(default=False)
+    latitude = models.DecimalField(max_digits=9, decimal_places=6, null=True, blank=True)
+    longitude = models.DecimalField(max_digits=9, decimal_places=6, null=True, blank=True)
+    # accounts.geo grid-cell indeksi (pre_save signalda to'ldiriladi)
+    geohash = models.CharField(max_length=12, blank=True, null=True, db_index=True, editable=False)
 
     # 6. Описание работы
     description = models.TextField(blank=True)
@@ -54,14 +59,87 @@ class JobPost(models.Model):
     stars_given = models.PositiveIntegerField(default=4)  # xohlasang 0 qilib qo'yamiz
     deadline = models.DateField(null=True, blank=True)
     is_filled = models.BooleanField(default=False)
+    # muddati o'tgan yoki to'ldirilgan vakansiya (lifecycle.py yozadi, qo'lda yozilmaydi)
+    is_closed = models.BooleanField(default=False)
+    closed_at = models.DateTimeField(null=True, blank=True)
 
     # 🔥 Plan with choices
     plan = models.CharField(max_length=50, choices=PlanChoices.choices, blank=True, null=True)
 
+    # ⭐ Reyting agregatlari (JobPostRating o'zgarganda yangilanadi, qo'lda yozilmaydi)
+    rating_sum = models.PositiveIntegerField(default=0)
+    rating_count = models.PositiveIntegerField(default=0)
+    rating_avg = models.FloatField(default=0)
+    # headhunter_backend.view_counters yozadi (batch UPDATE), qo'lda yozilmaydi
+    views_count = models.PositiveIntegerField(default=0)
+    # trending.py: EPOCH'ga nisbatan so'nuvchi ball (hodisalar inkremental qo'shadi, qo'lda yozilmaydi)
+    trending_score = models.FloatField(default=0)
+    # dedup.py: shu employer'ning deyarli bir xil avvalgi vakansiyasi (klaster ildizi)
+    duplicate_of = models.ForeignKey("self", on_delete=models.SET_NULL, null=True, blank=True,
+                                     related_name="duplicates")
+
+    class Meta:
+        indexes = [
+            # keyset pagination: ORDER BY created_at DESC, id DESC
+            models.Index(fields=["-created_at", "-id"], name="jobpost_created_id_idx"),
+            # faqat ochiq vakansiyalar — ro'yxat yopilganlar soniga bog'liq bo'lmasin
+            models.Index(fields=["-created_at", "-id"], name="jobpost_active_created_idx",
+                         condition=Q(is_closed=False)),
+            # ?ordering=trending
+            models.Index(fields=["-trending_score", "-id"], name="jobpost_trending_idx",
+                         condition=Q(is_closed=False)),
+            # close_expired_jobposts: ochiqlar ichidan `is_filled OR deadline < bugun` —
+            # har bir tarmoq o'z qisman indeksidan o'qiladi (lifecycle.expired_parts)
+            models.Index(fields=["deadline"], name="jobpost_open_deadline_idx",
+                         condition=Q(is_closed=False, deadline__isnull=False)),
+            models.Index(fields=["id"], name="jobpost_open_filled_idx",
+                         condition=Q(is_closed=False, is_filled=True)),
+        ]
+
+    @property
+    def is_active(self):
+        """
+        Ochiq (yopilmagan) vakansiya. applications.ApplyView shu xususiyat bo'yicha yopiq
+        vakansiyaga arizani 400 bilan rad etadi.
+        """
+        return not self.is_closed
+
     @property
     def average_stars(self):
-        avg = self.ratings.aggregate(a=Avg("stars"))["a"]
-        return round(avg) if avg else 0
+        return round(self.rating_avg) if self.rating_count else 0
+
+    @classmethod
+    def apply_rating_delta(cls, pk, stars_delta, count_delta):
+        """Agregatlarni bitta atomar UPDATE bilan siljitadi (o'rtacha ham shu UPDATE ichida)."""
+        new_sum = F("rating_sum") + stars_delta
+        new_count = F("rating_count") + count_delta
+        cls.objects.filter(pk=pk).update(
+            rating_sum=new_sum,
+            rating_count=new_count,
+            rating_avg=Coalesce(
+                Cast(new_sum, FloatField()) / Cast(NullIf(new_count, 0), FloatField()),
+                Value(0.0),
+            ),
+        )
+
+    @classmethod
+    def rebuild_rating_aggregates(cls, ids):
+        """Berilgan postlar uchun agregatlarni JobPostRating dan qaytadan hisoblaydi."""
+        totals = {
+            row["job_post_id"]: row
+            for row in (JobPostRating.objects
+                        .filter(job_post_id__in=ids)
+                        .values("job_post_id")
+                        .annotate(s=Sum("stars"), c=Count("id")))
+        }
+        posts = list(cls.objects.filter(pk__in=ids).only("id"))
+        for post in posts:
+            row = totals.get(post.pk)
+            post.rating_sum = row["s"] if row else 0
+            post.rating_count = row["c"] if row else 0
+            post.rating_avg = post.rating_sum / post.rating_count if post.rating_count else 0
+        cls.objects.bulk_update(posts, ["rating_sum", "rating_count", "rating_avg"])
+        return len(posts)
 
     def __str__(self):
         return self.title
@@ -81,5 +159,85 @@ class JobPostRating(models.Model):
     @property
     def average_stars(self):
         # Bu rating obyektining o'zi emas, balki shu post bo'yicha o'rtacha
-        avg = self.job_post.ratings.aggregate(a=Avg("stars"))["a"]
-        return round(avg) if avg else 0
+        return self.job_post.average_stars
+
+
+class JobPostSearchDoc(models.Model):
+    """Inverted index: hujjat uzunligi (BM25 uchun). PostgreSQL'da ishlatilmaydi."""
+    job_post = models.OneToOneField(JobPost, on_delete=models.CASCADE, primary_key=True, related_name="search_doc")
+    length = models.FloatField(default=0)
+
+
+class JobPostSearchTerm(models.Model):
+    """Inverted index: term -> post (og'irlangan tf va pozitsiyalar bilan)."""
+    job_post = models.ForeignKey(JobPost, on_delete=models.CASCADE, related_name="search_terms")
+    term = models.CharField(max_length=64)
+    tf = models.FloatField()
+    positions = models.JSONField(default=list)
+    doc_length = models.FloatField(default=0)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["term", "job_post"]),
+        ]
+
+
+class SkillTag(models.Model):
+    """Normallashtirilgan skill nomi (kichik harf, ortiqcha bo'shliqlarsiz)."""
+    name = models.CharField(max_length=100, unique=True)
+
+    def __str__(self):
+        return self.name
+
+
+class JobPostSkill(models.Model):
+    """JobPost.skills (JSON) ning indekslangan nusxasi — skills_any / skills_all filtrlari uchun."""
+    job_post = models.ForeignKey(JobPost, on_delete=models.CASCADE, related_name="skill_links")
+    tag = models.ForeignKey(SkillTag, on_delete=models.CASCADE, related_name="job_post_links")
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=["tag", "job_post"], name="uniq_jobpost_skill_tag"),
+        ]
+
+
+class JobPostFingerprint(models.Model):
+    """MinHash imzosi (dedup.NUM_PERM ta uint32) — LSH nomzodlarini tekshirish uchun."""
+    job_post = models.OneToOneField(JobPost, on_delete=models.CASCADE, primary_key=True, related_name="fingerprint")
+    minhash = models.BinaryField()
+
+
+class JobPostLSHBucket(models.Model):
+    """LSH: imzoning har bir bo'lagi (band) hash'i. Qidiruv (employer, key) bo'yicha."""
+    job_post = models.ForeignKey(JobPost, on_delete=models.CASCADE, related_name="lsh_buckets")
+    employer = models.ForeignKey(CustomUser, on_delete=models.CASCADE, related_name="+")
+    key = models.BigIntegerField()
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["employer", "key"], name="jobpost_lsh_employer_key_idx"),
+        ]
+
+
+class RecommendationSet(models.Model):
+    """JOB_SEEKER uchun oldindan hisoblangan top-N vakansiyalar: [[job_post_id, score], ...]."""
+    user = models.OneToOneField(CustomUser, on_delete=models.CASCADE, primary_key=True,
+                                related_name="recommendation_set")
+    items = models.JSONField(default=list)
+    updated_at = models.DateTimeField(auto_now=True)
+    # profil o'zgardi — process_recommendation_updates qayta hisoblaydi
+    is_stale = models.BooleanField(default=False)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["user"], condition=Q(is_stale=True), name="recset_stale_idx"),
+        ]
+
+    def __str__(self):
+        return f"{self.user_id}: {len(self.items)} ta tavsiya"
+
+
+class PendingRecommendationJob(models.Model):
+    """Tavsiya ro'yxatlariga hali qo'shilmagan yangi vakansiyalar (process_recommendation_updates navbati)."""
+    job_post = models.OneToOneField(JobPost, on_delete=models.CASCADE, primary_key=True, related_name="+")
+    created_at = models.DateTimeField(auto_now_add=True)
@@ -0,0 +1,96 @@
+# vacancies/pagination.py
+import base64
+from datetime import datetime
+
+from django.db.models import Q
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import PageNumberPagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+
+
+class JobPostPagination(PageNumberPagination):
+    """
+    Default — oddiy ?page=N (OFFSET + COUNT).
+    ?pagination=cursor yoki ?cursor=<token> — (created_at, id) bo'yicha keyset:
+    OFFSET ham, COUNT(*) ham yo'q, chuqur sahifalar ham birinchi sahifa kabi tez.
+    Keyset faqat default tartibda ishlaydi (masalan ?q= score tartibida page-number qoladi).
+    """
+    cursor_query_param = "cursor"
+    mode_query_param = "pagination"
+    keyset_ordering = ("-created_at", "-id")
+    invalid_cursor_message = "Invalid cursor"
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.use_keyset = self._wants_keyset(request) and self._keyset_compatible(queryset)
+        if not self.use_keyset:
+            return super().paginate_queryset(queryset, request, view)
+        return self._paginate_keyset(queryset, request)
+
+    def get_paginated_response(self, data):
+        if not self.use_keyset:
+            return super().get_paginated_response(data)
+        return Response({
+            "next": self.next_link,
+            "previous": self.previous_link,
+            "results": data,
+        })
+
+    # ---------- keyset ----------
+
+    def _wants_keyset(self, request):
+        return (request.query_params.get(self.cursor_query_param)
+                or request.query_params.get(self.mode_query_param) == "cursor")
+
+    def _keyset_compatible(self, queryset):
+        # ro'yxat (masalan geo natijalar) yoki boshqa tartib — page-number
+        query = getattr(queryset, "query", None)
+        return query is not None and tuple(query.order_by) in {("-created_at",), self.keyset_ordering}
+
+    def _paginate_keyset(self, queryset, request):
+        self.request = request
+        page_size = self.get_page_size(request)
+        token = request.query_params.get(self.cursor_query_param)
+        created_at, pk, reverse = self.decode_cursor(token) if token else (None, None, False)
+
+        if created_at is None:
+            qs = queryset.order_by(*self.keyset_ordering)
+        elif reverse:
+            qs = (queryset
+                  .filter(Q(created_at__gt=created_at) | Q(created_at=created_at, id__gt=pk))
+                  .order_by("created_at", "id"))
+        else:
+            qs = (queryset
+                  .filter(Q(created_at__lt=created_at) | Q(created_at=created_at, id__lt=pk))
+                  .order_by(*self.keyset_ordering))
+
+        rows = list(qs[:page_size + 1])
+        has_more = len(rows) > page_size
+        rows = rows[:page_size]
+        if reverse:
+            rows.reverse()
+
+        has_next = has_more if not reverse else True
+        has_previous = (created_at is not None) if not reverse else has_more
+        self.next_link = self._link(rows[-1], False) if rows and has_next else None
+        self.previous_link = self._link(rows[0], True) if rows and has_previous else None
+        return rows
+
+    def _link(self, obj, reverse):
+        url = self.request.build_absolute_uri()
+        url = remove_query_param(url, self.page_query_param)
+        url = remove_query_param(url, self.mode_query_param)
+        return replace_query_param(url, self.cursor_query_param, self.encode_cursor(obj, reverse))
+
+    @staticmethod
+    def encode_cursor(obj, reverse=False):
+        raw = f"{obj.created_at.isoformat()}|{obj.pk}|{'p' if reverse else 'n'}"
+        return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+    def decode_cursor(self, token):
+        try:
+            padded = token + "=" * (-len(token) % 4)
+            created_at, pk, direction = base64.urlsafe_b64decode(padded.encode()).decode().split("|")
+            return datetime.fromisoformat(created_at), int(pk), direction == "p"
+        except (TypeError, ValueError, UnicodeDecodeError):
+            raise NotFound(self.invalid_cursor_message)
@@ -0,0 +1,357 @@
+# vacancies/recommendations.py
+"""
+JOB_SEEKER'lar uchun shaxsiy vakansiya tavsiyalari.
+
+Ball (0..1) — og'irlangan yig'indi:
+  skills   — vakansiya skill'larining nomzodda bor ulushi (asosiy signal)
+  format   — Resume.work_format <-> JobPost.is_remote
+  salary   — JobPost.budget_max / Resume.desired_salary (1 dan oshmaydi)
+  level    — Resume.experience_level <-> sarlavhadagi junior/middle/senior/lead
+  location — masofa bo'yicha so'nish (remote vakansiya — har doim 1)
+Ma'lum bo'lmagan komponent neytral 0.5 oladi.
+
+Natija RecommendationSet'da (foydalanuvchiga bitta qator, top-N) va keshda saqlanadi.
+So'rov ichida hech narsa qayta hisoblanmaydi — signallar faqat belgi qo'yadi, ishni
+`manage.py process_recommendation_updates` (cron yoki --loop) bajaradi:
+- yangi JobPost — PendingRecommendationJob navbatiga; keyin faqat skill'lari mos
+  nomzodlarning ro'yxatiga qo'shiladi;
+- profil (skill, rezyume, joylashuv) o'zgarsa — RecommendationSet.is_stale, keyin shu
+  foydalanuvchilar qayta hisoblanadi;
+- to'liq qayta hisob: `manage.py rebuild_recommendations` (process pool).
+"""
+import threading
+import time
+
+import numpy as np
+from django.core.cache import cache
+
+from accounts.geo import haversine_km
+from applications.matching import SKILL_PREFIX, load_profiles
+
+from .search import tokenize
+from .skills import skill_names
+
+TOP_N = 100
+CACHE_TIMEOUT = 60 * 60
+CACHE_KEY = "recs:v1:{}"
+INDEX_TTL = 300
+INDEX_REBUILD_INTERVAL = 30  # invalidatsiyadan keyin ham ko'pi bilan shuncha sekundda bir marta
+# JobIndex faqat shu maydonlardan quriladi — boshqa saqlashlar indeksni eskirtirmaydi
+INDEX_FIELDS = ("skills", "is_remote", "budget_min", "budget_max", "title", "latitude", "longitude", "is_closed")
+LOCATION_SCALE_KM = 50.0
+WEIGHTS = {"skills": 0.6, "format": 0.1, "salary": 0.1, "level": 0.1, "location": 0.1}
+LEVELS = ["junior", "middle", "senior", "lead"]
+FORMAT_SCORES = {  # (work_format, is_remote) -> ball
+    ("remote", True): 1.0, ("remote", False): 0.0,
+    ("onsite", True): 0.0, ("onsite", False): 1.0,
+    ("hybrid", True): 0.75, ("hybrid", False): 0.75,
+}
+
+
+class SeekerProfile:
+    __slots__ = ("user_id", "skills", "work_format", "desired_salary", "level", "lat", "lon")
+
+    def __init__(self, user_id, skills=(), work_format="", desired_salary=None, level="", lat=None, lon=None):
+        self.user_id = user_id
+        self.skills = set(skills)
+        self.work_format = work_format or ""
+        self.desired_salary = desired_salary
+        self.level = LEVELS.index(level) if level in LEVELS else -1
+        self.lat = float(lat) if lat is not None else None
+        self.lon = float(lon) if lon is not None else None
+
+
+def load_seekers(users):
+    """CustomUser queryset -> [SeekerProfile] (skill'lar, oxirgi faol rezyume, joylashuv)."""
+    from resume.models import Resume
+
+    skills = {
+        user_id: [f[len(SKILL_PREFIX):] for f in features if f.startswith(SKILL_PREFIX)]
+        for user_id, features in load_profiles(users)
+    }
+    prefs = {}
+    for user_id, work_format, salary, level in (Resume.objects
+                                               .filter(user__in=users.order_by().values("pk"), is_active=True)
+                                               .order_by("-updated_at")
+                                               .values_list("user_id", "work_format", "desired_salary",
+                                                            "experience_level")):
+        prefs.setdefault(user_id, (work_format, salary, level))
+    return [
+        SeekerProfile(user_id, skills.get(user_id, ()), *prefs.get(user_id, ("", None, "")), lat=lat, lon=lon)
+        for user_id, lat, lon in users.order_by().values_list("pk", "latitude", "longitude")
+    ]
+
+
+def title_level(title):
+    tokens = set(tokenize(title))
+    for i in range(len(LEVELS) - 1, -1, -1):
+        if LEVELS[i] in tokens:
+            return i
+    return -1
+
+
+class JobIndex:
+    """Ochiq vakansiyalar numpy massivlarda: skill -> qatorlar (CSC) + har bir komponent ustuni."""
+
+    def __init__(self, rows):
+        n = len(rows)
+        self.job_ids = np.zeros(n, dtype=np.int64)
+        self.is_remote = np.zeros(n, dtype=bool)
+        self.budget_max = np.full(n, np.nan)
+        self.level = np.full(n, -1, dtype=np.int8)
+        self.lat = np.full(n, np.nan)
+        self.lon = np.full(n, np.nan)
+        self.inv_skill_count = np.zeros(n, dtype=np.float32)
+        vocabulary, cols, row_idx = {}, [], []
+        for i, (pk, skills, is_remote, budget_max, title, lat, lon) in enumerate(rows):
+            names = skill_names(skills)
+            self.job_ids[i] = pk
+            self.is_remote[i] = bool(is_remote)
+            if budget_max is not None:
+                self.budget_max[i] = float(budget_max)
+            self.level[i] = title_level(title)
+            if lat is not None and lon is not None:
+                self.lat[i], self.lon[i] = float(lat), float(lon)
+            if names:
+                self.inv_skill_count[i] = 1.0 / len(names)
+            for name in names:
+                cols.append(vocabulary.setdefault(name, len(vocabulary)))
+                row_idx.append(i)
+        cols = np.asarray(cols, dtype=np.int32)
+        order = np.argsort(cols, kind="stable")
+        self.rows = np.asarray(row_idx, dtype=np.int32)[order]
+        self.indptr = np.zeros(len(vocabulary) + 1, dtype=np.int64)
+        if len(cols):
+            np.cumsum(np.bincount(cols, minlength=len(vocabulary)), out=self.indptr[1:])
+        self.vocabulary = vocabulary
+
+    def __len__(self):
+        return len(self.job_ids)
+
+    @classmethod
+    def build(cls, queryset=None):
+        from .models import JobPost
+
+        if queryset is None:
+            queryset = JobPost.objects.filter(budget_min__isnull=False, budget_max__isnull=False, is_closed=False)
+        return cls(list(queryset.order_by().values_list(
+            "pk", "skills", "is_remote", "budget_max", "title", "latitude", "longitude",
+        ).iterator()))
+
+    def score(self, seeker):
+        """float32[len(self)]; skill'i bor nomzod uchun birorta skill mos kelmagan vakansiya — 0."""
+        n = len(self)
+        overlap = np.zeros(n, dtype=np.float32)
+        for name in seeker.skills:
+            col = self.vocabulary.get(name)
+            if col is not None:
+                overlap[self.rows[self.indptr[col]:self.indptr[col + 1]]] += 1
+        skills = overlap * self.inv_skill_count
+
+        if seeker.work_format:
+            fmt = np.where(self.is_remote, FORMAT_SCORES.get((seeker.work_format, True), 0.5),
+                           FORMAT_SCORES.get((seeker.work_format, False), 0.5))
+        else:
+            fmt = np.full(n, 0.5)
+
+        if seeker.desired_salary:
+            salary = np.nan_to_num(np.clip(self.budget_max / float(seeker.desired_salary), 0, 1), nan=0.5)
+        else:
+            salary = np.full(n, 0.5)
+
+        if seeker.level >= 0:
+            level = np.where(self.level >= 0, np.clip(1.0 - 0.5 * np.abs(self.level - seeker.level), 0, 1), 0.5)
+        else:
+            level = np.full(n, 0.5)
+
+        if seeker.lat is not None and seeker.lon is not None:
+            location = np.nan_to_num(np.exp(-haversine_km(seeker.lat, seeker.lon, self.lat, self.lon)
+                                            / LOCATION_SCALE_KM), nan=0.5)
+            location = np.where(self.is_remote, 1.0, location)
+        else:
+            location = np.where(self.is_remote, 1.0, 0.5)
+
+        total = (WEIGHTS["skills"] * skills + WEIGHTS["format"] * fmt + WEIGHTS["salary"] * salary
+                 + WEIGHTS["level"] * level + WEIGHTS["location"] * location).astype(np.float32)
+        if seeker.skills:
+            total[skills == 0] = 0
+        return total
+
+    def top(self, seeker, limit=TOP_N):
+        """[[job_post_id, score], ...] — ball, keyin yangilik bo'yicha."""
+        scores = self.score(seeker)
+        limit = min(limit, int(np.count_nonzero(scores)))
+        if limit <= 0:
+            return []
+        best = np.argpartition(-scores, limit - 1)[:limit]
+        best = best[np.lexsort((-self.job_ids[best], -scores[best]))]
+        return [[int(self.job_ids[i]), round(float(scores[i]), 4)] for i in best]
+
+
+# ---------- process ichidagi vakansiyalar indeksi ----------
+
+_lock = threading.Lock()
+_index = {"value": None, "built_at": 0.0, "version": 0, "built_version": -1}
+
+
+def invalidate_job_index():
+    with _lock:
+        _index["version"] += 1
+
+
+def get_job_index():
+    with _lock:
+        age = time.monotonic() - _index["built_at"]
+        if (_index["value"] is not None and age < INDEX_TTL
+                and (_index["built_version"] == _index["version"] or age < INDEX_REBUILD_INTERVAL)):
+            return _index["value"]
+        version = _index["version"]
+    index = JobIndex.build()
+    with _lock:
+        _index.update(value=index, built_at=time.monotonic(), built_version=version)
+    return index
+
+
+# ---------- saqlash / o'qish ----------
+
+def store(items_by_user):
+    """{user_id: items} -> RecommendationSet (upsert) + kesh."""
+    from .models import RecommendationSet
+
+    if not items_by_user:
+        return
+    RecommendationSet.objects.bulk_create(
+        [RecommendationSet(user_id=user_id, items=items) for user_id, items in items_by_user.items()],
+        update_conflicts=True, unique_fields=["user"], update_fields=["items", "updated_at"],
+    )
+    cache.set_many({CACHE_KEY.format(user_id): items for user_id, items in items_by_user.items()},
+                   CACHE_TIMEOUT)
+
+
+def recompute_users(user_ids, limit=TOP_N, index=None):
+    """Berilgan foydalanuvchilar uchun to'liq qayta hisob. Process pool worker'i ham shu."""
+    from accounts.models import CustomUser
+
+    index = index or get_job_index()
+    seekers = load_seekers(CustomUser.objects.filter(pk__in=list(user_ids)))
+    store({seeker.user_id: index.top(seeker, limit) for seeker in seekers})
+    return len(seekers)
+
+
+def get_recommendations(user):
+    """[[job_post_id, score], ...]: kesh -> RecommendationSet -> joyida hisoblash."""
+    from .models import RecommendationSet
+
+    key = CACHE_KEY.format(user.pk)
+    items = cache.get(key)
+    if items is not None:
+        return items
+    items = RecommendationSet.objects.filter(user=user).values_list("items", flat=True).first()
+    if items is None:
+        recompute_users([user.pk])
+        items = cache.get(key)
+        if items is None:
+            items = RecommendationSet.objects.filter(user=user).values_list("items", flat=True).first() or []
+    else:
+        cache.set(key, items, CACHE_TIMEOUT)
+    return items
+
+
+def add_job_post(job_post, batch_size=500, matrix=None):
+    """
+    Yangi vakansiyani mavjud ro'yxatlarga qo'shadi: faqat skill'lari mos nomzodlar
+    tekshiriladi (applications.matching nomzodlar matritsasi ustunlari orqali).
+    """
+    from accounts.models import CustomUser
+    from applications.matching import get_candidate_matrix
+
+    from .models import RecommendationSet
+
+    names = skill_names(job_post.skills)
+    if not names or job_post.budget_min is None or job_post.budget_max is None:
+        return 0
+    matrix = matrix or get_candidate_matrix()
+    rows = set()
+    for name in names:
+        col = matrix.vocabulary.get(SKILL_PREFIX + name)
+        if col is not None:
+            rows.update(matrix.rows[matrix.indptr[col]:matrix.indptr[col + 1]].tolist())
+    user_ids = [matrix.user_ids[row] for row in rows]
+
+    single = JobIndex([(job_post.pk, job_post.skills, job_post.is_remote, job_post.budget_max,
+                        job_post.title, job_post.latitude, job_post.longitude)])
+    updated = 0
+    for start in range(0, len(user_ids), batch_size):
+        chunk = user_ids[start:start + batch_size]
+        # ro'yxati hali yo'q foydalanuvchilar birinchi so'rovda to'liq hisoblanadi
+        current = dict(RecommendationSet.objects.filter(user_id__in=chunk).values_list("user_id", "items"))
+        if not current:
+            continue
+        changed = {}
+        for seeker in load_seekers(CustomUser.objects.filter(pk__in=list(current))):
+            score = round(float(single.score(seeker)[0]), 4)
+            items = [item for item in current[seeker.user_id] if item[0] != job_post.pk]
+            if score <= 0 or (len(items) >= TOP_N and score <= items[-1][1]):
+                continue
+            items.append([job_post.pk, score])
+            items.sort(key=lambda item: (-item[1], -item[0]))
+            changed[seeker.user_id] = items[:TOP_N]
+        store(changed)
+        updated += len(changed)
+    return updated
+
+
+# ---------- navbat (signallar -> process_recommendation_updates) ----------
+
+def mark_stale(user_id):
+    # ro'yxati hali yo'q foydalanuvchi birinchi so'rovda hisoblanadi
+    from .models import RecommendationSet
+
+    RecommendationSet.objects.filter(user_id=user_id, is_stale=False).update(is_stale=True)
+
+
+def enqueue_job_posts(job_post_ids, using="default"):
+    from .models import PendingRecommendationJob
+
+    PendingRecommendationJob.objects.using(using).bulk_create(
+        [PendingRecommendationJob(job_post_id=pk) for pk in job_post_ids], ignore_conflicts=True,
+    )
+
+
+def process_updates(batch_size=500):
+    """
+    Eskirgan ro'yxatlarni qayta hisoblaydi va navbatdagi vakansiyalarni qo'shadi.
+    Indeks va matritsa har o'tishda yangidan quriladi (web worker'lardagi invalidatsiya
+    bu process'ga yetib kelmaydi). (foydalanuvchilar, vakansiyalar) sonini qaytaradi.
+    """
+    from accounts.models import CustomUser, Role
+    from applications.matching import build_matrix
+
+    from .models import JobPost, PendingRecommendationJob, RecommendationSet
+
+    users = 0
+    stale = RecommendationSet.objects.filter(is_stale=True)
+    if stale.exists():
+        index = JobIndex.build()
+        while True:
+            user_ids = list(stale.order_by("user_id").values_list("user_id", flat=True)[:batch_size])
+            if not user_ids:
+                break
+            # belgini oldin olamiz — hisob paytidagi yangi o'zgarish qayta belgilaydi
+            RecommendationSet.objects.filter(user_id__in=user_ids).update(is_stale=False)
+            recompute_users(user_ids, index=index)
+            users += len(user_ids)
+
+    jobs = 0
+    pending = PendingRecommendationJob.objects.order_by("created_at", "job_post_id")
+    if pending.exists():
+        matrix = build_matrix(CustomUser.objects.filter(role=Role.JOB_SEEKER, is_active=True))
+        while True:
+            job_ids = list(pending.values_list("job_post_id", flat=True)[:batch_size])
+            if not job_ids:
+                break
+            PendingRecommendationJob.objects.filter(job_post_id__in=job_ids).delete()
+            for job_post in JobPost.objects.filter(pk__in=job_ids).order_by("pk"):
+                add_job_post(job_post, matrix=matrix)
+            jobs += len(job_ids)
+    return users, jobs
@@ -0,0 +1,258 @@
+# vacancies/search.py
+"""
+Vakansiyalar uchun full-text qidiruv.
+
+- SQLite (dev): o'zimizning inverted index (JobPostSearchTerm / JobPostSearchDoc)
+  va BM25 reyting.
+- PostgreSQL: `search_document` generated tsvector ustuni + GIN index
+  (0015 migratsiyasi yaratadi), reyting ts_rank_cd bilan.
+
+So'rov sintaksisi:  python django      -> ikkala so'z ham bo'lishi shart (AND)
+                    "senior developer" -> ibora (so'zlar ketma-ket)
+                    reac*              -> prefix
+"""
+import math
+import re
+from collections import defaultdict
+
+from django.db import connections
+from django.db.models import Avg, BooleanField, Count, FloatField
+from django.db.models.expressions import RawSQL
+
+TOKEN_RE = re.compile(r"\w+", re.UNICODE)
+QUERY_RE = re.compile(r'"([^"]*)"|(\S+)')
+
+# maydon og'irliklari va pozitsiya offset'lari (ibora maydonlar orasidan o'tib ketmasin)
+FIELD_WEIGHTS = {"title": 3.0, "skills": 2.0, "description": 1.0}
+FIELD_OFFSETS = {"title": 0, "skills": 1_000, "description": 100_000}
+
+MAX_TERM_LENGTH = 64
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+
+def tokenize(text):
+    return [t[:MAX_TERM_LENGTH] for t in TOKEN_RE.findall((text or "").lower())]
+
+
+def _skills_text(skills):
+    if isinstance(skills, (list, tuple)):
+        return [str(s) for s in skills if s]
+    if isinstance(skills, str):
+        return [skills]
+    return []
+
+
+def analyze(post):
+    """JobPost -> ({term: [weighted_tf, [positions]]}, doc_length)."""
+    terms = {}
+    length = 0.0
+
+    def add(field, tokens, start):
+        nonlocal length
+        weight = FIELD_WEIGHTS[field]
+        for i, token in enumerate(tokens):
+            entry = terms.setdefault(token, [0.0, []])
+            entry[0] += weight
+            entry[1].append(FIELD_OFFSETS[field] + start + i)
+        length += weight * len(tokens)
+
+    add("title", tokenize(post.title), 0)
+    pos = 0
+    for skill in _skills_text(post.skills):
+        tokens = tokenize(skill)
+        add("skills", tokens, pos)
+        pos += len(tokens) + 1  # skill'lar orasida bo'shliq — ibora bir skilldan boshqasiga o'tmaydi
+    add("description", tokenize(post.description), 0)
+    return terms, length
+
+
+# ---------- so'rovni parse qilish ----------
+
+class Clause:
+    TERM, PREFIX, PHRASE = "term", "prefix", "phrase"
+
+    def __init__(self, kind, tokens):
+        self.kind = kind
+        self.tokens = tokens
+
+    def __repr__(self):
+        return f"Clause({self.kind}, {self.tokens})"
+
+
+def parse_query(q):
+    clauses = []
+    for phrase, word in QUERY_RE.findall(q or ""):
+        if phrase:
+            tokens = tokenize(phrase)
+            if tokens:
+                clauses.append(Clause(Clause.PHRASE if len(tokens) > 1 else Clause.TERM, tokens))
+            continue
+        tokens = tokenize(word)
+        if not tokens:
+            continue
+        if word.endswith("*") and len(tokens) == 1:
+            clauses.append(Clause(Clause.PREFIX, tokens))
+        elif len(tokens) > 1:
+            # "node.js" kabi so'zlar bir nechta tokenga bo'linadi — ibora sifatida qidiramiz
+            clauses.append(Clause(Clause.PHRASE, tokens))
+        else:
+            clauses.append(Clause(Clause.TERM, tokens))
+    return clauses
+
+
+# ---------- indekslash ----------
+
+def uses_native_search(using="default"):
+    return connections[using].vendor == "postgresql"
+
+
+def index_jobposts(posts, using="default"):
+    """Postlarni (qayta) indekslaydi. PostgreSQL'da generated ustun o'zi yangilanadi."""
+    from .models import JobPostSearchDoc, JobPostSearchTerm
+
+    posts = list(posts)
+    if not posts or uses_native_search(using):
+        return
+    ids = [p.pk for p in posts]
+    term_rows, doc_rows = [], []
+    for post in posts:
+        terms, length = analyze(post)
+        doc_rows.append(JobPostSearchDoc(job_post_id=post.pk, length=length))
+        for term, (tf, positions) in terms.items():
+            term_rows.append(JobPostSearchTerm(
+                job_post_id=post.pk, term=term, tf=tf, positions=positions, doc_length=length,
+            ))
+
+    JobPostSearchTerm.objects.using(using).filter(job_post_id__in=ids).delete()
+    JobPostSearchDoc.objects.using(using).filter(job_post_id__in=ids).delete()
+    JobPostSearchDoc.objects.using(using).bulk_create(doc_rows, batch_size=1000)
+    JobPostSearchTerm.objects.using(using).bulk_create(term_rows, batch_size=1000)
+
+
+# ---------- BM25 (SQLite / inverted index) ----------
+
+def _phrase_tf(position_lists):
+    """Har bir token pozitsiyalari ro'yxati -> ibora necha marta ketma-ket uchraydi."""
+    first, rest = position_lists[0], [set(p) for p in position_lists[1:]]
+    return sum(1 for p in first if all((p + i + 1) in s for i, s in enumerate(rest)))
+
+
+def _bm25(tf, df, n_docs, dl, avgdl):
+    idf = math.log(1 + (n_docs - df + 0.5) / (df + 0.5))
+    norm = tf + BM25_K1 * (1 - BM25_B + BM25_B * dl / (avgdl or 1.0))
+    return idf * tf * (BM25_K1 + 1) / norm
+
+
+def rank_with_index(queryset, clauses):
+    """[(job_post_id, score), ...] — mos kelgan hamma hujjatlar, score bo'yicha kamayish tartibida."""
+    from .models import JobPostSearchDoc, JobPostSearchTerm
+
+    using = queryset.db
+    stats = JobPostSearchDoc.objects.using(using).aggregate(n=Count("job_post_id"), avgdl=Avg("length"))
+    n_docs, avgdl = stats["n"] or 0, stats["avgdl"] or 0.0
+    if not n_docs:
+        return []
+
+    candidate_ids = queryset.order_by().values("pk")
+    postings = JobPostSearchTerm.objects.using(using).filter(job_post_id__in=candidate_ids)
+
+    clause_hits = []  # har bir clause uchun {doc_id: [(tf, df), ...]}
+    lengths = {}
+    for clause in clauses:
+        hits = defaultdict(list)
+        if clause.kind == Clause.PHRASE:
+            per_token = []
+            for token in clause.tokens:
+                rows = list(postings.filter(term=token).values_list("job_post_id", "positions", "doc_length"))
+                per_token.append({doc_id: positions for doc_id, positions, _ in rows})
+                lengths.update((doc_id, dl) for doc_id, _, dl in rows)
+            common = set(per_token[0]).intersection(*per_token[1:])
+            matched = {}
+            for doc_id in common:
+                count = _phrase_tf([positions[doc_id] for positions in per_token])
+                if count:
+                    matched[doc_id] = count
+            for doc_id, count in matched.items():
+                hits[doc_id].append((float(count), len(matched)))
+        else:
+            if clause.kind == Clause.PREFIX:
+                prefix = clause.tokens[0]
+                rows = postings.filter(term__gte=prefix, term__lt=prefix + "\uffff")
+            else:
+                rows = postings.filter(term=clause.tokens[0])
+            rows = list(rows.values_list("job_post_id", "term", "tf", "doc_length"))
+            df = defaultdict(int)
+            for _, term, _, _ in rows:
+                df[term] += 1
+            for doc_id, term, tf, dl in rows:
+                hits[doc_id].append((tf, df[term]))
+                lengths[doc_id] = dl
+        if not hits:
+            return []
+        clause_hits.append(hits)
+
+    # AND: hamma clause'lar mos kelgan hujjatlar
+    doc_ids = set(clause_hits[0]).intersection(*clause_hits[1:])
+    scored = []
+    for doc_id in doc_ids:
+        dl = lengths.get(doc_id, avgdl)
+        score = 0.0
+        for hits in clause_hits:
+            for tf, df in hits[doc_id]:
+                score += _bm25(tf, df, n_docs, dl, avgdl)
+        scored.append((doc_id, score))
+    scored.sort(key=lambda item: (-item[1], -item[0]))
+    return scored
+
+
+# ---------- PostgreSQL native ----------
+
+def build_tsquery(clauses):
+    parts = []
+    for clause in clauses:
+        if clause.kind == Clause.PHRASE:
+            parts.append("(" + " <-> ".join(clause.tokens) + ")")
+        elif clause.kind == Clause.PREFIX:
+            parts.append(f"{clause.tokens[0]}:*")
+        else:
+            parts.append(clause.tokens[0])
+    return " & ".join(parts)
+
+
+def _native_search(queryset, clauses):
+    from .models import JobPost
+
+    column = f'"{JobPost._meta.db_table}"."search_document"'
+    tsquery = build_tsquery(clauses)
+    return (queryset
+            .filter(RawSQL(f"{column} @@ to_tsquery('simple', %s)", (tsquery,), output_field=BooleanField()))
+            .annotate(search_rank=RawSQL(f"ts_rank_cd({column}, to_tsquery('simple', %s), 32)",
+                                         (tsquery,), output_field=FloatField()))
+            .order_by("-search_rank", "-created_at"))
+
+
+# ---------- tashqi API ----------
+
+def search_jobposts(queryset, q):
+    """queryset'ni q bo'yicha filtrlaydi va `search_rank` bo'yicha tartiblaydi."""
+    clauses = parse_query(q)
+    if not clauses:
+        return queryset
+    if uses_native_search(queryset.db):
+        return _native_search(queryset, clauses)
+
+    ranked = rank_with_index(queryset, clauses)
+    if not ranked:
+        return queryset.none()
+    # oddiy CASE ... WHEN: minglab When() ifodasini kompilyatsiya qilishdan ancha arzon.
+    # Qiymatlar o'zimiz hisoblagan int/float — literal qilib yoziladi, aks holda katta natijada
+    # SQLite parametrlar limitiga (SQLITE_MAX_VARIABLE_NUMBER) uriladi. Cheklov yo'q: count va
+    # sahifalash PostgreSQL'dagidek butun natija bo'yicha.
+    column = f'"{queryset.model._meta.db_table}"."{queryset.model._meta.pk.column}"'
+    whens = "".join(f"WHEN {int(doc_id)} THEN {float(score)!r} " for doc_id, score in ranked)
+    # BM25 score doim > 0, mos kelmaganlar ELSE 0 ga tushadi
+    return (queryset
+            .annotate(search_rank=RawSQL(f"CASE {column} {whens}ELSE 0 END", (), output_field=FloatField()))
+            .filter(search_rank__gt=0)
+            .order_by("-search_rank", "-created_at"))
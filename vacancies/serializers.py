@@ -1,10 +1,86 @@
 from rest_framework import serializers
+from rest_framework.exceptions import ValidationError
 
 from companies.serializers import CompanySerializer
-from .models import JobPost
+from headhunter_backend.view_counters import pending_views
+from headhunter_backend.viewer_state import ViewerStateListSerializer, register_relation, viewer_state
+from .loaders import JobPostPageLoader
+from .trending import current_score
+from .models import JobPost, JobPostRating
 from django.utils.timesince import timesince
-from companies.models import Company
-from django.utils.functional import cached_property
+
+
+def _rated_jobposts(user, ids):
+    return dict(JobPostRating.objects.filter(user=user, job_post_id__in=ids).values_list("job_post_id", "stars"))
+
+
+register_relation("jobpost_rating", _rated_jobposts)
+
+
+class JobPostListSerializer(ViewerStateListSerializer):
+    """Sahifadagi barcha postlar uchun loader'ni bir marta quradi va child'ga beradi (+ viewer munosabatlari)."""
+
+    def to_representation(self, data):
+        posts = list(data.all() if hasattr(data, "all") else data)
+        request = self.context.get("request", None)
+        self.child.page_loader = JobPostPageLoader(posts, getattr(request, "user", None))
+        self.child.company_data = {}
+        return super().to_representation(posts)
+
+
+# ?fields=compact — kartochka uchun yengil ro'yxat
+COMPACT_FIELDS = ["id", "title", "budget", "location", "is_remote", "skills", "timeAgo", "average_stars",
+                  "created_at"]
+# qimmat (qo'shimcha so'rovli) maydonlar — ?fields= / ?expand= berilganda faqat so'ralsa qaytadi
+EXPANDABLE_FIELDS = {"company", "otherVacancies"}
+# serializer maydoni -> kerakli model ustunlari (.only() uchun)
+METHOD_FIELD_COLUMNS = {
+    "average_stars": ["rating_avg", "rating_count"],
+    "ratings_count": ["rating_count"],
+    "budget": ["budget_min", "budget_max"],
+    "timeAgo": ["created_at"],
+    "user_rating": [],
+    "company": ["employer"],
+    "otherVacancies": ["employer"],
+    "views_count": ["views_count"],
+    "trending_score": ["trending_score"],
+}
+# keyset cursor va loader'lar doim ishlatadi
+ALWAYS_LOADED_COLUMNS = ["id", "created_at", "employer"]
+
+
+def _split(value):
+    return [item.strip() for item in (value or "").split(",") if item.strip()]
+
+
+def parse_sparse_fields(query_params):
+    """?fields=a,b / ?expand=c -> (fields yoki None, expand yoki None). Noma'lum nom — 400."""
+    fields_param, expand_param = query_params.get("fields"), query_params.get("expand")
+    if fields_param is None and expand_param is None:
+        return None, None
+    fields = []
+    for name in _split(fields_param):
+        fields.extend(COMPACT_FIELDS if name == "compact" else [name])
+    expand = _split(expand_param)
+
+    known = set(JobPostSerializer().fields)
+    unknown = sorted({name for name in fields + expand if name not in known})
+    if unknown:
+        raise ValidationError({"fields": [f"Noma'lum maydon: {', '.join(unknown)}"]})
+    return (fields or None), set(expand)
+
+
+def jobpost_columns(fields, expand):
+    """Tanlangan serializer maydonlari uchun .only() ga beriladigan model ustunlari."""
+    model_fields = {f.name for f in JobPost._meta.concrete_fields}
+    names = set(fields) if fields else set(JobPostSerializer().fields) - EXPANDABLE_FIELDS
+    columns = set(ALWAYS_LOADED_COLUMNS)
+    for name in names | set(expand or ()):
+        if name in METHOD_FIELD_COLUMNS:
+            columns.update(METHOD_FIELD_COLUMNS[name])
+        elif name in model_fields:
+            columns.add(name)
+    return sorted(columns)
 
 
 class JobPostSerializer(serializers.ModelSerializer):
@@ -15,23 +91,44 @@ class JobPostSerializer(serializers.ModelSerializer):
     ratings_count = serializers.SerializerMethodField()
     company = serializers.SerializerMethodField()
     otherVacancies = serializers.SerializerMethodField()
+    views_count = serializers.SerializerMethodField()
+    trending_score = serializers.SerializerMethodField()
 
     # deadline ni keyin qo‘shamiz
 
     class Meta:
         model = JobPost
         fields = '__all__'  # yoki field list bo‘lsa, 'budget' ni ham qo‘sh
-        read_only_fields = ['employer', 'created_at']
+        read_only_fields = ['employer', 'created_at', 'rating_sum', 'rating_count', 'rating_avg',
+                            'is_closed', 'closed_at', 'duplicate_of']
+        list_serializer_class = JobPostListSerializer
+        viewer_relations = ("jobpost_rating",)
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # context["fields"] / ["expand"] — viewset parse_sparse_fields bilan to'ldiradi
+        fields, expand = self.context.get("fields"), self.context.get("expand")
+        if fields is None and expand is None:
+            return
+        allowed = set(fields) if fields else set(self.fields) - EXPANDABLE_FIELDS
+        allowed |= expand or set()
+        for name in list(self.fields):
+            if name not in allowed:
+                self.fields.pop(name)
+
+    def _loader(self, obj):
+        loader = getattr(self, "page_loader", None)
+        if loader is not None and obj in loader:
+            return loader
+        # detail / create: bitta obyekt uchun o'sha loader
+        request = self.context.get("request", None)
+        return JobPostPageLoader([obj], getattr(request, "user", None))
 
     def get_average_stars(self, obj):
         return obj.average_stars
 
     def get_user_rating(self, obj):
-        request = self.context.get("request", None)
-        if request and not request.user.is_anonymous:
-            rating = obj.ratings.filter(user=request.user).first()
-            return rating.stars if rating else 0
-        return 0
+        return viewer_state(self.context.get("request")).get("jobpost_rating", obj.pk, 0)
 
     def get_timeAgo(self, obj):
         return timesince(obj.created_at).split(',')[0] + " назад"
@@ -46,25 +143,28 @@ class JobPostSerializer(serializers.ModelSerializer):
         return "Не указано"
 
     def get_ratings_count(self, obj):
-        return obj.ratings.count()
+        return obj.rating_count
 
     def get_company(self, obj):
         # employer = obj.employer (foydalanuvchi)
-        company = Company.objects.filter(owner=obj.employer).first()
-        if company:
+        company = self._loader(obj).get_company(obj)
+        if not company:
+            return None
+        # bir xil employer'ning postlari sahifada ko'p bo'lsa, kompaniya bir marta serializatsiya qilinadi
+        cache = getattr(self, "company_data", None)
+        if cache is None:
             return CompanySerializer(company, context=self.context).data
-        return None
+        if company.pk not in cache:
+            cache[company.pk] = CompanySerializer(company, context=self.context).data
+        return cache[company.pk]
+
+    def get_views_count(self, obj):
+        # bazadagi qiymat + shu process'da hali yozilmagan ko'rishlar
+        return obj.views_count + pending_views("vacancies.JobPost", obj.pk)
+
+    def get_trending_score(self, obj):
+        return round(current_score(obj.trending_score), 4)
 
     def get_otherVacancies(self, obj):
-        other_qs = JobPost.objects.filter(
-            employer=obj.employer,
-            is_filled=False  # faqat ochiq (active)
-        ).exclude(id=obj.id)[:5]  # bu vakansiyadan tashqari
-
-        return [
-            {
-                "id": vacancy.id,
-                "title": vacancy.title
-            }
-            for vacancy in other_qs
-        ]
+        # faqat ochiq (active), bu vakansiyadan tashqari
+        return self._loader(obj).get_other_vacancies(obj)
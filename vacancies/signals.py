@@ -0,0 +1,126 @@
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
+
+from accounts.geo import fill_geohash
+from accounts.models import CustomUser, Role, Skill
+from headhunter_backend.response_cache import COMPANIES, JOBPOSTS, invalidate_on_commit
+from resume.models import Resume
+
+from headhunter_backend.view_counters import register_flush_update
+
+from . import dedup, recommendations, trending
+from .lifecycle import sync_closed_state
+from .models import JobPost, JobPostRating
+from .search import index_jobposts
+from .skills import sync_skill_tags
+
+
+@receiver([post_save, post_delete], sender=JobPost)
+def invalidate_job_post_responses(sender, **kwargs):
+    # kompaniya javoblarida ham vakansiyalar soni bor
+    invalidate_on_commit(JOBPOSTS, COMPANIES)
+
+
+# ko'rishlar trending balliga view counter flush'ining o'sha UPDATE'ida qo'shiladi
+register_flush_update("vacancies.JobPost", trending.view_updates)
+
+
+@receiver([post_save, post_delete], sender=JobPostRating)
+def invalidate_rating_responses(sender, **kwargs):
+    invalidate_on_commit(JOBPOSTS)
+
+
+@receiver(post_delete, sender=JobPostRating)
+def remove_rating_from_aggregates(sender, instance, **kwargs):
+    # user o'chirilganda (CASCADE) ham agregatlar to'g'ri qolsin
+    JobPost.apply_rating_delta(instance.job_post_id, -instance.stars, -1)
+
+
+# qidiruv indeksi va dublikat imzosi faqat shu maydonlardan quriladi
+TEXT_FIELDS = ("title", "skills", "description")
+
+
+@receiver(pre_save, sender=JobPost)
+def remember_job_post_text(sender, instance, raw=False, update_fields=None, **kwargs):
+    # baho, yopish kabi matnsiz saqlashlarda indekslar qayta qurilmasin
+    instance._text_old = None
+    if raw or not instance.pk or (update_fields is not None and not set(TEXT_FIELDS) & set(update_fields)):
+        return
+    instance._text_old = JobPost.objects.filter(pk=instance.pk).values_list(*TEXT_FIELDS).first()
+
+
+def text_changed(instance, created=False, update_fields=None):
+    if created:
+        return True
+    if update_fields is not None and not set(TEXT_FIELDS) & set(update_fields):
+        return False
+    old = getattr(instance, "_text_old", None)
+    return old is None or old != tuple(getattr(instance, field) for field in TEXT_FIELDS)
+
+
+@receiver(post_save, sender=JobPost)
+def reindex_job_post(sender, instance, created=False, raw=False, using="default", update_fields=None, **kwargs):
+    # o'chirilganda index qatorlari CASCADE bilan ketadi
+    if not raw and text_changed(instance, created, update_fields):
+        index_jobposts([instance], using=using)
+
+
+@receiver(post_save, sender=JobPost)
+def sync_job_post_skills(sender, instance, raw=False, using="default", **kwargs):
+    if not raw:
+        sync_skill_tags([instance], using=using)
+
+
+@receiver(post_save, sender=JobPost)
+def index_job_post_fingerprint(sender, instance, created=False, raw=False, using="default", update_fields=None,
+                               **kwargs):
+    # matn (title / description / skills) o'zgarsa imzo qayta hisoblanadi va duplicate_of yangilanadi
+    if not raw and text_changed(instance, created, update_fields):
+        dedup.index_jobposts([instance], using=using)
+
+
+@receiver(pre_save, sender=JobPost)
+def set_job_post_geohash(sender, instance, **kwargs):
+    fill_geohash(instance)
+
+
+@receiver(pre_save, sender=JobPost)
+def set_job_post_closed_state(sender, instance, raw=False, **kwargs):
+    if not raw:
+        sync_closed_state(instance)
+
+
+# ---------- tavsiyalar ----------
+
+@receiver(post_save, sender=JobPost)
+def add_job_post_to_recommendations(sender, instance, created=False, raw=False, using="default",
+                                    update_fields=None, **kwargs):
+    # hisob so'rov ichida emas — process_recommendation_updates navbatdan oladi
+    if raw:
+        return
+    if created:
+        recommendations.enqueue_job_posts([instance.pk], using=using)
+    if update_fields is None or set(recommendations.INDEX_FIELDS) & set(update_fields):
+        recommendations.invalidate_job_index()
+
+
+@receiver(post_delete, sender=JobPost)
+def drop_job_post_from_index(sender, instance, **kwargs):
+    # saqlangan ro'yxatlardagi o'chgan id'lar o'qishda tashlab yuboriladi
+    recommendations.invalidate_job_index()
+
+
+@receiver([post_save, post_delete], sender=Skill)
+@receiver([post_save, post_delete], sender=Resume)
+def refresh_recommendations_on_profile_change(sender, instance, raw=False, **kwargs):
+    if not raw:
+        recommendations.mark_stale(instance.user_id)
+
+
+@receiver(post_save, sender=CustomUser)
+def refresh_recommendations_on_location_change(sender, instance, raw=False, update_fields=None, **kwargs):
+    if raw or instance.role != Role.JOB_SEEKER:
+        return
+    if update_fields and not {"latitude", "longitude"} & set(update_fields):
+        return
+    recommendations.mark_stale(instance.pk)
@@ -0,0 +1,84 @@
+# vacancies/skills.py
+from collections import defaultdict
+
+from django.db.models import Count
+
+MAX_SKILL_LENGTH = 100
+
+
+def normalize_skill(name):
+    return " ".join(str(name).split()).lower()[:MAX_SKILL_LENGTH]
+
+
+def skill_names(raw):
+    """JobPost.skills (list yoki "a, b" satr) -> takrorlanmas normallashgan nomlar."""
+    if isinstance(raw, str):
+        raw = raw.split(",")
+    if not isinstance(raw, (list, tuple)):
+        return []
+    names = []
+    for item in raw:
+        name = normalize_skill(item) if item else ""
+        if name and name not in names:
+            names.append(name)
+    return names
+
+
+def get_or_create_tags(names, using="default"):
+    """{name: tag_id} — yo'q teglar bulk_create bilan yaratiladi."""
+    from .models import SkillTag
+
+    names = set(names)
+    if not names:
+        return {}
+    tags = dict(SkillTag.objects.using(using).filter(name__in=names).values_list("name", "id"))
+    missing = names - tags.keys()
+    if missing:
+        SkillTag.objects.using(using).bulk_create(
+            [SkillTag(name=name) for name in missing], ignore_conflicts=True
+        )
+        tags.update(SkillTag.objects.using(using).filter(name__in=missing).values_list("name", "id"))
+    return tags
+
+
+def sync_skill_tags(posts, using="default"):
+    """JobPostSkill qatorlarini postlarning JSON skills ro'yxatiga moslaydi."""
+    from .models import JobPostSkill
+
+    wanted = {p.pk: skill_names(p.skills) for p in posts}
+    if not wanted:
+        return
+    current = defaultdict(set)
+    for job_post_id, name in (JobPostSkill.objects.using(using)
+                              .filter(job_post_id__in=wanted.keys())
+                              .values_list("job_post_id", "tag__name")):
+        current[job_post_id].add(name)
+    changed = {pk: names for pk, names in wanted.items() if set(names) != current[pk]}
+    if not changed:
+        return
+
+    tag_ids = get_or_create_tags({name for names in changed.values() for name in names}, using=using)
+    JobPostSkill.objects.using(using).filter(job_post_id__in=changed.keys()).delete()
+    JobPostSkill.objects.using(using).bulk_create([
+        JobPostSkill(job_post_id=pk, tag_id=tag_ids[name])
+        for pk, names in changed.items() for name in names
+    ], batch_size=1000)
+
+
+def posts_with_any_skill(names, using="default"):
+    from .models import JobPostSkill
+
+    return (JobPostSkill.objects.using(using)
+            .filter(tag__name__in=names)
+            .values("job_post_id"))
+
+
+def posts_with_all_skills(names, using="default"):
+    from .models import JobPostSkill
+
+    return (JobPostSkill.objects.using(using)
+            .filter(tag__name__in=names)
+            .values("job_post_id")
+            .annotate(matched=Count("tag_id"))
+            .filter(matched=len(names))
+            .values("job_post_id"))
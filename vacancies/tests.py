@@ -1,3 +1,405 @@
-from django.test import TestCase
+import csv
+import json
+from datetime import timedelta
+from importlib import import_module
+from io import StringIO
+from types import SimpleNamespace
+from unittest.mock import patch
 
-# Create your tests here.
+from django.apps import apps as django_apps
+from django.core.management import call_command
+from django.db import connection
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from rest_framework.test import APITestCase
+
+from accounts.models import CustomUser, Skill
+from companies.models import Company, CompanyFollow
+from headhunter_backend import view_counters
+from . import dedup, recommendations
+from .lifecycle import close_expired
+from .models import (
+    JobPost, JobPostRating, JobPostSearchDoc, JobPostSearchTerm, PendingRecommendationJob, RecommendationSet,
+)
+from .search import index_jobposts
+
+
+# javob keshi so'rovlar sonini yashirmasin
+@override_settings(CACHES={"default": {"BACKEND": "django.core.cache.backends.dummy.DummyCache"}})
+class JobPostListQueryCountTests(APITestCase):
+    url = "/api/vacancies/jobposts/"
+
+    def setUp(self):
+        self.seeker = CustomUser.objects.create_user(
+            username="seeker", email="seeker@example.com", password="x", role="JOB_SEEKER"
+        )
+        self.employers = []
+        for i in range(4):
+            employer = CustomUser.objects.create_user(
+                username=f"employer{i}", email=f"employer{i}@example.com", password="x", role="EMPLOYER"
+            )
+            company = Company.objects.create(owner=employer, name=f"Company {i}")
+            CompanyFollow.objects.create(company=company, user=self.seeker)
+            self.employers.append((employer, company))
+
+    def _create_posts(self, count):
+        for i in range(count):
+            employer, company = self.employers[i % len(self.employers)]
+            post = JobPost.objects.create(
+                employer=employer, company=company, title=f"Vacancy {i}",
+                budget_min=100, budget_max=200,
+            )
+            if i % 2 == 0:
+                JobPostRating.objects.create(job_post=post, user=self.seeker, stars=4)
+
+    def _count_queries(self):
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.get(self.url)
+        self.assertEqual(response.status_code, 200)
+        return len(ctx.captured_queries), response.json()
+
+    def test_query_count_does_not_grow_with_page_size(self):
+        self._create_posts(2)
+        small, _ = self._count_queries()
+
+        self._create_posts(8)
+        large, data = self._count_queries()
+
+        self.assertEqual(len(data["results"]), 10)
+        self.assertEqual(small, large)
+
+    def test_query_count_is_constant_for_authenticated_viewer(self):
+        self.client.force_authenticate(self.seeker)
+        self._create_posts(2)
+        small, _ = self._count_queries()
+
+        self._create_posts(8)
+        large, data = self._count_queries()
+
+        self.assertEqual(small, large)
+        rated = [row for row in data["results"] if row["user_rating"] == 4]
+        self.assertEqual(len(rated), 5)
+        self.assertTrue(all(row["company"]["is_following"] for row in data["results"]))
+
+    def test_other_vacancies_exclude_current_post(self):
+        self._create_posts(12)
+        _, data = self._count_queries()
+        for row in data["results"]:
+            other_ids = [v["id"] for v in row["otherVacancies"]]
+            self.assertNotIn(row["id"], other_ids)
+            self.assertLessEqual(len(other_ids), 5)
+        self.assertEqual(len(data["results"][0]["otherVacancies"]), 2)
+
+
+class JobPostSearchIndexTests(APITestCase):
+    def setUp(self):
+        self.employer = CustomUser.objects.create_user(
+            username="employer", email="employer@example.com", password="x", role="EMPLOYER"
+        )
+        self.post = JobPost.objects.create(employer=self.employer, title="Python developer",
+                                           description="Django va PostgreSQL", skills=["Python"])
+
+    def _term_ids(self):
+        return set(JobPostSearchTerm.objects.filter(job_post=self.post).values_list("pk", flat=True))
+
+    def test_save_without_text_change_keeps_index(self):
+        before = self._term_ids()
+        self.assertTrue(before)
+
+        self.post.is_filled = True
+        self.post.save(update_fields=["is_filled"])
+        self.post.budget_max = 500
+        self.post.save()
+
+        self.assertEqual(self._term_ids(), before)
+
+    def test_text_change_reindexes(self):
+        self.post.title = "Golang engineer"
+        self.post.save()
+
+        terms = set(JobPostSearchTerm.objects.filter(job_post=self.post).values_list("term", flat=True))
+        self.assertIn("golang", terms)
+        self.assertNotIn("developer", terms)
+
+    def test_migration_backfill_runs_in_batches(self):
+        JobPost.objects.create(employer=self.employer, title="Second", description="lorem")
+        JobPost.objects.create(employer=self.employer, title="Third", description="ipsum")
+        JobPostSearchDoc.objects.all().delete()
+        JobPostSearchTerm.objects.all().delete()
+
+        backfill = import_module("vacancies.migrations.0015_jobpost_search_index")
+        editor = SimpleNamespace(connection=SimpleNamespace(vendor="sqlite"))
+        with patch.object(backfill, "BATCH_SIZE", 2):
+            backfill.forwards(django_apps, editor)
+
+        self.assertEqual(JobPostSearchDoc.objects.count(), 3)
+        self.assertTrue(JobPostSearchTerm.objects.filter(term="third").exists())
+
+
+class JobPostFullTextSearchTests(APITestCase):
+    url = "/api/vacancies/jobposts/"
+
+    def setUp(self):
+        self.employer = CustomUser.objects.create_user(
+            username="employer", email="employer@example.com", password="x", role="EMPLOYER"
+        )
+
+    def _create(self, title, description=""):
+        return JobPost.objects.create(employer=self.employer, title=title, description=description,
+                                      budget_min=100, budget_max=200)
+
+    def test_count_and_pages_cover_every_match(self):
+        # ilgari SQLite yo'lida natija 1000 taga kesilardi — PostgreSQL'da esa cheklov yo'q edi
+        best = self._create("Python developer")
+        # bulk_create signal yubormaydi — index qo'lda
+        index_jobposts(JobPost.objects.bulk_create([
+            JobPost(employer=self.employer, title=f"Vacancy {i}", description="python",
+                    budget_min=100, budget_max=200)
+            for i in range(1010)
+        ]))
+        self._create("Golang engineer")
+
+        response = self.client.get(self.url, {"q": "python"})
+        self.assertEqual(response.status_code, 200)
+        body = response.json()
+        self.assertEqual(body["count"], 1011)
+        self.assertEqual(body["results"][0]["id"], best.pk)
+
+        last = self.client.get(self.url, {"q": "python", "page": 102}).json()
+        self.assertEqual(len(last["results"]), 1)
+
+
+class RecommendationUpdateTests(APITestCase):
+    def setUp(self):
+        self.employer = CustomUser.objects.create_user(
+            username="employer", email="employer@example.com", password="x", role="EMPLOYER"
+        )
+        self.seeker = CustomUser.objects.create_user(
+            username="seeker", email="seeker@example.com", password="x", role="JOB_SEEKER"
+        )
+        Skill.objects.create(user=self.seeker, name="Python")
+        self.python_job = self._job("Python developer", ["Python"])
+        recommendations.recompute_users([self.seeker.pk])
+        PendingRecommendationJob.objects.all().delete()
+
+    def _job(self, title, skills):
+        return JobPost.objects.create(employer=self.employer, title=title, skills=skills,
+                                      budget_min=100, budget_max=200)
+
+    def _items(self):
+        return [pk for pk, _ in RecommendationSet.objects.get(user=self.seeker).items]
+
+    def _process(self):
+        call_command("process_recommendation_updates", stdout=StringIO())
+
+    def test_new_job_post_is_queued_not_computed_in_request(self):
+        with patch.object(recommendations, "add_job_post") as add_job_post, \
+                self.captureOnCommitCallbacks(execute=True):
+            job = self._job("Senior Python developer", ["Python"])
+        add_job_post.assert_not_called()
+        self.assertTrue(PendingRecommendationJob.objects.filter(job_post=job).exists())
+        self.assertNotIn(job.pk, self._items())
+
+        self._process()
+        self.assertIn(job.pk, self._items())
+        self.assertFalse(PendingRecommendationJob.objects.exists())
+
+    def test_profile_change_marks_set_stale(self):
+        django_job = self._job("Django developer", ["Django"])
+        PendingRecommendationJob.objects.all().delete()
+        with patch.object(recommendations, "recompute_users") as recompute, \
+                self.captureOnCommitCallbacks(execute=True):
+            Skill.objects.create(user=self.seeker, name="Django")
+        recompute.assert_not_called()
+        self.assertTrue(RecommendationSet.objects.get(user=self.seeker).is_stale)
+
+        self._process()
+        self.assertFalse(RecommendationSet.objects.get(user=self.seeker).is_stale)
+        self.assertIn(django_job.pk, self._items())
+        self.assertIn(self.python_job.pk, self._items())
+
+    def test_save_of_unindexed_fields_keeps_job_index(self):
+        version = recommendations._index["version"]
+        self.python_job.save(update_fields=["description"])
+        self.assertEqual(recommendations._index["version"], version)
+        self.python_job.save(update_fields=["budget_max"])
+        self.assertEqual(recommendations._index["version"], version + 1)
+
+
+
+class JobPostExportTests(APITestCase):
+    url = "/api/vacancies/jobposts/export/"
+
+    def setUp(self):
+        self.employer = CustomUser.objects.create_user(
+            username="employer", email="employer@example.com", password="x", role="EMPLOYER"
+        )
+        self.client.force_authenticate(self.employer)
+        JobPost.objects.create(employer=self.employer, title='=HYPERLINK("http://x","y")',
+                               description="\t=1+1", location="@SUM(A1)", skills=["-python"],
+                               budget_min=-100, budget_max=200)
+
+    def _export(self, fmt):
+        response = self.client.get(self.url, {"file_format": fmt, "mine": 1})
+        self.assertEqual(response.status_code, 200)
+        return b"".join(response.streaming_content).decode()
+
+    def test_csv_neutralizes_formula_prefixes(self):
+        row = next(csv.DictReader(StringIO(self._export("csv"))))
+        self.assertEqual(row["title"], '\'=HYPERLINK("http://x","y")')
+        self.assertEqual(row["description"], "'\t=1+1")
+        self.assertEqual(row["location"], "'@SUM(A1)")
+        self.assertEqual(row["skills"], "'-python")
+        self.assertEqual(row["budget_min"], "-100.00")
+
+    def test_ndjson_keeps_raw_values(self):
+        record = json.loads(self._export("ndjson").splitlines()[0])
+        self.assertEqual(record["title"], '=HYPERLINK("http://x","y")')
+
+
+class JobPostFingerprintTests(APITestCase):
+    description = "Django REST framework, PostgreSQL va Celery bilan backend xizmatlarini ishlab chiqish"
+
+    def setUp(self):
+        self.employer = CustomUser.objects.create_user(
+            username="employer", email="employer@example.com", password="x", role="EMPLOYER"
+        )
+        self.original = JobPost.objects.create(employer=self.employer, title="Python developer",
+                                               description=self.description, skills=["Python"])
+        self.post = JobPost.objects.create(employer=self.employer, title="Frontend developer",
+                                           description="React va TypeScript", skills=["React"])
+
+    def test_save_without_text_change_skips_fingerprint(self):
+        with patch.object(dedup, "index_jobposts", wraps=dedup.index_jobposts) as index:
+            self.post.budget_max = 500
+            self.post.save()
+            self.post.is_filled = True
+            self.post.save(update_fields=["is_filled"])
+        index.assert_not_called()
+
+    def test_text_change_refreshes_duplicate_of(self):
+        self.post.title, self.post.description, self.post.skills = "Python developer", self.description, ["Python"]
+        self.post.save()
+        self.post.refresh_from_db()
+        self.assertEqual(self.post.duplicate_of_id, self.original.pk)
+
+
+class JobPostBulkImportTests(APITestCase):
+    url = "/api/vacancies/jobposts/import/"
+    description = "Django REST framework, PostgreSQL va Celery bilan backend xizmatlarini ishlab chiqish"
+
+    def setUp(self):
+        self.employer = CustomUser.objects.create_user(
+            username="employer", email="employer@example.com", password="x", role="EMPLOYER"
+        )
+        self.client.force_authenticate(self.employer)
+        self.existing = JobPost.objects.create(employer=self.employer, title="Python developer",
+                                               description=self.description, skills=["Python"])
+        PendingRecommendationJob.objects.all().delete()
+
+    def _import(self, rows, **params):
+        body = "\n".join(json.dumps(row) for row in rows)
+        query = "".join(f"&{key}={value}" for key, value in params.items())
+        return self.client.post(f"{self.url}?file_format=ndjson{query}", body,
+                                content_type="application/x-ndjson").json()
+
+    def _rows(self):
+        return [
+            {"title": "Python developer", "description": self.description, "skills": ["Python"]},
+            {"title": "Frontend developer", "description": "React, TypeScript va Next.js bilan SPA yozish",
+             "skills": ["React"]},
+            {"title": "Frontend developer", "description": "React, TypeScript va Next.js bilan SPA yozish",
+             "skills": ["React"]},
+        ]
+
+    def test_duplicates_are_reported_as_errors(self):
+        report = self._import(self._rows())
+
+        self.assertEqual((report["created"], report["failed"]), (1, 2))
+        errors = {error["row"]: error["errors"] for error in report["errors"]}
+        self.assertEqual(errors[1]["duplicate_of"], self.existing.pk)
+        self.assertEqual(errors[3]["duplicate_of_row"], 2)
+        created = JobPost.objects.exclude(pk=self.existing.pk).get()
+        self.assertEqual(created.title, "Frontend developer")
+        self.assertEqual(list(PendingRecommendationJob.objects.values_list("job_post_id", flat=True)),
+                         [created.pk])
+
+    def test_allow_duplicate_saves_and_flags(self):
+        report = self._import(self._rows(), allow_duplicate=1)
+
+        self.assertEqual((report["created"], report["failed"]), (3, 0))
+        self.assertEqual(JobPost.objects.filter(duplicate_of=self.existing).count(), 1)
+        self.assertEqual(PendingRecommendationJob.objects.count(), 3)
+
+
+@override_settings(CACHES={"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+                                       "LOCATION": "view-counter-tests"}})
+class JobPostViewCountTests(APITestCase):
+    def setUp(self):
+        employer = CustomUser.objects.create_user(
+            username="employer", email="employer@example.com", password="x", role="EMPLOYER"
+        )
+        self.post = JobPost.objects.create(employer=employer, title="Python developer",
+                                           budget_min=100, budget_max=200)
+        view_counters._pending.clear()
+        patcher = patch.object(view_counters, "_ensure_flusher")  # fon oqimi testda yozmasin
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(view_counters._pending.clear)
+
+    def _views(self, pk):
+        return view_counters.pending_views("vacancies.JobPost", pk)
+
+    def test_successful_and_cached_retrieves_are_counted(self):
+        url = f"/api/vacancies/jobposts/{self.post.pk}/"
+        self.assertEqual(self.client.get(url).status_code, 200)
+        response = self.client.get(url)
+        self.assertEqual(response["X-Cache"], "HIT")
+        self.assertEqual(self._views(self.post.pk), 2)
+
+    def test_failed_retrieves_are_not_counted(self):
+        missing = self.post.pk + 1000
+        self.assertEqual(self.client.get(f"/api/vacancies/jobposts/{missing}/").status_code, 404)
+        response = self.client.get(f"/api/vacancies/jobposts/{self.post.pk}/", HTTP_AUTHORIZATION="Bearer bad")
+        self.assertEqual(response.status_code, 401)
+        self.assertEqual(self._views(missing), 0)
+        self.assertEqual(self._views(self.post.pk), 0)
+
+
+
+class JobPostLifecycleTests(APITestCase):
+    def setUp(self):
+        self.employer = CustomUser.objects.create_user(
+            username="employer", email="employer@example.com", password="x", role="EMPLOYER"
+        )
+        today = timezone.localdate()
+        self.tomorrow = today + timedelta(days=1)
+        self.due_today = self._job(deadline=today)
+        self.later = self._job(deadline=today + timedelta(days=30))
+        self.no_deadline = self._job()
+        self.filled = self._job()
+        # to'g'ridan-to'g'ri UPDATE (pre_save'siz) — ochiq, lekin to'ldirilgan
+        JobPost.objects.filter(pk=self.filled.pk).update(is_filled=True)
+
+    def _job(self, **fields):
+        return JobPost.objects.create(employer=self.employer, title="Vacancy", **fields)
+
+    def test_close_expired_closes_filled_and_past_deadline(self):
+        self.assertEqual(close_expired(today=self.tomorrow), 2)
+        closed = set(JobPost.objects.filter(is_closed=True).values_list("pk", flat=True))
+        self.assertEqual(closed, {self.due_today.pk, self.filled.pk})
+
+    def test_each_branch_reads_its_partial_index(self):
+        if connection.vendor != "sqlite":
+            self.skipTest("EXPLAIN QUERY PLAN — SQLite")
+        with CaptureQueriesContext(connection) as ctx:
+            close_expired(today=self.tomorrow)
+        plans = []
+        with connection.cursor() as cursor:
+            for query in ctx.captured_queries:
+                if query["sql"].startswith("SELECT") and "vacancies_jobpost" in query["sql"].split("WHERE")[0]:
+                    cursor.execute("EXPLAIN QUERY PLAN " + query["sql"])
+                    plans.append(" ".join(row[3] for row in cursor.fetchall()))
+        self.assertTrue(any("jobpost_open_filled_idx" in plan for plan in plans), plans)
+        self.assertTrue(any("jobpost_open_deadline_idx" in plan for plan in plans), plans)
@@ -0,0 +1,87 @@
+# vacancies/trending.py
+"""
+"Trending" ball: arizalar, baholar va ko'rishlar eksponensial so'nish bilan.
+
+    ball(t) = sum(w_i * exp(-(t - t_i) / TAU))
+
+Skanersiz, inkremental yangilash uchun ball EPOCH'ga nisbatan saqlanadi:
+
+    trending_score = sum(w_i * exp((t_i - EPOCH) / TAU))
+
+Har bir hodisa bitta `UPDATE ... SET trending_score = trending_score + w * boost(t)`.
+Hozirgi ball = trending_score / boost(now) — ko'paytuvchi hamma postlar uchun bir xil,
+shuning uchun ORDER BY trending_score DESC (indeks bilan) aynan hozirgi trending tartibi.
+
+boost() EPOCH'dan ~8 yil keyin float chegarasiga yetadi — undan oldin EPOCH surilib,
+`rebuild_trending_scores` ishga tushiriladi.
+"""
+import math
+from datetime import datetime, timedelta, timezone as dt_timezone
+
+from django.db.models import F
+from django.utils import timezone
+
+HALF_LIFE = timedelta(hours=72)
+TAU = HALF_LIFE.total_seconds() / math.log(2)
+EPOCH = datetime(2025, 1, 1, tzinfo=dt_timezone.utc)
+
+# hodisa og'irliklari
+APPLICATION_WEIGHT = 10.0
+RATING_WEIGHT = 2.0  # har bir yulduz uchun
+VIEW_WEIGHT = 1.0
+
+
+def boost(at=None):
+    return math.exp(((at or timezone.now()) - EPOCH).total_seconds() / TAU)
+
+
+def increment(weight, at=None):
+    return F("trending_score") + weight * boost(at)
+
+
+def current_score(stored, now=None):
+    """Saqlangan qiymat -> hozirgi (so'ngan) ball."""
+    return stored / boost(now)
+
+
+def record(job_post_id, weight, at=None):
+    from .models import JobPost
+
+    if weight:
+        JobPost.objects.filter(pk=job_post_id).update(trending_score=increment(weight, at))
+
+
+def record_application(job_post_id, at=None):
+    record(job_post_id, APPLICATION_WEIGHT, at)
+
+
+def record_rating(job_post_id, stars_delta):
+    # qayta baholashda faqat farq (manfiy bo'lishi ham mumkin)
+    record(job_post_id, RATING_WEIGHT * stars_delta)
+
+
+def view_updates(delta):
+    """view_counters.flush() UPDATE'iga qo'shiladigan maydon — ko'rishlar bilan bitta so'rovda."""
+    return {"trending_score": increment(VIEW_WEIGHT * delta)}
+
+
+def rebuild(ids):
+    """
+    Berilgan postlar uchun ballni hodisalardan qayta hisoblaydi (backfill).
+    Arizalar o'z vaqti bilan; baho va ko'rishlarning vaqti saqlanmagan — post yaratilgan vaqt olinadi.
+    """
+    from applications.models import JobApplication
+    from .models import JobPost
+
+    posts = list(JobPost.objects.filter(pk__in=ids).only("id", "created_at", "rating_sum", "views_count"))
+    scores = {post.pk: (RATING_WEIGHT * post.rating_sum + VIEW_WEIGHT * post.views_count) * boost(post.created_at)
+              for post in posts}
+    for job_post_id, created_at in (JobApplication.objects
+                                    .filter(job_post_id__in=ids)
+                                    .values_list("job_post_id", "created_at")
+                                    .iterator()):
+        scores[job_post_id] += APPLICATION_WEIGHT * boost(created_at)
+    for post in posts:
+        post.trending_score = scores[post.pk]
+    JobPost.objects.bulk_update(posts, ["trending_score"])
+    return len(posts)
@@ -1,12 +1,26 @@
+from django.db import transaction
 from django.db.models import Q
+from django.http import StreamingHttpResponse
 from django.shortcuts import get_object_or_404
 from rest_framework import viewsets, permissions
 from rest_framework.decorators import action
+from rest_framework.exceptions import PermissionDenied
 from rest_framework.response import Response
 
+from accounts.geo import MAX_DISTANCE_KM, k_nearest, within_radius
+from accounts.models import CustomUser, Role
+from accounts.serializers import UserPublicSerializer
+from headhunter_backend.response_cache import COMPANIES, JOBPOSTS, ResponseCacheMixin
+from headhunter_backend.view_counters import ViewCountMixin
+
+from . import bulk, trending
+from .dedup import find_duplicate
+from .facets import cached_facets
 from .filters import JobPostFilter
 from .models import JobPost, JobPostRating
-from .serializers import JobPostSerializer
+from .pagination import JobPostPagination
+from .recommendations import get_recommendations
+from .serializers import JobPostSerializer, jobpost_columns, parse_sparse_fields
 from rest_framework.pagination import PageNumberPagination
 
 from django_filters.rest_framework import DjangoFilterBackend
@@ -17,20 +31,148 @@ from rest_framework import status
 class TenPerPagePagination(PageNumberPagination):
     page_size = 10
 
-class JobPostViewSet(viewsets.ModelViewSet):
+
+DEFAULT_RADIUS_KM = 25
+MAX_NEAREST_K = 100
+
+
+def parse_geo_params(request, fallback=None):
+    """
+    ?lat=&lon= (bo'lmasa fallback obyekt koordinatalari), ?radius_km= yoki ?k=.
+    (lat, lon, radius_km, k) yoki xato matnini qaytaradi.
+    """
+    params = request.query_params
+    try:
+        if params.get("lat") is not None and params.get("lon") is not None:
+            lat, lon = float(params["lat"]), float(params["lon"])
+        elif fallback is not None and fallback.latitude is not None and fallback.longitude is not None:
+            lat, lon = float(fallback.latitude), float(fallback.longitude)
+        else:
+            return None, "Koordinatalar topilmadi (lat/lon yuboring yoki joylashuvni saqlang)"
+        radius_km = min(float(params.get("radius_km", DEFAULT_RADIUS_KM)), MAX_DISTANCE_KM)
+        k = min(int(params["k"]), MAX_NEAREST_K) if params.get("k") else None
+    except (TypeError, ValueError):
+        return None, "lat, lon, radius_km va k son bo'lishi kerak"
+    if not (-90 <= lat <= 90 and -180 <= lon <= 180) or radius_km <= 0 or (k is not None and k <= 0):
+        return None, "Koordinatalar yoki radius noto'g'ri"
+    return (lat, lon, radius_km, k), None
+
+class JobPostViewSet(ViewCountMixin, ResponseCacheMixin, viewsets.ModelViewSet):
+    view_count_model = "vacancies.JobPost"
+    # anonim GET'lar keshlanadi (response_cache.py), yozuvlar signallar orqali invalidatsiya qiladi
+    cache_scope = "jobposts"
+    cache_tags = (JOBPOSTS, COMPANIES)
+    cache_actions = ("list", "retrieve", "nearby", "facets")
+
     queryset = JobPost.objects.all().order_by("-created_at")
     serializer_class = JobPostSerializer
     permission_classes = [permissions.AllowAny]
     filter_backends = [DjangoFilterBackend, filters.SearchFilter]
     filterset_class = JobPostFilter
     search_fields = ['title']
+    pagination_class = JobPostPagination
+
+    # ?fields= / ?expand= faqat o'qish action'larida (yozishda to'liq obyekt kerak)
+    sparse_actions = ("list", "retrieve", "nearby", "recommended")
 
     def get_queryset(self):
-        return JobPost.objects.filter(budget_min__isnull=False, budget_max__isnull=False).order_by("-created_at")
+        qs = JobPost.objects.filter(budget_min__isnull=False, budget_max__isnull=False).order_by("-created_at")
+        # ro'yxatlar faqat ochiq vakansiyalar (?include_closed=1 — hammasi); detail yopiqni ham beradi
+        if not getattr(self, "detail", False) and self.request.query_params.get("include_closed") not in ("1", "true"):
+            qs = qs.filter(is_closed=False)
+        # ?ordering=trending — saqlangan so'nuvchi ball bo'yicha (trending.py, indeksli)
+        if self.action == "list" and self.request.query_params.get("ordering") == "trending":
+            qs = qs.order_by("-trending_score", "-id")
+        fields, expand = self._sparse_fields()
+        if fields is not None or expand is not None:
+            qs = qs.only(*jobpost_columns(fields, expand))
+        return qs
+
+    def _sparse_fields(self):
+        if getattr(self, "action", None) not in self.sparse_actions:
+            return None, None
+        if not hasattr(self, "_sparse_fields_cache"):
+            self._sparse_fields_cache = parse_sparse_fields(self.request.query_params)
+        return self._sparse_fields_cache
+
+    def get_serializer_context(self):
+        context = super().get_serializer_context()
+        context["fields"], context["expand"] = self._sparse_fields()
+        return context
+
+    def list(self, request, *args, **kwargs):
+        response = super().list(request, *args, **kwargs)
+        # ?facets=1 — natijalar bilan birga facet sonlari (alohida so'rovsiz)
+        if request.query_params.get("facets") in ("1", "true") and isinstance(response.data, dict):
+            response.data["facets"] = cached_facets(lambda: self.filter_queryset(self.get_queryset()),
+                                                    request.query_params)
+        return response
+
+    @action(detail=False, methods=['get'], url_path='facets')
+    def facets(self, request):
+        """
+        GET /api/vacancies/jobposts/facets/?<JobPostFilter parametrlari>
+        location / plan / is_remote / is_fixed_price / byudjet oralig'i bo'yicha sonlar.
+        """
+        return Response(cached_facets(lambda: self.filter_queryset(self.get_queryset()), request.query_params))
+
+    def create(self, request, *args, **kwargs):
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        # shu employer'ning deyarli bir xil vakansiyasi bo'lsa — 409 (?allow_duplicate=1 — saqlanadi, belgilanadi)
+        if request.query_params.get("allow_duplicate") not in ("1", "true"):
+            match = find_duplicate(JobPost(employer=request.user, **serializer.validated_data))
+            if match:
+                return Response({
+                    "detail": "Bu vakansiya avvalgi vakansiyangizga juda o'xshash",
+                    "duplicate_of": match[0],
+                    "similarity": round(match[1], 2),
+                }, status=status.HTTP_409_CONFLICT)
+        self.perform_create(serializer)
+        headers = self.get_success_headers(serializer.data)
+        return Response(serializer.data, status=status.HTTP_201_CREATED, headers=headers)
 
     def perform_create(self, serializer):
         serializer.save(employer=self.request.user)
 
+    @action(detail=False, methods=['post'], url_path='import',
+            permission_classes=[permissions.IsAuthenticated])
+    def bulk_import(self, request):
+        """
+        POST /api/vacancies/jobposts/import/?file_format=ndjson|csv   (body — fayl matni)
+        Content-Type: text/csv bo'lsa format avtomatik csv. Javob: created / failed / errors[row].
+        Dublikat qatorlar xato sifatida qaytadi (?allow_duplicate=1 — saqlanadi, belgilanadi).
+        """
+        fmt = request.query_params.get("file_format")
+        if not fmt:
+            fmt = "csv" if request.content_type.startswith("text/csv") else "ndjson"
+        if fmt not in bulk.FORMATS:
+            return Response({"detail": f"file_format: {', '.join(bulk.FORMATS)}"}, status=400)
+        if request.stream is None:
+            return Response({"detail": "Bo'sh so'rov"}, status=400)
+
+        allow_duplicates = request.query_params.get("allow_duplicate") in ("1", "true")
+        report = bulk.import_jobposts(request.stream, fmt, request.user, allow_duplicates=allow_duplicates)
+        return Response(report.as_dict(), status=200)
+
+    @action(detail=False, methods=['get'], url_path='export',
+            permission_classes=[permissions.IsAuthenticated])
+    def export(self, request):
+        """
+        GET /api/vacancies/jobposts/export/?file_format=ndjson|csv&mine=1  (+ JobPostFilter parametrlari)
+        Javob oqim bilan yuboriladi — butun ro'yxat xotiraga yuklanmaydi.
+        """
+        fmt = request.query_params.get("file_format", "ndjson")
+        if fmt not in bulk.FORMATS:
+            return Response({"detail": f"file_format: {', '.join(bulk.FORMATS)}"}, status=400)
+        queryset = self.filter_queryset(self.get_queryset())
+        if request.query_params.get("mine") == "1":
+            queryset = queryset.filter(employer=request.user)
+
+        response = StreamingHttpResponse(bulk.export_rows(queryset, fmt), content_type=bulk.CONTENT_TYPES[fmt])
+        response["Content-Disposition"] = f'attachment; filename="jobposts.{fmt}"'
+        return response
+
     @action(detail=True, methods=['post'], url_path='rate')
     def rate(self, request, pk=None):
         job_post = self.get_object()
@@ -38,9 +180,115 @@ class JobPostViewSet(viewsets.ModelViewSet):
         if stars < 1 or stars > 5:
             return Response({"detail": "Stars 1 dan 5 gacha bo‘lishi kerak"}, status=400)
 
-        rating, created = JobPostRating.objects.update_or_create(
-            job_post=job_post,
-            user=request.user,
-            defaults={"stars": stars}
-        )
-        return Response({"detail": "Baholangandi ✅"}, status=200)
+        with transaction.atomic():
+            previous = (JobPostRating.objects
+                        .select_for_update()
+                        .filter(job_post=job_post, user=request.user)
+                        .values_list("stars", flat=True)
+                        .first())
+            rating, created = JobPostRating.objects.update_or_create(
+                job_post=job_post,
+                user=request.user,
+                defaults={"stars": stars}
+            )
+            if created:
+                JobPost.apply_rating_delta(job_post.pk, stars, 1)
+                trending.record_rating(job_post.pk, stars)
+            elif previous is not None:
+                # qayta baholash: faqat farqni qo'shamiz, count o'zgarmaydi
+                JobPost.apply_rating_delta(job_post.pk, stars - previous, 0)
+                trending.record_rating(job_post.pk, stars - previous)
+            else:
+                # parallel so'rov rating'ni bizdan oldin yaratib qo'ygan — eski qiymat noma'lum
+                JobPost.rebuild_rating_aggregates([job_post.pk])
+
+        job_post.refresh_from_db(fields=["rating_sum", "rating_count", "rating_avg"])
+        return Response({
+            "detail": "Baholangandi ✅",
+            "average_stars": job_post.average_stars,
+            "ratings_count": job_post.rating_count,
+        }, status=200)
+
+    def _geo_search(self, queryset, point):
+        lat, lon, radius_km, k = point
+        if k:
+            return k_nearest(queryset, lat, lon, k)
+        return within_radius(queryset, lat, lon, radius_km)
+
+    @action(detail=False, methods=['get'], url_path='nearby')
+    def nearby(self, request):
+        """
+        GET /api/vacancies/jobposts/nearby/?radius_km=25   (yoki ?k=10 — eng yaqin k ta)
+        lat/lon berilmasa — joriy foydalanuvchining saqlangan joylashuvi. JobPostFilter ham ishlaydi.
+        """
+        user = request.user if request.user.is_authenticated else None
+        point, error = parse_geo_params(request, fallback=user)
+        if error:
+            return Response({"detail": error}, status=400)
+
+        queryset = self.filter_queryset(self.get_queryset()).filter(geohash__isnull=False)
+        found = self._geo_search(queryset, point)
+        page = self.paginate_queryset(found)
+        rows = page if page is not None else found
+
+        posts = JobPost.objects.in_bulk([pk for pk, _ in rows])
+        ordered = [posts[pk] for pk, _ in rows if pk in posts]
+        data = self.get_serializer(ordered, many=True).data
+        for item, (_, distance) in zip(data, rows):
+            item["distance_km"] = distance
+        if page is not None:
+            return self.get_paginated_response(data)
+        return Response(data)
+
+    @action(detail=False, methods=['get'], url_path='recommended',
+            permission_classes=[permissions.IsAuthenticated])
+    def recommended(self, request):
+        """
+        GET /api/vacancies/jobposts/recommended/
+        JOB_SEEKER uchun shaxsiy lenta: oldindan hisoblangan top-N (recommendations.py), keshdan.
+        """
+        if request.user.role != Role.JOB_SEEKER:
+            raise PermissionDenied("Tavsiyalar faqat JOB_SEEKER uchun.")
+
+        items = get_recommendations(request.user)
+        page = self.paginate_queryset(items)
+        rows = page if page is not None else items
+
+        posts = self.get_queryset().filter(is_closed=False).in_bulk([pk for pk, _ in rows])
+        rows = [(posts[pk], score) for pk, score in rows if pk in posts]
+        data = self.get_serializer([post for post, _ in rows], many=True).data
+        for item, (_, score) in zip(data, rows):
+            item["recommendation_score"] = score
+        if page is not None:
+            return self.get_paginated_response(data)
+        return Response(data)
+
+    @action(detail=True, methods=['get'], url_path='nearby-candidates',
+            permission_classes=[permissions.IsAuthenticated])
+    def nearby_candidates(self, request, pk=None):
+        """
+        GET /api/vacancies/jobposts/<id>/nearby-candidates/?radius_km=25  (yoki ?k=20)
+        Faqat vakansiya egasi uchun: yaqin atrofdagi JOB_SEEKER'lar masofa bilan.
+        """
+        job_post = self.get_object()
+        if job_post.employer_id != request.user.id:
+            raise PermissionDenied("Bu vakansiya sizga tegishli emas.")
+        point, error = parse_geo_params(request, fallback=job_post)
+        if error:
+            return Response({"detail": error}, status=400)
+
+        queryset = CustomUser.objects.filter(role=Role.JOB_SEEKER, geohash__isnull=False)
+        found = self._geo_search(queryset, point)
+        page = self.paginate_queryset(found)
+        rows = page if page is not None else found
+
+        users = CustomUser.objects.in_bulk([user_id for user_id, _ in rows])
+        data = []
+        for user_id, distance in rows:
+            if user_id in users:
+                item = UserPublicSerializer(users[user_id], context={"request": request}).data
+                item["distance_km"] = distance
+                data.append(item)
+        if page is not None:
+            return self.get_paginated_response(data)
+        return Response(data)